@@ -0,0 +1 @@
+"""Benchmarks for yr_weather, run with ``python -m benchmarks.<name>``."""
@@ -0,0 +1,100 @@
+"""Benchmarks for decoding API responses.
+
+Compares decoding a complete forecast in full with :func:`json.loads` against
+:func:`yr_weather.decoding.decode_forecast` with ``max_steps``, measuring the number of
+characters read, the memory allocated for the decoded data and the wall time.
+
+Then compares the decode time of every JSON product with each available JSON backend
+(see :data:`yr_weather.decoding.JSON_BACKENDS`), the stdlib :mod:`json` module being the baseline.
+
+Run from the repository root::
+
+    python -m benchmarks.decoding
+"""
+
+import json
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Dict, Optional
+
+from yr_weather.decoding import JSON_BACKENDS, _decode_forecast
+
+FIXTURES = Path(__file__).parent / "fixtures"
+REPEAT = 200
+JSON_PRODUCTS = [
+    "locationforecast_complete",
+    "locationforecast_compact",
+    "sunrise_sun",
+    "sunrise_moon",
+    "radar_status",
+    "radar_radaroptions",
+]
+
+
+def _decode(text: str, max_steps: Optional[int]) -> int:
+    """Decode the document, returning the number of characters read."""
+    if max_steps is None:
+        json.loads(text)
+        return len(text)
+
+    return _decode_forecast(text, max_steps)[1]
+
+
+def measure(text: str, max_steps: Optional[int]) -> tuple:
+    """Return the characters read, the bytes allocated and the time per decode in milliseconds."""
+    tracemalloc.start()
+    read = _decode(text, max_steps)
+    allocated = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    seconds = timeit.timeit(lambda: _decode(text, max_steps), number=REPEAT)
+
+    return read, allocated, seconds / REPEAT * 1000
+
+
+def measure_backends(body: bytes) -> Dict[str, float]:
+    """Return the time per decode of a response body in milliseconds, by JSON backend.
+
+    Bodies are decoded from bytes, as they are received by the clients.
+    """
+    results = {}
+    for name, loads in JSON_BACKENDS.items():
+        number, _ = timeit.Timer(lambda: loads(body)).autorange()
+        seconds = min(timeit.repeat(lambda: loads(body), number=number, repeat=5))
+        results[name] = seconds / number * 1000
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    text = (FIXTURES / "locationforecast_complete.json").read_text(encoding="utf-8")
+
+    print(f"Document: {len(text)} characters")
+    print(f"{'decode':<16}{'read':>10}{'allocated':>12}{'time':>10}")
+    for max_steps in (None, 1, 24):
+        name = "json.loads" if max_steps is None else f"max_steps={max_steps}"
+        read, allocated, millis = measure(text, max_steps)
+        print(f"{name:<16}{read:>10}{allocated:>12}{millis:>8.3f}ms")
+
+    print()
+    print("JSON decode time with json, and the speedup of every other backend")
+    print(f"{'product':<28}" + "".join(f"{name:>12}" for name in JSON_BACKENDS))
+    for product in JSON_PRODUCTS:
+        times = measure_backends((FIXTURES / f"{product}.json").read_bytes())
+        baseline = times["json"]
+        print(
+            f"{product:<28}"
+            + "".join(
+                (
+                    f"{millis:>8.3f}ms"
+                    if name == "json"
+                    else f"{baseline / millis:>11.1f}x"
+                )
+                for name, millis in times.items()
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
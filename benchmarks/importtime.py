@@ -0,0 +1,99 @@
+"""Benchmarks for the time it takes to import yr_weather.
+
+Every statement is run in a new interpreter with ``python -X importtime``, whose report of
+the time spent importing every module is parsed. Importing ``yr_weather`` itself should be close to free:
+the clients, and the dependencies of their products, are only imported once they're used.
+
+Run from the repository root::
+
+    python -m benchmarks.importtime
+"""
+
+import subprocess
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, NamedTuple
+
+ROOT = Path(__file__).parent.parent
+STATEMENTS = [
+    "import yr_weather",
+    "from yr_weather import Sunrise",
+    "from yr_weather import Locationforecast",
+    "from yr_weather import Textforecast",
+    "from yr_weather import MetClient",
+]
+TOP = 5
+
+
+class ImportTime(NamedTuple):
+    """The time spent importing a module, in microseconds."""
+
+    self_us: int
+    """The time spent in the module itself."""
+    cumulative_us: int
+    """The time including the modules it imported."""
+
+
+def parse(report: str) -> Dict[str, ImportTime]:
+    """Parse the output of ``python -X importtime`` into the import time of every module, by name."""
+    times = {}
+    for line in report.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        # The header line has no numbers
+        if not self_us.strip().isdigit():
+            continue
+
+        times[name.strip()] = ImportTime(int(self_us), int(cumulative_us))
+    return times
+
+
+def _run(statement: str) -> Dict[str, ImportTime]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse(result.stderr)
+
+
+@lru_cache(maxsize=None)
+def _baseline() -> FrozenSet[str]:
+    """The modules imported by every interpreter on startup."""
+    return frozenset(_run("pass"))
+
+
+def measure(statement: str) -> Dict[str, ImportTime]:
+    """Run a statement in a new interpreter, returning the import time of every module it imported.
+
+    Modules imported by every interpreter on startup aren't included.
+    """
+    baseline = _baseline()
+    return {
+        name: time for name, time in _run(statement).items() if name not in baseline
+    }
+
+
+def total_us(times: Dict[str, ImportTime]) -> int:
+    """The total time spent importing the modules, in microseconds."""
+    return sum(time.self_us for time in times.values())
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    for statement in STATEMENTS:
+        times = measure(statement)
+        print(f"{statement}: {total_us(times) / 1000:.1f}ms, {len(times)} modules")
+
+        slowest = sorted(times.items(), key=lambda item: item[1].cumulative_us)
+        for name, time in reversed(slowest[-TOP:]):
+            print(f"    {name:<40}{time.cumulative_us / 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
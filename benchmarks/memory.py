@@ -0,0 +1,64 @@
+"""Memory benchmark for ForecastTime materialization.
+
+Measures the memory allocated per step when creating a :class:`ForecastTime` for every step
+of a complete forecast, both when the objects are only created and when every attribute
+is accessed (which is what creating a ForecastTime cost before it became lazy).
+
+Run from the repository root::
+
+    python -m benchmarks.memory
+"""
+
+import json
+import tracemalloc
+from pathlib import Path
+
+from yr_weather.data.locationforecast import Forecast, ForecastTime
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _touch(forecast_time: ForecastTime) -> None:
+    """Access every attribute, which materializes all sub-objects."""
+    _ = forecast_time.details
+    for future in (
+        forecast_time.next_hour,
+        forecast_time.next_6_hours,
+        forecast_time.next_12_hours,
+    ):
+        _ = future.summary, future.details
+
+
+def measure(forecast: Forecast, materialize: bool) -> float:
+    """Return the number of bytes allocated per step."""
+    timeseries = forecast._timeseries  # pylint: disable=protected-access
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    times = [ForecastTime(data) for data in timeseries]
+    if materialize:
+        for forecast_time in times:
+            _touch(forecast_time)
+
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return (after - before) / len(times)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    with open(FIXTURES / "locationforecast_complete.json", encoding="utf-8") as file:
+        forecast = Forecast(json.load(file))
+
+    lazy = measure(forecast, materialize=False)
+    eager = measure(forecast, materialize=True)
+
+    print(f"Steps: {len(forecast._timeseries)}")  # pylint: disable=protected-access
+    print(f"Created, untouched:   {lazy:8.0f} bytes/step")
+    print(f"Fully materialized:   {eager:8.0f} bytes/step")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+"""Offline benchmark suite, using synthetic API responses.
+
+The responses in ``benchmarks/fixtures`` are written after the MET schemas, not recorded from the API
+(see ``fixtures/README.md``), so the results compare versions of yr_weather rather than measure real payloads.
+
+Times the parsing of every product's responses into yr_weather's data classes, and end-to-end
+client calls answered by a local stand-in transport instead of the network.
+The results are printed as JSON, so they can be stored and compared between releases.
+
+Run from the repository root::
+
+    python -m benchmarks.suite
+    python -m benchmarks.suite --output results.json --filter textforecast
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import timeit
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Tuple
+
+from requests import PreparedRequest
+
+import yr_weather
+from yr_weather.cache import ObjectCache
+from yr_weather.client import APIClient
+from yr_weather.data.locationforecast import Forecast, ForecastTime
+from yr_weather.data.sunrise import SunEvents, MoonEvents
+from yr_weather.data.textforecast import TextForecasts
+from yr_weather.radar import _parse_radar_global_status, _parse_radar_options
+from yr_weather.textforecast import (
+    _FORECAST_TYPES,
+    _AREA_TYPES,
+    _parse_xml,
+    _parse_areas,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from yr_weather.data.structs import decode_forecast_struct
+except ImportError:
+    decode_forecast_struct = None  # type: ignore[assignment]
+
+from .memory import _touch
+from .transport import StandInAdapter, read_fixture, serve_fixtures
+
+HEADERS = {
+    "User-Agent": "yr-weather-benchmarks https://github.com/ZeroWave022/yr-weather"
+}
+
+Case = Tuple[str, Callable[[], Any]]
+
+
+def _json(name: str) -> Any:
+    return json.loads(read_fixture(name))
+
+
+def _text(name: str) -> str:
+    return read_fixture(name).decode("utf-8")
+
+
+def _standin(client: APIClient) -> APIClient:
+    """Answer all requests of a client with the fixtures."""
+    client.session.mount("https://", StandInAdapter(serve_fixtures))
+    return client
+
+
+def _serve_fresh(request: PreparedRequest) -> Tuple[int, dict, bytes]:
+    """Answer with the fixtures, which don't expire."""
+    status, headers, body = serve_fixtures(request)
+    return status, {**headers, "Expires": "Fri, 01 Jan 2100 00:00:00 GMT"}, body
+
+
+def parsing_cases() -> List[Case]:
+    """Cases timing the conversion of decoded responses to data classes."""
+    cases: List[Case] = []
+
+    for forecast_type in ("complete", "compact"):
+        data = _json(f"locationforecast_{forecast_type}.json")
+        text = _text(f"locationforecast_{forecast_type}.json")
+        cases.append(
+            (f"locationforecast.parse.{forecast_type}", lambda d=data: Forecast(d))
+        )
+        cases.append(
+            (
+                f"locationforecast.decode_parse.{forecast_type}",
+                lambda t=text: Forecast(json.loads(t)),
+            )
+        )
+
+        if decode_forecast_struct is not None:
+            body = read_fixture(f"locationforecast_{forecast_type}.json")
+            cases.append(
+                (
+                    f"locationforecast.decode_struct.{forecast_type}",
+                    lambda b=body: decode_forecast_struct(b),
+                )
+            )
+
+    timeseries = _json("locationforecast_complete.json")["properties"]["timeseries"]
+
+    def materialize() -> None:
+        for data in timeseries:
+            _touch(ForecastTime(data))
+
+    cases.append(("locationforecast.materialize.complete", materialize))
+
+    complete = Forecast(_json("locationforecast_complete.json"))
+    start, end = datetime(2024, 1, 16, 6), datetime(2024, 1, 16, 18)
+    cases.append(
+        ("locationforecast.between.complete", lambda: complete.between(start, end))
+    )
+    cases.append(
+        (
+            "locationforecast.resample.complete",
+            lambda: complete.resample(timedelta(hours=3)),
+        )
+    )
+
+    if np is not None:
+        cases.append(
+            (
+                "locationforecast.daily_summary.complete",
+                lambda: complete.daily_summary("Europe/Oslo"),
+            )
+        )
+
+        frame = complete.to_frame()
+        etas = frame.time[0] + 90.0 * np.arange(1000)
+        cases.append(
+            (
+                "locationforecast.interpolate.1000_times",
+                lambda: frame.interpolate(etas),
+            )
+        )
+
+    sun, moon = _json("sunrise_sun.json"), _json("sunrise_moon.json")
+    cases.append(("sunrise.parse.sun", lambda: SunEvents(sun)))
+    cases.append(("sunrise.parse.moon", lambda: MoonEvents(moon)))
+
+    for forecast in _FORECAST_TYPES:
+        text = _text(f"textforecast_{forecast}.xml")
+        parsed = _parse_xml(text)
+        cases.append(
+            (
+                f"textforecast.parse.{forecast}",
+                lambda p=parsed, f=forecast: TextForecasts(p["textforecast"], f),
+            )
+        )
+        cases.append(
+            (
+                f"textforecast.decode_parse.{forecast}",
+                lambda t=text, f=forecast: TextForecasts(
+                    _parse_xml(t)["textforecast"], f
+                ),
+            )
+        )
+
+    for area_type in _AREA_TYPES:
+        text = _text(f"textforecast_areas_{area_type}.xml")
+        cases.append(
+            (
+                f"textforecast.decode_parse.areas_{area_type}",
+                lambda t=text: _parse_areas(_parse_xml(t)),
+            )
+        )
+
+    status = _json("radar_status.json")
+    options = _text("radar_radaroptions.json")
+    cases.append(("radar.parse.status", lambda: _parse_radar_global_status(status)))
+    # Parsing the options changes the dict, so it's decoded every time
+    cases.append(
+        (
+            "radar.decode_parse.radaroptions",
+            lambda: _parse_radar_options(json.loads(options)),
+        )
+    )
+
+    return cases
+
+
+def client_cases() -> List[Case]:
+    """Cases timing client calls end to end, with a stand-in transport."""
+    # The object cache would answer repeated calls without a request, so it's disabled
+    location = _standin(
+        yr_weather.Locationforecast(
+            HEADERS, use_cache=False, object_cache=ObjectCache(max_entries=0)
+        )
+    )
+    cached = yr_weather.Locationforecast(HEADERS, use_cache=False)
+    cached.session.mount("https://", StandInAdapter(_serve_fresh))
+    sunrise = _standin(yr_weather.Sunrise(HEADERS, use_cache=False))
+    text = _standin(yr_weather.Textforecast(HEADERS, use_cache=False))
+    radar = _standin(yr_weather.Radar(HEADERS, use_cache=False))
+
+    return [
+        (
+            "client.locationforecast.get_forecast",
+            lambda: location.get_forecast(59.91, 10.75),
+        ),
+        (
+            "client.locationforecast.get_forecast.compact",
+            lambda: location.get_forecast(59.91, 10.75, "compact"),
+        ),
+        (
+            "client.locationforecast.get_forecast.max_steps_24",
+            lambda: location.get_forecast(59.91, 10.75, max_steps=24),
+        ),
+        (
+            "client.locationforecast.get_forecast.object_cache_hit",
+            lambda: cached.get_forecast(59.91, 10.75),
+        ),
+        (
+            "client.locationforecast.get_air_temperature",
+            lambda: location.get_air_temperature(59.91, 10.75),
+        ),
+        (
+            "client.sunrise.get_sun_events",
+            lambda: sunrise.get_sun_events("2024-01-15", 59.91, 10.75),
+        ),
+        (
+            "client.sunrise.get_moon_events",
+            lambda: sunrise.get_moon_events("2024-01-15", 59.91, 10.75),
+        ),
+        ("client.textforecast.get_forecasts", lambda: text.get_forecasts("coast_en")),
+        ("client.textforecast.get_areas", lambda: text.get_areas("sea")),
+        ("client.radar.get_all_statuses", radar.get_all_statuses),
+        ("client.radar.get_available_radars", radar.get_available_radars),
+    ]
+
+
+def run_case(func: Callable[[], Any], repeat: int, min_time: float) -> Dict[str, Any]:
+    """Time a case, returning the number of calls and the time per call in microseconds."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    # autorange() targets 0.2 seconds per repetition
+    number = max(1, int(number * min_time / 0.2))
+
+    per_call = [t / number * 1e6 for t in timer.repeat(repeat=repeat, number=number)]
+
+    return {
+        "calls": number * repeat,
+        "min_us": round(min(per_call), 3),
+        "median_us": round(statistics.median(per_call), 3),
+    }
+
+
+def run(filters: List[str], repeat: int, min_time: float) -> Dict[str, Any]:
+    """Run all cases matching any of the filters, returning the results as a JSON-compatible dict."""
+    results: Dict[str, Any] = {}
+
+    for name, func in parsing_cases() + client_cases():
+        if filters and not any(part in name for part in filters):
+            continue
+        results[name] = run_case(func, repeat, min_time)
+
+    return {
+        "yr_weather": yr_weather.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Parse the command line arguments and run the suite."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument(
+        "--output", help="Write the results to this file instead of stdout."
+    )
+    parser.add_argument(
+        "--filter",
+        action="append",
+        default=[],
+        help="Only run cases with this in their name. Can be used multiple times.",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per case.")
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.1,
+        help="Approximate seconds per repetition.",
+    )
+    args = parser.parse_args()
+
+    report = json.dumps(run(args.filter, args.repeat, args.min_time), indent=2)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(report + "\n")
+    else:
+        sys.stdout.write(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
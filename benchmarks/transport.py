@@ -0,0 +1,83 @@
+"""A stand-in transport which answers requests locally, used by the benchmarks and offline tests."""
+
+import io
+import threading
+from pathlib import Path
+from typing import Callable, List, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3 import HTTPResponse
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+Handler = Callable[[PreparedRequest], Tuple[int, dict, bytes]]
+
+
+class StandInAdapter(BaseAdapter):
+    """A transport adapter answering requests locally instead of through the network.
+
+    ``handler`` receives every request and returns a (status code, headers, body) tuple.
+    """
+
+    def __init__(self, handler: Handler) -> None:
+        super().__init__()
+        self.handler = handler
+        self.requests: List[PreparedRequest] = []
+        self._lock = threading.Lock()
+
+    def send(
+        self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None
+    ) -> Response:
+        with self._lock:
+            self.requests.append(request)
+
+        status, headers, body = self.handler(request)
+        raw = HTTPResponse(
+            body=io.BytesIO(body),
+            headers=headers,
+            status=status,
+            preload_content=False,
+            decode_content=False,
+        )
+        return HTTPAdapter().build_response(request, raw)
+
+    def close(self) -> None:
+        pass
+
+
+def read_fixture(name: str) -> bytes:
+    """Read a synthetic API response from the fixtures directory (see ``fixtures/README.md``)."""
+    return (FIXTURES / name).read_bytes()
+
+
+def fixture_name(url: str) -> str:
+    """Get the name of the fixture answering a MET API request."""
+    parts = urlsplit(url)
+    product, _, endpoint = parts.path.split("/")[2:5]
+    query = parse_qs(parts.query)
+
+    if product == "locationforecast":
+        return f"locationforecast_{endpoint}.json"
+    if product == "sunrise":
+        return f"sunrise_{endpoint}.json"
+    if product == "radar":
+        return f"radar_{endpoint}.json"
+    if product == "textforecast" and endpoint == "areas":
+        return f"textforecast_areas_{query['type'][0]}.xml"
+    if product == "textforecast":
+        return f"textforecast_{query['forecast'][0]}.xml"
+
+    raise KeyError(f"No fixture for {url}")
+
+
+def serve_fixtures(request: PreparedRequest) -> Tuple[int, dict, bytes]:
+    """A handler answering every MET API request with its fixture."""
+    try:
+        name = fixture_name(str(request.url))
+    except KeyError:
+        return 404, {}, b"Not Found"
+
+    content_type = "application/xml" if name.endswith(".xml") else "application/json"
+    return 200, {"Content-Type": content_type}, read_fixture(name)
@@ -0,0 +1,24 @@
+"""Shared fixtures for offline tests."""
+
+import pytest
+
+from benchmarks.transport import StandInAdapter, Handler, read_fixture
+from yr_weather.client import APIClient
+
+
+@pytest.fixture(name="read_fixture", scope="session")
+def fixture_read_fixture():
+    """Read a synthetic API response from the fixtures directory."""
+    return read_fixture
+
+
+@pytest.fixture(name="standin")
+def fixture_standin():
+    """Mount a StandInAdapter with the given handler on a client's session."""
+
+    def mount(client: APIClient, handler: Handler) -> StandInAdapter:
+        adapter = StandInAdapter(handler)
+        client.session.mount("https://", adapter)
+        return adapter
+
+    return mount
@@ -0,0 +1,106 @@
+"""Tests for yr_weather.aio, using a local stand-in server"""
+
+import asyncio
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+# pylint: disable=wrong-import-position
+from aiohttp import web
+
+from yr_weather import Locationforecast
+from yr_weather.aio import AsyncLocationforecast
+from yr_weather.data.locationforecast import Forecast, ForecastTimeDetails
+
+HEADERS = {"User-Agent": "testing/latest https://github.com/ZeroWave022/yr-weather"}
+
+
+async def start_server(body: bytes):
+    """Start a local server answering forecast requests with ``body``, failing for lat=0."""
+    requests = []
+
+    async def handler(request: web.Request) -> web.Response:
+        requests.append(request)
+        if request.query["lat"] == "0":
+            return web.Response(status=500)
+        return web.Response(body=body, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/{forecast_type}", handler)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore
+    return runner, f"http://127.0.0.1:{port}/", requests
+
+
+def test_headers():
+    """Test that headers are required"""
+    with pytest.raises(ValueError, match="A custom 'User-Agent' is required"):
+        AsyncLocationforecast({})
+
+
+def test_forecast(read_fixture):
+    """Test fetching forecasts concurrently on one connection pool"""
+    body = read_fixture("locationforecast_complete.json")
+
+    async def run():
+        runner, base_url, requests = await start_server(body)
+
+        async with AsyncLocationforecast(HEADERS, pool_size=4) as client:
+            client._base_url = base_url
+
+            forecast = await client.get_forecast(59.91, 10.75)
+            details = await client.get_instant_data(59.91, 10.75, 100)
+
+            points = [(59.0 + i, 10.0) for i in range(20)] + [(0, 0)]
+            results = [result async for result in client.get_forecasts(points)]
+
+            session = client.session
+
+        await runner.cleanup()
+        return forecast, details, results, requests, session
+
+    forecast, details, results, requests, session = asyncio.run(run())
+
+    assert isinstance(forecast, Forecast)
+    assert isinstance(details, ForecastTimeDetails)
+    assert requests[1].query["altitude"] == "100"
+    assert requests[0].headers["User-Agent"] == HEADERS["User-Agent"]
+
+    assert len(results) == 21
+    failed = [result for result in results if not result.ok]
+    assert len(failed) == 1 and failed[0].point == (0, 0)
+    assert isinstance(failed[0].error, aiohttp.ClientResponseError)
+
+    assert session.closed
+
+
+def test_normalization(read_fixture):
+    """Test that coordinates are normalized like the synchronous client does"""
+    body = read_fixture("locationforecast_complete.json")
+    sync = Locationforecast(HEADERS, use_cache=False, grid_spacing=0.05)
+
+    async def run():
+        runner, base_url, requests = await start_server(body)
+
+        async with AsyncLocationforecast(HEADERS, grid_spacing=0.05) as client:
+            client._base_url = base_url
+            await client.get_forecast(59.912345678, 10.7523)
+            await client.get_air_temperature(59.912345678, 10.7523)
+
+        await runner.cleanup()
+        return requests
+
+    requests = asyncio.run(run())
+    lat, lon = sync.normalize_coordinates(59.912345678, 10.7523)
+
+    for request in requests:
+        assert request.query["lat"] == str(lat)
+        assert request.query["lon"] == str(lon)
+
+    with pytest.raises(ValueError, match="'precision' parameter must be"):
+        AsyncLocationforecast(HEADERS, precision=5)
@@ -0,0 +1,24 @@
+"""Tests that the offline benchmark suite runs against its synthetic fixtures"""
+
+import json
+import pytest
+
+from benchmarks import suite
+
+
+@pytest.mark.parametrize(
+    "case", suite.parsing_cases() + suite.client_cases(), ids=lambda case: case[0]
+)
+def test_case_runs(case):
+    """Test that every case runs without errors"""
+    _, func = case
+    func()
+
+
+def test_report():
+    """Test that the results are JSON-compatible"""
+    report = suite.run(["sunrise.parse"], repeat=1, min_time=0.001)
+
+    assert set(report["results"]) == {"sunrise.parse.sun", "sunrise.parse.moon"}
+    assert report["results"]["sunrise.parse.sun"]["min_us"] > 0
+    json.dumps(report)
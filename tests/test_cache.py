@@ -0,0 +1,266 @@
+"""Tests for yr_weather.cache"""
+
+from dataclasses import FrozenInstanceError
+from datetime import timedelta
+import pytest
+from requests_cache.backends import FileCache, SQLiteCache, SQLiteDict
+
+from benchmarks.transport import serve_fixtures
+from yr_weather import Textforecast
+from yr_weather.cache import CacheConfig, ObjectCache, _CacheEntry
+from yr_weather.client import APIClient, decode_json
+
+HEADERS = {"User-Agent": "testing/latest https://github.com/ZeroWave022/yr-weather"}
+
+URL = "https://api.met.no/weatherapi/locationforecast/2.0/complete?lat={}&lon=10"
+
+
+def serve(max_age: dict):
+    """A handler answering with 10 byte bodies, cached for ``max_age[lat]`` seconds (default 60)."""
+
+    def handler(request):
+        lat = request.url.split("lat=")[1].split("&")[0]
+        headers = {"Cache-Control": f"max-age={max_age.get(lat, 60)}"}
+        return (200, headers, b"0123456789")
+
+    return handler
+
+
+def cached_urls(client: APIClient):
+    """The URLs of all cached responses."""
+    return sorted(response.url for response in client.session.cache.responses.values())
+
+
+class TestCacheConfig:
+    """Test CacheConfig"""
+
+    def test_default(self):
+        """Test that the default is the sqlite cache used before"""
+        client = APIClient(use_cache=CacheConfig())
+
+        assert isinstance(client.session.cache, SQLiteCache)
+        assert str(client.session.cache.db_path).endswith("yr_cache.sqlite")
+
+    def test_location(self, tmp_path):
+        """Test custom cache locations"""
+        sqlite = APIClient(use_cache=CacheConfig(location=tmp_path / "cache"))
+        files = APIClient(
+            use_cache=CacheConfig(backend="filesystem", location=tmp_path / "files")
+        )
+
+        assert str(sqlite.session.cache.db_path) == str(tmp_path / "cache.sqlite")
+        assert isinstance(files.session.cache, FileCache)
+        assert files.session.cache.cache_dir == tmp_path / "files"
+
+    def test_params(self):
+        """Test invalid configurations"""
+        with pytest.raises(ValueError, match="'backend' argument must be one of"):
+            CacheConfig(backend="redis")
+
+        with pytest.raises(ValueError, match="'eviction' argument must be one of"):
+            CacheConfig(eviction="random")
+
+        with pytest.raises(ValueError, match="'max_bytes' parameter must be positive"):
+            CacheConfig(max_bytes=0)
+
+    def test_toggle(self):
+        """Test that the configuration is kept when the cache is toggled"""
+        client = APIClient(use_cache=CacheConfig(backend="memory"))
+        client.toggle_cache(False)
+        client.toggle_cache(True)
+
+        assert type(client.session.cache.responses).__name__ == "DictStorage"
+
+
+class TestBoundedCache:
+    """Test eviction and expiry overrides"""
+
+    def test_lru(self, standin):
+        """Test evicting the least recently used responses"""
+        client = APIClient(use_cache=CacheConfig(backend="memory", max_bytes=25))
+        adapter = standin(client, serve({}))
+
+        client._get(URL.format(1))
+        client._get(URL.format(2))
+        client._get(URL.format(1))  # From the cache, now most recently used
+        client._get(URL.format(3))
+
+        assert len(adapter.requests) == 3
+        assert cached_urls(client) == [URL.format(1), URL.format(3)]
+        assert client.session.cache.responses.total_bytes == 20
+
+    def test_expiry(self, standin):
+        """Test evicting the responses which expire first"""
+        config = CacheConfig(backend="memory", max_bytes=25, eviction="expiry")
+        client = APIClient(use_cache=config)
+        standin(client, serve({"1": 600, "2": 30, "3": 300}))
+
+        for lat in (1, 2, 3):
+            client._get(URL.format(lat))
+
+        assert cached_urls(client) == [URL.format(1), URL.format(3)]
+
+    def test_expire_after(self, standin):
+        """Test overriding expiry times by product"""
+        config = CacheConfig(
+            backend="memory",
+            expire_after={"locationforecast": 0, "sunrise": timedelta(hours=1)},
+        )
+        client = APIClient(use_cache=config)
+        adapter = standin(client, serve({}))
+
+        client._get(URL.format(1))
+        client._get(URL.format(1))
+        client._get("https://api.met.no/weatherapi/sunrise/3.0/sun?lat=1")
+        client._get("https://api.met.no/weatherapi/sunrise/3.0/sun?lat=1")
+
+        # Locationforecast responses expire immediately, sunrise responses are kept
+        assert len(adapter.requests) == 3
+
+    def test_persistent(self, standin, tmp_path):
+        """Test that responses stored earlier count towards the limit"""
+        config = CacheConfig(
+            backend="filesystem", location=tmp_path / "files", max_bytes=25
+        )
+        client = APIClient(use_cache=config)
+        standin(client, serve({}))
+        client._get(URL.format(1))
+        client._get(URL.format(2))
+
+        client = APIClient(use_cache=config)
+        standin(client, serve({}))
+        client._get(URL.format(3))
+
+        assert cached_urls(client) == [URL.format(2), URL.format(3)]
+
+    def test_index(self, standin, tmp_path, monkeypatch):
+        """Test that a new session learns the stored sizes without reading the stored responses"""
+        unbounded = CacheConfig(location=tmp_path / "cache")
+        bounded = CacheConfig(location=tmp_path / "cache", max_bytes=25)
+
+        # Responses stored without an index
+        client = APIClient(use_cache=unbounded)
+        standin(client, serve({}))
+        client._get(URL.format(1))
+
+        client = APIClient(use_cache=bounded)
+        standin(client, serve({}))
+        client._get(URL.format(2))
+
+        read = []
+        deserialize = SQLiteDict.deserialize
+
+        def record(self, key, value):
+            if self.serializer is not None:
+                read.append(key)
+            return deserialize(self, key, value)
+
+        monkeypatch.setattr(SQLiteDict, "deserialize", record)
+
+        client = APIClient(use_cache=bounded)
+        assert client.session.cache.responses.total_bytes == 20
+        assert not read
+
+        standin(client, serve({}))
+        client._get(URL.format(3))
+        assert cached_urls(client) == [URL.format(2), URL.format(3)]
+
+
+class TestObjectCache:
+    """Test the cache of built objects"""
+
+    HEADERS = {"Expires": "Fri, 01 Jan 2100 00:00:00 GMT", "ETag": '"1"'}
+
+    def test_fresh(self, standin):
+        """Test that a fresh object is returned without a request"""
+        client = APIClient(use_cache=False)
+        adapter = standin(client, lambda request: (200, self.HEADERS, b"[1, 2]"))
+        params = {"lat": "1", "offset": None}
+
+        first = client._get(
+            URL.format(1), params=params, decode=decode_json, build=tuple
+        )
+        second = client._get(
+            URL.format(1), params=params, decode=decode_json, build=tuple
+        )
+        other = client._get(URL.format(1), params=params, decode=decode_json)
+
+        assert first == (1, 2)
+        assert second is first
+        assert other == [1, 2]
+        assert len(adapter.requests) == 2
+        assert client.stats()["object_cache_hits"] == 1
+
+    def test_revalidation(self, standin):
+        """Test that objects are reused for unchanged responses, and rebuilt for changed responses"""
+        client = APIClient(use_cache=False)
+        etags = iter(['"1"', '"1"', '"2"'])
+        standin(client, lambda request: (200, {"ETag": next(etags)}, b"[1]"))
+
+        first = client._get(URL.format(1), decode=decode_json, build=tuple)
+        second = client._get(URL.format(1), decode=decode_json, build=tuple)
+        third = client._get(URL.format(1), decode=decode_json, build=tuple)
+
+        assert second is first
+        assert third is not first
+        assert client.stats()["object_cache_revalidations"] == 1
+
+    def test_containers_not_shared(self, standin):
+        """Test that plain containers, which callers could change, aren't cached"""
+        client = APIClient(use_cache=False)
+        adapter = standin(client, lambda request: (200, self.HEADERS, b"[1, 2]"))
+
+        first = client._get(URL.format(1), decode=decode_json)
+        first.clear()
+        second = client._get(URL.format(1), decode=decode_json)
+
+        assert second == [1, 2]
+        assert len(adapter.requests) == 2
+
+    def test_areas_not_shared(self, standin):
+        """Test that changing the list of text forecast areas doesn't change the cached areas"""
+        client = Textforecast(HEADERS, use_cache=False)
+        adapter = standin(
+            client, lambda request: (200, self.HEADERS, serve_fixtures(request)[2])
+        )
+
+        areas = client.get_areas("land")
+        areas.clear()
+        again = client.get_areas("land")
+
+        assert again
+        assert len(adapter.requests) == 1
+        with pytest.raises(FrozenInstanceError):
+            again[0].name = "Changed"
+
+    def test_errors_not_cached(self, standin):
+        """Test that objects built from unsuccessful responses aren't cached"""
+        client = APIClient(use_cache=False)
+        adapter = standin(client, lambda request: (500, self.HEADERS, b"[]"))
+
+        client._get(URL.format(1), decode=decode_json, build=tuple)
+        client._get(URL.format(1), decode=decode_json, build=tuple)
+
+        assert len(adapter.requests) == 2
+
+    @pytest.mark.parametrize(
+        "eviction, kept", [("lru", ["a", "c"]), ("expiry", ["a", "b"])]
+    )
+    def test_eviction(self, eviction, kept):
+        """Test the eviction policies"""
+        cache = ObjectCache(max_entries=2, eviction=eviction)
+        cache.put("a", _CacheEntry(None, 300.0, 1))
+        cache.put("b", _CacheEntry(None, 200.0, 2))
+        cache.get("a")
+        cache.put("c", _CacheEntry(None, 100.0, 3))
+
+        assert len(cache) == 2
+        assert [key for key in "abc" if cache.get(key) is not None] == kept
+
+    def test_params(self):
+        """Test invalid parameters"""
+        with pytest.raises(ValueError, match="'max_entries' parameter must not be"):
+            ObjectCache(max_entries=-1)
+
+        with pytest.raises(ValueError, match="'eviction' argument must be one of"):
+            ObjectCache(eviction="random")
@@ -1,10 +1,15 @@
 """Tests for yr_weather.client"""
 
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import time
 import pytest
 from requests import Session as UncachedSession
 from requests_cache import CachedSession
 
-from yr_weather.client import APIClient
+from yr_weather.client import APIClient, decode_json
+from yr_weather.instrumentation import RequestInfo
 
 
 def test_init():
@@ -45,3 +50,128 @@ def test_cache():
 
     client.toggle_cache(True)
     assert isinstance(client.session, CachedSession)
+
+
+def test_coalescing(standin):
+    """Test that concurrent identical requests are merged into one."""
+    client = APIClient(use_cache=False)
+    started = threading.Event()
+
+    def handler(request):
+        started.set()
+        time.sleep(0.3)
+        return (200, {"Content-Type": "application/json"}, b'{"value": 1}')
+
+    adapter = standin(client, handler)
+    url = "https://api.met.no/weatherapi/test"
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        leader = executor.submit(client._get, url, decode=decode_json)
+        started.wait()
+        followers = [
+            executor.submit(client._get, url, decode=decode_json) for _ in range(9)
+        ]
+        results = [leader.result()] + [future.result() for future in followers]
+
+    assert len(adapter.requests) == 1
+    assert all(result is results[0] for result in results)
+    assert client.stats()["requests_coalesced"] == 9
+
+    # Once the request is done, a new call sends a new request
+    client._get(url)
+    assert len(adapter.requests) == 2
+
+
+def test_hooks(standin):
+    """Test request hooks and per-endpoint counters."""
+    client = APIClient(use_cache=False)
+    standin(
+        client,
+        lambda request: (
+            (404, {}, b"Not Found")
+            if request.url.endswith("missing")
+            else (200, {"Content-Type": "application/json"}, b'{"value": 1}')
+        ),
+    )
+    before, after = [], []
+    client.add_hook("before_request", before.append)
+    client.add_hook("after_request", after.append)
+
+    url = "https://api.met.no/weatherapi/test/1.0/"
+    result = client._get(url + "value?a=1", decode=decode_json, build=len)
+    client._get(url + "missing")
+
+    assert result == 1
+    assert len(before) == len(after) == 2
+    info: RequestInfo = after[0]
+    assert info is before[0]
+    assert info.endpoint == "test/1.0/value"
+    assert info.status_code == 200
+    assert info.size == 12
+    assert not info.from_cache and not info.failed
+    assert info.phases["decode"] > 0 and info.phases["build"] > 0
+    assert after[1].failed
+
+    endpoints = client.stats()["endpoints"]
+    assert endpoints["test/1.0/value"]["requests"] == 1
+    assert endpoints["test/1.0/value"]["bytes"] == 12
+    assert endpoints["test/1.0/value"]["errors"] == 0
+    assert endpoints["test/1.0/missing"]["errors"] == 1
+
+    with pytest.raises(ValueError, match="'event' argument must be one of"):
+        client.add_hook("request", print)
+
+
+def test_hooks_errors(standin):
+    """Test that failing requests are passed to the hooks."""
+    client = APIClient(use_cache=False)
+    standin(client, lambda request: (200, {}, b"not json"))
+    after = []
+    client.add_hook("after_request", after.append)
+
+    with pytest.raises(ValueError):
+        client._get("https://api.met.no/weatherapi/test", decode=decode_json)
+
+    assert isinstance(after[0].error, ValueError)
+    assert client.stats()["endpoints"]["test"]["errors"] == 1
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Answer every request with a small JSON body."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def test_transport_phases():
+    """Test timing of connections against a local server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        client = APIClient(use_cache=False)
+        after = []
+        client.add_hook("after_request", after.append)
+        url = f"http://127.0.0.1:{server.server_address[1]}/weatherapi/test"
+
+        client._get(url)
+        client._get(url)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    first, second = after
+    assert first.phases["connect"] > 0
+    # The second request reuses the kept-alive connection
+    assert second.phases["connect"] == 0
+    assert first.phases["transfer"] > 0
+    assert first.phases["cache_lookup"] == 0
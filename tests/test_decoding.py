@@ -0,0 +1,124 @@
+"""Tests for yr_weather.decoding"""
+
+import json
+import pytest
+
+from yr_weather.decoding import (
+    JSON_BACKEND,
+    JSON_BACKENDS,
+    decode_forecast,
+    loads,
+    _decode_forecast,
+)
+
+
+@pytest.fixture(name="document", scope="module")
+def fixture_document(read_fixture):
+    """A synthetic complete forecast response"""
+    return read_fixture("locationforecast_complete.json").decode("utf-8")
+
+
+class TestDecodeForecast:
+    """Test decode_forecast()"""
+
+    def test_full(self, document: str):
+        """Test that all steps are decoded by default"""
+        assert decode_forecast(document) == json.loads(document)
+        assert decode_forecast(document.encode("utf-8")) == json.loads(document)
+
+    @pytest.mark.parametrize("max_steps", [1, 24, 87, 500])
+    def test_partial(self, document: str, max_steps: int):
+        """Test that only the first steps are decoded"""
+        full = json.loads(document)
+        partial = decode_forecast(document, max_steps)
+
+        assert partial["type"] == full["type"]
+        assert partial["geometry"] == full["geometry"]
+        assert partial["properties"]["meta"] == full["properties"]["meta"]
+        timeseries = full["properties"]["timeseries"]
+        assert partial["properties"]["timeseries"] == timeseries[:max_steps]
+
+    def test_stops_early(self, document: str):
+        """Test that the rest of the document isn't read"""
+        _, read = _decode_forecast(document, 24)
+
+        assert read < len(document) / 2
+
+    def test_any_key_order(self, document: str):
+        """Test documents where the timeseries comes before other keys"""
+        full = json.loads(document)
+        reordered = {
+            "properties": {
+                "timeseries": full["properties"]["timeseries"],
+                "meta": full["properties"]["meta"],
+            },
+            "geometry": full["geometry"],
+            "type": full["type"],
+        }
+
+        partial = decode_forecast(json.dumps(reordered, indent=2), 3)
+
+        assert partial["type"] == "Feature"
+        assert partial["properties"]["meta"] == full["properties"]["meta"]
+        assert len(partial["properties"]["timeseries"]) == 3
+
+    def test_escaped_strings(self):
+        """Test that brackets and quotes inside skipped strings are ignored"""
+        document = json.dumps(
+            {
+                "properties": {
+                    "timeseries": [{"a": 1}, {"b": 'x"]}[{'}, {"c": 3}],
+                    "meta": {"units": {}},
+                },
+                "type": "Feature",
+                "geometry": {},
+            }
+        )
+
+        partial = decode_forecast(document, 1)
+
+        assert partial["properties"]["timeseries"] == [{"a": 1}]
+        assert partial["properties"]["meta"] == {"units": {}}
+
+    def test_invalid(self, document: str):
+        """Test invalid documents and parameters"""
+        with pytest.raises(json.JSONDecodeError):
+            decode_forecast('{"properties": {"timeseries": [{"a": 1}, {"b"', 1)
+
+        with pytest.raises(ValueError, match="'max_steps' parameter must be"):
+            decode_forecast(document, 0)
+
+
+class TestLoads:
+    """Test the JSON backends used by loads()"""
+
+    def test_preferred_backend(self):
+        """Test that loads() uses the first available backend"""
+        assert JSON_BACKEND == next(iter(JSON_BACKENDS))
+        assert loads is JSON_BACKENDS[JSON_BACKEND]
+        assert "json" in JSON_BACKENDS
+
+    @pytest.mark.parametrize("backend", list(JSON_BACKENDS))
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "locationforecast_complete.json",
+            "locationforecast_compact.json",
+            "sunrise_sun.json",
+            "sunrise_moon.json",
+            "radar_status.json",
+            "radar_radaroptions.json",
+        ],
+    )
+    def test_same_result(self, read_fixture, backend: str, name: str):
+        """Test that every backend decodes every product like json.loads"""
+        body = read_fixture(name)
+
+        assert JSON_BACKENDS[backend](body) == json.loads(body)
+        assert JSON_BACKENDS[backend](body.decode("utf-8")) == json.loads(body)
+
+    @pytest.mark.parametrize("backend", list(JSON_BACKENDS))
+    def test_invalid(self, backend: str):
+        """Test that every backend raises a ValueError for invalid documents"""
+        with pytest.raises(ValueError):
+            JSON_BACKENDS[backend](b'{"type": "Feature",')
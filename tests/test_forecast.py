@@ -0,0 +1,522 @@
+"""Tests for yr_weather.data.locationforecast, using generated forecast data"""
+
+from datetime import date, datetime, timedelta, timezone
+import pytest
+
+from yr_weather.data.locationforecast import Forecast, ForecastTime, ForecastTimes
+
+START = datetime(2024, 1, 15, 12)
+
+
+def make_forecast_data(start: datetime = START, hourly: int = 60, six_hourly: int = 20):
+    """Create forecast data shaped like a complete MET Locationforecast response.
+
+    The timeseries has ``hourly`` steps one hour apart, followed by ``six_hourly`` steps
+    six hours apart, like the API does.
+    """
+    times = [start + timedelta(hours=i) for i in range(hourly)]
+    last = times[-1]
+    times += [last + timedelta(hours=6 * (i + 1)) for i in range(six_hourly)]
+
+    timeseries = []
+    for i, time in enumerate(times):
+        data = {
+            "instant": {
+                "details": {
+                    "air_pressure_at_sea_level": 1000.0 + i,
+                    "air_temperature": -5.0 + i * 0.5,
+                    "relative_humidity": 80.0,
+                    "wind_from_direction": (i * 30.0) % 360,
+                    "wind_speed": 3.0 + i % 4,
+                    "wind_speed_of_gust": 6.0 + i % 5,
+                }
+            },
+            "next_6_hours": {
+                "summary": {"symbol_code": "cloudy"},
+                "details": {
+                    "air_temperature_max": 0.0 + i,
+                    "air_temperature_min": -10.0 + i,
+                    "precipitation_amount": 0.6,
+                },
+            },
+            "next_12_hours": {
+                "summary": {"symbol_code": "partlycloudy_day"},
+                "details": {"probability_of_precipitation": 10.0},
+            },
+        }
+        if i < hourly:
+            data["next_1_hours"] = {
+                "summary": {"symbol_code": "rain" if i % 2 else "cloudy"},
+                "details": {"precipitation_amount": 0.1},
+            }
+
+        timeseries.append({"time": time.strftime("%Y-%m-%dT%H:%M:%SZ"), "data": data})
+
+    return {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [10.75, 59.91, 0]},
+        "properties": {
+            "meta": {
+                "updated_at": start.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "units": {"air_temperature": "celsius", "precipitation_amount": "mm"},
+            },
+            "timeseries": timeseries,
+        },
+    }
+
+
+@pytest.fixture(name="forecast")
+def fixture_forecast():
+    """A generated forecast"""
+    return Forecast(make_forecast_data())
+
+
+class TestForecastTimeIndex:
+    """Test looking up times in a Forecast"""
+
+    def test_exact_hour(self, forecast: Forecast):
+        """Test looking up an hour in the hourly part of the timeseries"""
+        found = forecast.get_forecast_time(START + timedelta(hours=3))
+
+        assert isinstance(found, ForecastTime)
+        assert found.time == "2024-01-15T15:00:00Z"
+
+    def test_rounding(self, forecast: Forecast):
+        """Test that times are rounded to the nearest hour"""
+        found_1 = forecast.get_forecast_time(START + timedelta(hours=3, minutes=29))
+        found_2 = forecast.get_forecast_time(START + timedelta(hours=3, minutes=30))
+
+        assert found_1 is not None and found_1.time == "2024-01-15T15:00:00Z"
+        assert found_2 is not None and found_2.time == "2024-01-15T16:00:00Z"
+
+    def test_six_hourly_part(self, forecast: Forecast):
+        """Test that times between 6-hourly steps return the step covering them"""
+        # Hourly steps end at START + 59h, then 6-hourly steps follow.
+        found = forecast.get_forecast_time(START + timedelta(hours=59 + 8))
+
+        assert found is not None
+        assert found.time == "2024-01-18T05:00:00Z"
+        assert found.next_hour.details is None
+        assert found.next_6_hours.details is not None
+
+    def test_outside_timeseries(self, forecast: Forecast):
+        """Test times before and after the timeseries"""
+        assert forecast.get_forecast_time(START - timedelta(hours=2)) is None
+        assert forecast.get_forecast_time(START + timedelta(days=30)) is None
+
+    def test_timezone_aware(self, forecast: Forecast):
+        """Test that aware datetimes are converted to UTC"""
+        cet = timezone(timedelta(hours=1))
+        found = forecast.get_forecast_time(datetime(2024, 1, 15, 16, tzinfo=cet))
+
+        assert found is not None and found.time == "2024-01-15T15:00:00Z"
+
+    def test_closest(self, forecast: Forecast):
+        """Test Forecast.get_closest_forecast_time()"""
+        before = forecast.get_closest_forecast_time(START - timedelta(days=1))
+        after = forecast.get_closest_forecast_time(START + timedelta(days=30))
+        between = forecast.get_closest_forecast_time(START + timedelta(hours=59 + 4))
+
+        assert before.time == "2024-01-15T12:00:00Z"
+        assert after.time == forecast._timeseries[-1]["time"]
+        assert between.time == "2024-01-18T05:00:00Z"
+
+    def test_params(self, forecast: Forecast):
+        """Test that a datetime is required"""
+        with pytest.raises(ValueError, match="Type of time should be datetime"):
+            forecast.get_forecast_time("2024-01-15T12:00:00Z")
+
+
+def _parse(time: str) -> datetime:
+    return datetime.strptime(time, "%Y-%m-%dT%H:%M:%SZ")
+
+
+class TestForecastTimes:
+    """Test the time range views of a Forecast"""
+
+    def test_between(self, forecast: Forecast):
+        """Test getting the steps between two times"""
+        view = forecast.between(datetime(2024, 1, 16, 6), datetime(2024, 1, 16, 18))
+
+        assert isinstance(view, ForecastTimes)
+        assert len(view) == 12
+        assert view[0].time == "2024-01-16T06:00:00Z"
+        assert view[-1].time == "2024-01-16T17:00:00Z"
+        assert [t.time for t in view] == [
+            f"2024-01-16T{hour:02}:00:00Z" for hour in range(6, 18)
+        ]
+
+    def test_between_is_a_view(self, forecast: Forecast):
+        """Test that views don't copy the timeseries"""
+        view = forecast.between(START, START + timedelta(days=30))
+
+        assert view._timeseries is forecast._timeseries
+        assert isinstance(view._indices, range)
+        assert len(view) == len(forecast._timeseries)
+
+        sliced = view[2:5]
+        assert isinstance(sliced, ForecastTimes)
+        assert [t.time for t in sliced] == [
+            t["time"] for t in forecast._timeseries[2:5]
+        ]
+
+    def test_between_six_hourly_part(self, forecast: Forecast):
+        """Test ranges across the change from hourly to 6-hourly steps"""
+        view = forecast.between(datetime(2024, 1, 17, 22), datetime(2024, 1, 18, 12))
+
+        assert [t.time for t in view] == [
+            "2024-01-17T22:00:00Z",
+            "2024-01-17T23:00:00Z",
+            "2024-01-18T05:00:00Z",
+            "2024-01-18T11:00:00Z",
+        ]
+
+    def test_between_empty(self, forecast: Forecast):
+        """Test ranges without any steps"""
+        assert len(forecast.between(START - timedelta(days=2), START)) == 0
+        assert len(forecast.between(START + timedelta(days=30), START)) == 0
+        assert not forecast.between(START + timedelta(hours=2), START)
+        assert repr(forecast.between(START, START)) == "<ForecastTimes (empty)>"
+
+    def test_between_timezone_aware(self, forecast: Forecast):
+        """Test that aware datetimes are converted to UTC"""
+        cet = timezone(timedelta(hours=1))
+        view = forecast.between(
+            datetime(2024, 1, 15, 16, tzinfo=cet), datetime(2024, 1, 15, 18, tzinfo=cet)
+        )
+
+        assert [t.time for t in view] == [
+            "2024-01-15T15:00:00Z",
+            "2024-01-15T16:00:00Z",
+        ]
+
+    def test_iter_times(self, forecast: Forecast):
+        """Test iterating over steps at least some time apart"""
+        times = [_parse(t.time) for t in forecast.iter_times(timedelta(hours=3))]
+
+        assert times[0] == START
+        assert times[1] == START + timedelta(hours=3)
+        assert all(b - a >= timedelta(hours=3) for a, b in zip(times, times[1:]))
+        # All 6-hourly steps are yielded once
+        assert times[-20:] == [_parse(t["time"]) for t in forecast._timeseries[-20:]]
+
+    def test_iter_times_default(self, forecast: Forecast):
+        """Test that every step is yielded by default"""
+        times = [t.time for t in forecast.iter_times()]
+
+        assert times == [t["time"] for t in forecast._timeseries]
+
+    def test_resample(self, forecast: Forecast):
+        """Test selecting the steps covering every 6 hours"""
+        times = [_parse(t.time) for t in forecast.resample(timedelta(hours=6))]
+
+        hourly = [time for time in times if time <= datetime(2024, 1, 17, 18)]
+        assert hourly == [START + timedelta(hours=6 * i) for i in range(len(hourly))]
+        assert hourly[-1] == datetime(2024, 1, 17, 18)
+        # 00:00 on the 18th is covered by the last hourly step, then every 6-hourly step follows,
+        # except the last one, which starts after the last multiple of 6 hours in the timeseries
+        assert times[len(hourly)] == datetime(2024, 1, 17, 23)
+        assert times[len(hourly) + 1 :] == [
+            _parse(t["time"]) for t in forecast._timeseries[-20:-1]
+        ]
+
+    def test_resample_daily(self, forecast: Forecast):
+        """Test selecting the steps covering midnight UTC"""
+        times = [t.time for t in forecast.resample(timedelta(days=1))]
+
+        assert times[:3] == [
+            "2024-01-16T00:00:00Z",
+            "2024-01-17T00:00:00Z",
+            "2024-01-17T23:00:00Z",
+        ]
+        assert len(times) == len(set(times))
+
+    def test_resample_view(self, forecast: Forecast):
+        """Test that views can be narrowed further"""
+        view = forecast.between(datetime(2024, 1, 16), datetime(2024, 1, 17))
+        resampled = view.resample(timedelta(hours=3))
+
+        assert [t.time for t in resampled] == [
+            f"2024-01-16T{hour:02}:00:00Z" for hour in range(0, 24, 3)
+        ]
+        assert [t.time for t in resampled.between(START, datetime(2024, 1, 16, 7))] == [
+            "2024-01-16T00:00:00Z",
+            "2024-01-16T03:00:00Z",
+            "2024-01-16T06:00:00Z",
+        ]
+        assert [t.time for t in resampled.iter_times(timedelta(hours=5))] == [
+            f"2024-01-16T{hour:02}:00:00Z" for hour in (0, 6, 12, 18)
+        ]
+
+    def test_params(self, forecast: Forecast):
+        """Test invalid parameters"""
+        with pytest.raises(ValueError, match="Type of time should be datetime"):
+            forecast.between("2024-01-15T12:00:00Z", START)
+
+        with pytest.raises(ValueError, match="'step' parameter must be"):
+            next(forecast.iter_times(timedelta(0)))
+
+        with pytest.raises(ValueError, match="'interval' parameter must be"):
+            forecast.resample(timedelta(hours=-1))
+
+
+class TestForecastFrame:
+    """Test Forecast.to_frame()"""
+
+    def test_columns(self, forecast: Forecast):
+        """Test that all steps and variables are read into columns"""
+        np = pytest.importorskip("numpy")
+        frame = forecast.to_frame()
+
+        assert len(frame) == 80
+        assert frame.time.dtype == np.int64
+        assert frame.time[1] - frame.time[0] == 3600
+        assert frame["air_temperature"][2] == -4.0
+        assert frame["next_6_hours.precipitation_amount"][0] == 0.6
+
+        # Missing values are NaN
+        assert np.isnan(frame["fog_area_fraction"]).all()
+        assert np.isnan(frame["next_1_hours.precipitation_amount"][60:]).all()
+
+    @pytest.mark.filterwarnings("ignore:All-NaN slice")
+    def test_aggregates(self, forecast: Forecast):
+        """Test vectorized aggregation over all variables"""
+        np = pytest.importorskip("numpy")
+        frame = forecast.to_frame()
+
+        maxima = np.nanmax(frame.instant, axis=1)
+        temp_row = frame.columns.index("air_temperature")
+
+        assert maxima[temp_row] == -5.0 + 79 * 0.5
+
+    def test_symbols(self, forecast: Forecast):
+        """Test categorical symbol codes"""
+        pytest.importorskip("numpy")
+        frame = forecast.to_frame()
+        symbols = frame.symbol_code("next_1_hours")
+
+        assert symbols[:2] == ["cloudy", "rain"]
+        assert symbols[-1] is None
+        assert set(frame.symbols) == {"cloudy", "rain", "partlycloudy_day"}
+
+        with pytest.raises(KeyError):
+            frame.column("next_2_hours.precipitation_amount")
+
+
+class TestDailySummary:
+    """Test Forecast.daily_summary()"""
+
+    def test_days(self, forecast: Forecast):
+        """Test the aggregates of every day"""
+        np = pytest.importorskip("numpy")
+        summary = forecast.daily_summary()
+
+        assert len(summary) == 9
+        assert summary.date[0] == date(2024, 1, 15)
+        assert summary.date[-1] == date(2024, 1, 23)
+
+        # Steps 12 to 35 are on the 16th
+        assert summary.air_temperature_min[1] == -5.0 + 12 * 0.5
+        assert summary.air_temperature_max[1] == -5.0 + 35 * 0.5
+        assert summary.wind_speed_of_gust_max[1] == 10.0
+        assert summary.precipitation_amount[1] == pytest.approx(24 * 0.1)
+        assert summary.symbol_code[1] == "cloudy"
+
+        assert summary.covered_hours[0] == 12
+        assert (summary.covered_hours[1:-1] == 24).all()
+        # The last 6 hour period ends at 05:00 on the 23rd
+        assert summary.covered_hours[-1] == 5
+        assert np.isnan(summary.air_temperature_max[-1])
+
+    def test_no_double_counting(self, forecast: Forecast):
+        """Test that overlapping periods are only counted once"""
+        pytest.importorskip("numpy")
+        summary = forecast.daily_summary()
+
+        # 59 hourly periods, then the last hourly step and the 20 6-hourly steps use 6 hour periods
+        expected = 59 * 0.1 + 21 * 0.6
+        assert summary.precipitation_amount.sum() == pytest.approx(expected)
+        assert summary.covered_hours.sum() == 59 + 21 * 6
+
+    def test_timezone(self, forecast: Forecast):
+        """Test that steps are assigned to local days"""
+        pytest.importorskip("numpy")
+        summary = forecast.daily_summary("Europe/Oslo")
+        fixed = forecast.daily_summary(timezone(timedelta(hours=1)))
+
+        # 12:00 UTC is 13:00 in Oslo
+        assert summary.covered_hours[0] == 11
+        assert summary.precipitation_amount[0] == pytest.approx(11 * 0.1)
+        assert summary.date == fixed.date
+        assert (summary.covered_hours == fixed.covered_hours).all()
+
+    def test_daylight_saving_time(self):
+        """Test days which are shorter because of daylight saving time"""
+        pytest.importorskip("numpy")
+        data = make_forecast_data(datetime(2024, 3, 29, 23), hourly=72, six_hourly=0)
+        summary = Forecast(data).daily_summary("Europe/Oslo")
+
+        # Clocks in Oslo were set forward on March 31st, 2024
+        assert summary.date[:3] == [
+            date(2024, 3, 30),
+            date(2024, 3, 31),
+            date(2024, 4, 1),
+        ]
+        assert list(summary.covered_hours[:3]) == [24, 23, 24]
+
+    def test_periods_across_midnight(self):
+        """Test that periods crossing midnight are split between the days"""
+        pytest.importorskip("numpy")
+        data = make_forecast_data(datetime(2024, 1, 15, 21), hourly=1, six_hourly=4)
+        summary = Forecast(data).daily_summary()
+
+        # 21:00-03:00 is the first period, of which 3 hours are on the 15th
+        assert summary.precipitation_amount[0] == pytest.approx(0.6 / 2)
+        assert summary.covered_hours[0] == 3
+        assert summary.covered_hours[1] == 24
+
+    def test_dominant_symbol(self):
+        """Test that the symbol covering the most hours is used"""
+        pytest.importorskip("numpy")
+        data = make_forecast_data(datetime(2024, 1, 15), hourly=24, six_hourly=0)
+        for i, step in enumerate(data["properties"]["timeseries"]):
+            symbol = "clearsky_day" if 8 <= i < 21 else "cloudy"
+            step["data"]["next_1_hours"]["summary"]["symbol_code"] = symbol
+
+        summary = Forecast(data).daily_summary()
+
+        assert summary.symbol_code == ["clearsky_day"]
+
+    def test_frame(self, forecast: Forecast):
+        """Test that the frame and the forecast summarize the same way"""
+        pytest.importorskip("numpy")
+        summary = forecast.to_frame().daily_summary()
+
+        assert summary.date == forecast.daily_summary().date
+
+    def test_params(self, forecast: Forecast):
+        """Test invalid timezones"""
+        pytest.importorskip("numpy")
+        with pytest.raises(TypeError, match="'tz' parameter must be"):
+            forecast.daily_summary(1)  # type: ignore[arg-type]
+
+        with pytest.raises(KeyError):
+            forecast.daily_summary("Europe/Atlantis")
+
+
+class TestInterpolate:
+    """Test Forecast.interpolate()"""
+
+    def test_linear(self, forecast: Forecast):
+        """Test interpolating between hourly steps"""
+        pytest.importorskip("numpy")
+        times = [
+            START,
+            START + timedelta(minutes=30),
+            START + timedelta(hours=2, minutes=45),
+        ]
+
+        values = forecast.interpolate(times, ["air_temperature", "wind_speed"])
+
+        assert list(values) == ["air_temperature", "wind_speed"]
+        assert list(values["air_temperature"]) == [-5.0, -4.75, -5.0 + 2.75 * 0.5]
+        assert values["wind_speed"][1] == 3.5
+
+    def test_six_hourly_part(self, forecast: Forecast):
+        """Test interpolating between 6-hourly steps"""
+        pytest.importorskip("numpy")
+        # Between the last hourly step (23:00) and the first 6-hourly step (05:00)
+        values = forecast.interpolate([datetime(2024, 1, 18, 2)], ["air_temperature"])
+
+        assert values["air_temperature"][0] == pytest.approx((24.5 + 25.0) / 2)
+
+    def test_circular(self, forecast: Forecast):
+        """Test that wind directions are interpolated along the shortest arc"""
+        pytest.importorskip("numpy")
+        times = [
+            START + timedelta(minutes=30),
+            START + timedelta(hours=11, minutes=30),
+            START + timedelta(hours=11),
+        ]
+
+        values = forecast.interpolate(times, ["wind_from_direction"])
+
+        # 0° to 30°, 330° to 0°, and exactly 330°
+        assert values["wind_from_direction"] == pytest.approx([15.0, 345.0, 330.0])
+
+    def test_missing(self, forecast: Forecast):
+        """Test times outside the timeseries, and variables without values"""
+        np = pytest.importorskip("numpy")
+        times = [START - timedelta(minutes=1), START, START + timedelta(days=30)]
+
+        values = forecast.interpolate(times)
+
+        assert list(values) == list(forecast.to_frame().columns[: len(values)])
+        assert np.isnan(values["air_temperature"][[0, 2]]).all()
+        assert values["air_temperature"][1] == -5.0
+        assert np.isnan(values["fog_area_fraction"]).all()
+
+    def test_time_types(self, forecast: Forecast):
+        """Test that datetimes, datetime64 values and seconds give the same result"""
+        np = pytest.importorskip("numpy")
+        times = [START + timedelta(minutes=17 * i) for i in range(200)]
+        cet = timezone(timedelta(hours=1))
+
+        expected = forecast.interpolate(times)["air_temperature"]
+        as_datetime64 = np.array(times, dtype="datetime64[s]")
+        as_seconds = as_datetime64.astype(np.int64)
+        aware = [time.replace(tzinfo=timezone.utc).astimezone(cet) for time in times]
+
+        for converted in (as_datetime64, as_seconds, aware):
+            result = forecast.interpolate(converted)["air_temperature"]
+            assert np.array_equal(result, expected, equal_nan=True)
+
+    def test_steps(self, forecast: Forecast):
+        """Test that interpolating at the steps gives their values"""
+        np = pytest.importorskip("numpy")
+        frame = forecast.to_frame()
+
+        values = frame.interpolate(frame.time)
+
+        for name, column in values.items():
+            assert np.allclose(column, frame[name], equal_nan=True)
+
+    def test_params(self, forecast: Forecast):
+        """Test invalid times and variables"""
+        pytest.importorskip("numpy")
+        with pytest.raises(KeyError, match="Unknown instant variable"):
+            forecast.interpolate([START], ["precipitation_amount"])
+
+        with pytest.raises(TypeError, match="'times' parameter must be"):
+            forecast.interpolate(["2024-01-15T12:00:00Z"])
+
+
+class TestForecastTime:
+    """Test lazy ForecastTime materialization"""
+
+    def test_lazy(self, forecast: Forecast):
+        """Test that sub-objects are created on first access and reused"""
+        forecast_time = forecast.get_forecast_time(START)
+
+        assert forecast_time is not None
+        assert not hasattr(forecast_time, "__dict__")
+        assert forecast_time._details is None
+
+        details = forecast_time.details
+        assert details.air_temperature == -5.0
+        assert forecast_time.details is details
+
+        future = forecast_time.next_6_hours
+        assert future is forecast_time.next_6_hours
+        assert future.summary is not None and future.summary.symbol_code == "cloudy"
+        assert future.details is not None and future.details.precipitation_amount == 0.6
+
+    def test_unknown_keys(self):
+        """Test that unknown keys from the API are ignored"""
+        data = make_forecast_data(hourly=1, six_hourly=0)
+        data["properties"]["timeseries"][0]["data"]["instant"]["details"]["new"] = 1.0
+
+        details = Forecast(data).get_forecast_time(START).details
+
+        assert details.air_temperature == -5.0
+        assert not hasattr(details, "new")
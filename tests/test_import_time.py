@@ -0,0 +1,116 @@
+"""Tests that importing yr_weather stays fast, using the import time benchmark"""
+
+import subprocess
+import sys
+
+import pytest
+
+import yr_weather
+from benchmarks import importtime
+
+# Dependencies which take long to import, and are only needed by some products or features
+HEAVY = {"requests_cache", "xmltodict", "pytz", "numpy", "aiohttp"}
+
+
+def _top_level(times) -> set:
+    return {name.split(".")[0] for name in times}
+
+
+def test_parse():
+    """Test parsing the report of -X importtime"""
+    report = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   yr_weather.retry\n"
+        "import time:       859 |        979 | yr_weather\n"
+    )
+    times = importtime.parse(report)
+
+    assert times == {
+        "yr_weather.retry": (120, 120),
+        "yr_weather": (859, 979),
+    }
+    assert importtime.total_us(times) == 979
+
+
+def test_import_package():
+    """Test that importing yr_weather imports no clients and no dependencies"""
+    times = importtime.measure("import yr_weather")
+
+    assert set(times) == {"yr_weather"}
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("Sunrise", "yr_weather.sunrise"),
+        ("Locationforecast", "yr_weather.locationforecast"),
+        ("Radar", "yr_weather.radar"),
+        ("Geosatellite", "yr_weather.geosatellite"),
+        ("MetClient", "yr_weather.met"),
+    ],
+)
+def test_import_client(name, expected):
+    """Test that importing a client doesn't import other products or the dependencies of unused features"""
+    times = importtime.measure(f"from yr_weather import {name}")
+
+    assert expected in times
+    assert not _top_level(times) & HEAVY
+    assert "yr_weather.textforecast" not in times
+
+
+def test_import_textforecast():
+    """Test that the dependencies of Textforecast are imported with it"""
+    times = importtime.measure("from yr_weather import Textforecast")
+
+    assert "xmltodict" in times
+    assert "requests_cache" not in times
+
+
+def test_cache_imported_on_use():
+    """Test that requests-cache is imported when a cached session is created"""
+    times = importtime.measure(
+        "from yr_weather.cache import CacheConfig; CacheConfig(backend='memory').create_session()"
+    )
+
+    assert "requests_cache" in times
+
+
+def test_lazy_attributes():
+    """Test that the clients are found as attributes of the package"""
+    from yr_weather.sunrise import Sunrise  # pylint: disable=import-outside-toplevel
+
+    assert yr_weather.Sunrise is Sunrise
+    assert "MetClient" in dir(yr_weather)
+    assert set(yr_weather.__all__) == {
+        "Locationforecast",
+        "Radar",
+        "Textforecast",
+        "Sunrise",
+        "Geosatellite",
+        "MetClient",
+    }
+
+    with pytest.raises(AttributeError, match="Forecast"):
+        yr_weather.Forecast  # pylint: disable=pointless-statement
+
+
+def test_submodule_attributes():
+    """Test that submodules are found as attributes of the package after only importing it"""
+    statement = (
+        "import yr_weather, yr_weather.aio; "
+        "yr_weather.locationforecast.Forecast; yr_weather.client.APIClient; "
+        "yr_weather.data.locationforecast; yr_weather.api_types; yr_weather.sunrise.Sunrise; "
+        "yr_weather.aio.client.AsyncAPIClient"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", statement],
+        cwd=importtime.ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
+
+    with pytest.raises(AttributeError, match="nothing"):
+        yr_weather.nothing  # pylint: disable=pointless-statement,no-member
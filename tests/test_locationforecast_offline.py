@@ -0,0 +1,314 @@
+"""Offline tests for yr_weather.locationforecast, using a stand-in transport"""
+
+import json
+from urllib.parse import urlsplit, parse_qs
+import pytest
+
+from yr_weather import Locationforecast
+from yr_weather.cache import ObjectCache
+from yr_weather.data.locationforecast import Forecast, ForecastArea, ForecastResult
+
+HEADERS = {"User-Agent": "testing/latest https://github.com/ZeroWave022/yr-weather"}
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@pytest.fixture(name="complete", scope="module")
+def fixture_complete(read_fixture):
+    """A synthetic complete forecast response"""
+    return read_fixture("locationforecast_complete.json")
+
+
+@pytest.fixture(name="client")
+def fixture_client():
+    """An uncached Locationforecast client"""
+    return Locationforecast(HEADERS, use_cache=False)
+
+
+class TestBatch:
+    """Test Locationforecast.get_forecasts()"""
+
+    def test_all_points(self, client: Locationforecast, standin, complete):
+        """Test that a forecast is returned for every point"""
+        adapter = standin(client, lambda request: (200, JSON_HEADERS, complete))
+        points = [(59.0 + i / 10, 10.0) for i in range(25)]
+
+        results = list(client.get_forecasts(points, max_workers=4))
+
+        assert len(results) == 25
+        assert len(adapter.requests) == 25
+        assert sorted(result.point for result in results) == points
+        for result in results:
+            assert isinstance(result, ForecastResult)
+            assert result.ok
+            assert isinstance(result.forecast, Forecast)
+
+    def test_errors_are_captured(self, client: Locationforecast, standin, complete):
+        """Test that a failing point doesn't abort the batch"""
+
+        def handler(request):
+            lat = float(parse_qs(urlsplit(request.url).query)["lat"][0])
+            if lat == 60.0:
+                return (500, {}, b"Internal Server Error")
+            return (200, JSON_HEADERS, complete)
+
+        standin(client, handler)
+        points = [(59.0, 10.0), (60.0, 10.0), (61.0, 10.0)]
+
+        results = {result.point: result for result in client.get_forecasts(points)}
+
+        assert results[(59.0, 10.0)].ok
+        assert results[(61.0, 10.0)].ok
+        assert not results[(60.0, 10.0)].ok
+        assert results[(60.0, 10.0)].forecast is None
+        assert isinstance(results[(60.0, 10.0)].error, Exception)
+
+    def test_params(self, client: Locationforecast):
+        """Test that invalid parameters are rejected before fetching"""
+        with pytest.raises(ValueError, match="Value of forecast_type must be"):
+            list(client.get_forecasts([(59.91, 10.75)], forecast_type="classic"))
+
+        with pytest.raises(ValueError, match="'max_workers' parameter must be"):
+            list(client.get_forecasts([(59.91, 10.75)], max_workers=0))
+
+
+class TestPrefetchArea:
+    """Test Locationforecast.prefetch_area()"""
+
+    def test_lattice(self, client: Locationforecast, standin, complete):
+        """Test that every lattice point is fetched once"""
+        adapter = standin(client, lambda request: (200, JSON_HEADERS, complete))
+
+        area = client.prefetch_area((59.8, 10.6, 60.0, 10.9), 0.1, max_workers=4)
+
+        assert isinstance(area, ForecastArea)
+        assert area.shape == (3, 4)
+        assert len(area) == 12
+        assert len(adapter.requests) == 12
+        assert (59.8, 10.6) in area.points and (60.0, 10.9) in area.points
+        assert all(result.ok for result in area)
+
+    def test_same_grid_cell(self, standin, complete):
+        """Test that points in the same grid cell are only fetched once"""
+        client = Locationforecast(HEADERS, use_cache=False, grid_spacing=0.25)
+        adapter = standin(client, lambda request: (200, JSON_HEADERS, complete))
+
+        area = client.prefetch_area((59.8, 10.6, 60.0, 10.9), 0.1)
+
+        assert area.shape == (3, 4)
+        # Latitudes 59.9 and 60.0, and longitudes 10.7 and 10.8 are in the same cells
+        assert sorted(area.points) == [
+            (59.75, 10.5),
+            (59.75, 10.75),
+            (59.75, 11.0),
+            (60.0, 10.5),
+            (60.0, 10.75),
+            (60.0, 11.0),
+        ]
+        assert len(adapter.requests) == 6
+        assert client.stats()["coordinate_collisions"] == 6
+        assert area.nearest(59.9, 10.8).point == (60.0, 10.75)
+
+    def test_nearest(self, client: Locationforecast, standin, complete):
+        """Test finding the nearest lattice point"""
+        standin(client, lambda request: (200, JSON_HEADERS, complete))
+        area = client.prefetch_area((59.8, 10.6, 60.0, 10.9), 0.1)
+
+        assert area.nearest(59.86, 10.74).point == (59.9, 10.7)
+        assert area.nearest(59.84, 10.76).point == (59.8, 10.8)
+        # Locations outside the area use the nearest point on its edge
+        assert area.nearest(61.0, 10.0).point == (60.0, 10.6)
+        assert area.nearest(59.0, 12.0).point == (59.8, 10.9)
+        assert isinstance(area.nearest(59.9, 10.7).forecast, Forecast)
+
+    def test_errors(self, client: Locationforecast, standin, complete):
+        """Test that failed points are kept as errors"""
+
+        def handler(request):
+            lat = float(parse_qs(urlsplit(request.url).query)["lat"][0])
+            if lat == 60.0:
+                return (500, {}, b"Internal Server Error")
+            return (200, JSON_HEADERS, complete)
+
+        standin(client, handler)
+        area = client.prefetch_area((59.9, 10.7, 60.0, 10.8), 0.1)
+
+        assert area.nearest(59.9, 10.7).ok
+        assert not area.nearest(60.0, 10.7).ok
+        assert area.nearest(60.0, 10.7).error is not None
+
+    def test_params(self, client: Locationforecast):
+        """Test that invalid areas are rejected before fetching"""
+        with pytest.raises(ValueError, match="'bbox' parameter must be"):
+            client.prefetch_area((60.0, 10.0, 59.0, 11.0), 0.1)
+
+        with pytest.raises(ValueError, match="'bbox' parameter must be"):
+            client.prefetch_area((59.0, 10.0, 60.0), 0.1)  # type: ignore[arg-type]
+
+        with pytest.raises(ValueError, match="'spacing' parameter must be"):
+            client.prefetch_area((59.0, 10.0, 60.0, 11.0), 0)
+
+        with pytest.raises(ValueError, match="'max_points' parameter"):
+            client.prefetch_area((59.0, 10.0, 60.0, 11.0), 0.01)
+
+
+def test_decode_and_build_timed(client: Locationforecast, standin, complete):
+    """Test that decoding the JSON and building the Forecast are timed separately"""
+    standin(client, lambda request: (200, JSON_HEADERS, complete))
+    after = []
+    client.add_hook("after_request", after.append)
+
+    client.get_forecast(59.91, 10.75)
+    client.get_forecast(59.91, 10.75, max_steps=24)
+
+    for info in after:
+        assert info.phases["decode"] > 0 and info.phases["build"] > 0
+
+    endpoint = client.stats()["endpoints"]["locationforecast/2.0/complete"]
+    assert endpoint["decode_seconds"] > 0
+    assert endpoint["build_seconds"] > 0
+
+
+class TestNormalization:
+    """Test coordinate normalization"""
+
+    def test_rounding(self, client: Locationforecast, standin, complete):
+        """Test that equivalent coordinates result in the same URL"""
+        adapter = standin(client, lambda request: (200, JSON_HEADERS, complete))
+
+        client.get_forecast(59.91, 10.75)
+        client.get_forecast(59.910000001, 10.75)
+        client.get_forecast(59.9100, 10.75)
+
+        urls = {request.url for request in adapter.requests}
+        assert urls == {
+            "https://api.met.no/weatherapi/locationforecast/2.0/complete?lat=59.91&lon=10.75"
+        }
+
+        stats = client.stats()
+        assert stats["coordinates_normalized"] == 1
+        assert stats["coordinate_collisions"] == 1
+
+    def test_grid(self):
+        """Test snapping coordinates to a grid"""
+        client = Locationforecast(HEADERS, use_cache=False, grid_spacing=0.05)
+
+        assert client.normalize_coordinates(59.91, 10.76) == (59.9, 10.75)
+        assert client.normalize_coordinates(59.93, 10.77) == (59.95, 10.75)
+
+    def test_repeated_collision(self, client: Locationforecast):
+        """Test that requesting the same jittered coordinates again is only one collision"""
+        client._normalized(59.91, 10.75)
+        for _ in range(3):
+            client._normalized(59.910000001, 10.75)
+
+        assert client.stats()["coordinate_collisions"] == 1
+
+    def test_bounded_history(self, client: Locationforecast, monkeypatch):
+        """Test that only a bounded number of requested coordinates are remembered"""
+        monkeypatch.setattr("yr_weather.locationforecast._MAX_TRACKED_COORDINATES", 3)
+
+        # Jittered coordinates, like GPS readings of one location
+        for jitter in range(5):
+            client._normalized(59.91 + jitter * 1e-6, 10.75)
+
+        assert len(client._requested_coordinates) == 3
+        assert client.stats()["coordinate_collisions"] == 4
+
+        for lat in range(10):
+            client._normalized(lat, 10.0)
+
+        assert list(client._requested_coordinates) == [(7, 10.0), (8, 10.0), (9, 10.0)]
+        assert client._normalized_counts == {(7, 10.0): 1, (8, 10.0): 1, (9, 10.0): 1}
+
+    def test_params(self):
+        """Test invalid normalization parameters"""
+        with pytest.raises(ValueError, match="'precision' parameter must be"):
+            Locationforecast(HEADERS, precision=5)
+
+        with pytest.raises(ValueError, match="'grid_spacing' parameter must be"):
+            Locationforecast(HEADERS, grid_spacing=0)
+
+
+class TestObjectCache:
+    """Test the object cache of parsed forecasts"""
+
+    FRESH = {
+        **JSON_HEADERS,
+        "Expires": "Fri, 01 Jan 2100 00:00:00 GMT",
+        "Last-Modified": "Mon, 15 Jan 2024 12:00:00 GMT",
+    }
+    STALE = {**FRESH, "Expires": "Mon, 15 Jan 2024 12:00:00 GMT"}
+
+    def test_fresh(self, client: Locationforecast, standin, complete):
+        """Test that a fresh forecast is reused without a request"""
+        adapter = standin(client, lambda request: (200, self.FRESH, complete))
+
+        forecast = client.get_forecast(59.91, 10.75)
+        temperature = client.get_air_temperature(59.91, 10.75)
+        details = client.get_instant_data(59.91, 10.75)
+
+        assert len(adapter.requests) == 1
+        assert client.get_forecast(59.91, 10.75) is forecast
+        assert temperature == forecast.now().details.air_temperature
+        assert details == forecast.now().details
+        assert client.stats()["object_cache_hits"] == 3
+
+    def test_compact_from_complete(self, client: Locationforecast, standin, complete):
+        """Test that compact requests are answered by a fresh complete forecast"""
+        adapter = standin(client, lambda request: (200, self.FRESH, complete))
+
+        client.get_forecast(59.91, 10.75, "complete")
+        client.get_forecast(59.91, 10.75, "compact")
+
+        assert len(adapter.requests) == 1
+
+    def test_revalidation(self, client: Locationforecast, standin, complete):
+        """Test that an unchanged response reuses the parsed forecast"""
+        adapter = standin(client, lambda request: (200, self.STALE, complete))
+
+        first = client.get_forecast(59.91, 10.75)
+        second = client.get_forecast(59.91, 10.75)
+
+        assert len(adapter.requests) == 2
+        assert second is first
+        assert client.stats()["object_cache_revalidations"] == 1
+
+    def test_disabled(self, standin, complete):
+        """Test that an empty object cache disables it"""
+        client = Locationforecast(
+            HEADERS, use_cache=False, object_cache=ObjectCache(max_entries=0)
+        )
+        adapter = standin(client, lambda request: (200, self.FRESH, complete))
+
+        client.get_forecast(59.91, 10.75)
+        client.get_forecast(59.91, 10.75)
+
+        assert len(adapter.requests) == 2
+
+    def test_units(self, client: Locationforecast, standin, complete, monkeypatch):
+        """Test that units are kept once per process"""
+        monkeypatch.setattr("yr_weather.locationforecast._units", None)
+        adapter = standin(client, lambda request: (200, self.STALE, complete))
+
+        client.get_forecast(59.91, 10.75)
+        units = client.get_units()
+
+        assert len(adapter.requests) == 1
+        assert units == Forecast(json.loads(complete)).units
+        assert Locationforecast(HEADERS, use_cache=False).get_units() is units
+
+
+def test_max_steps(client: Locationforecast, standin, complete):
+    """Test retrieving a forecast with only the first steps decoded"""
+    standin(client, lambda request: (200, TestObjectCache.FRESH, complete))
+
+    forecast = client.get_forecast(59.91, 10.75, max_steps=24)
+
+    assert len(forecast._timeseries) == 24
+    assert forecast.units == Forecast(json.loads(complete)).units
+    # Partial forecasts don't answer later requests
+    assert len(client.get_forecast(59.91, 10.75)._timeseries) == 87
+
+    with pytest.raises(ValueError, match="'max_steps' parameter must be"):
+        client.get_forecast(59.91, 10.75, max_steps=0)
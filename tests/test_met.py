@@ -0,0 +1,114 @@
+"""Tests for yr_weather.met"""
+
+import pytest
+import requests
+from requests_cache import CachedSession
+
+from benchmarks.transport import serve_fixtures
+from yr_weather import MetClient, Locationforecast
+from yr_weather.cache import CacheConfig
+from yr_weather.instrumentation import InstrumentedAdapter
+from yr_weather.ratelimit import RateLimiter
+
+HEADERS = {"User-Agent": "testing/latest https://github.com/ZeroWave022/yr-weather"}
+
+
+@pytest.fixture(name="met")
+def fixture_met():
+    """A MetClient without an HTTP cache"""
+    with MetClient(HEADERS, use_cache=False) as met:
+        yield met
+
+
+def test_headers():
+    """Test that headers with a User-Agent are required"""
+    with pytest.raises(ValueError, match="A custom 'User-Agent' is required"):
+        MetClient({})
+
+    with pytest.raises(TypeError):
+        MetClient(None)  # type: ignore[arg-type]
+
+    with pytest.raises(ValueError, match="'pool_size'"):
+        MetClient(HEADERS, pool_size=0)
+
+
+def test_shared(met: MetClient):
+    """Test that the product clients share the session and the object cache"""
+    clients = [
+        met.locationforecast,
+        met.sunrise,
+        met.radar,
+        met.textforecast,
+        met.geosatellite,
+    ]
+
+    assert met.locationforecast is clients[0]
+    for client in clients:
+        assert client.session is met.session
+        assert client.session.headers == HEADERS
+    for client in clients[:4]:
+        assert client.object_cache is met.object_cache
+
+
+def test_session():
+    """Test the cache, pool size and rate limiter of the session"""
+    limiter = RateLimiter(rate=5)
+
+    with MetClient(
+        HEADERS,
+        use_cache=CacheConfig(backend="memory"),
+        pool_size=4,
+        rate_limiter=limiter,
+    ) as met:
+        adapter = met.session.get_adapter("https://api.met.no/weatherapi/")
+
+        assert isinstance(met.session, CachedSession)
+        assert isinstance(adapter, InstrumentedAdapter)
+        assert adapter.rate_limiter is limiter
+        assert adapter._pool_maxsize == 4  # pylint: disable=protected-access
+        assert met.locationforecast.rate_limiter is limiter
+
+    assert not isinstance(MetClient(HEADERS, use_cache=False).session, CachedSession)
+
+
+def test_one_pool(met: MetClient, standin):
+    """Test that requests of all products are sent through the same transport"""
+    adapter = standin(met.locationforecast, serve_fixtures)
+
+    met.locationforecast.get_forecast(59.91, 10.75)
+    met.sunrise.get_sun_events("2024-01-15", 59.91, 10.75)
+    met.radar.get_all_statuses()
+
+    assert len(adapter.requests) == 3
+    assert met.sunrise.stats()["endpoints"]["sunrise/3.0/sun"]["requests"] == 1
+
+
+def test_session_parameter(met: MetClient):
+    """Test that other clients can be created with the shared session"""
+    client = Locationforecast(HEADERS, session=met.session, precision=2)
+
+    assert client.session is met.session
+    assert isinstance(client.session, requests.Session)
+
+
+def test_toggle_cache():
+    """Test that a product client returns to the shared session when its cache is turned back on"""
+    with MetClient(HEADERS, use_cache=CacheConfig(backend="memory")) as met:
+        client = met.locationforecast
+        adapter = met.session.get_adapter("https://api.met.no/weatherapi/")
+
+        client.toggle_cache(False)
+        assert not isinstance(client.session, CachedSession)
+        assert client.session.get_adapter("https://api.met.no/weatherapi/") is adapter
+        assert client.session.headers == HEADERS
+
+        client.toggle_cache(True)
+        assert client.session is met.session
+
+
+def test_toggle_cache_uncached(met: MetClient):
+    """Test that the cache can't be turned on for a client sharing a session without one"""
+    with pytest.raises(ValueError, match="without a cache"):
+        met.locationforecast.toggle_cache(True)
+
+    assert met.locationforecast.session is met.session
@@ -0,0 +1,291 @@
+"""Tests for yr_weather.ratelimit"""
+
+import threading
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+
+from yr_weather import ratelimit
+from yr_weather.client import APIClient
+from yr_weather.ratelimit import (
+    RateLimit,
+    RateLimiter,
+    asks_to_wait,
+    default_limiter,
+    retry_delay,
+    set_default_limiter,
+)
+from yr_weather.retry import Deadline, DeadlineExceeded, RetryPolicy
+
+URL = "https://api.met.no/weatherapi/locationforecast/2.0/complete?lat=59.91&lon=10.75"
+
+
+def _http_date(seconds: float) -> str:
+    return format_datetime(
+        datetime.now(timezone.utc) + timedelta(seconds=seconds), usegmt=True
+    )
+
+
+@pytest.fixture(name="restore_default")
+def fixture_restore_default():
+    """Restore the shared limiter after a test replaces it."""
+    original = default_limiter()
+    yield
+    set_default_limiter(original)
+
+
+def test_limit_validation():
+    """Test that invalid limits are rejected"""
+    with pytest.raises(ValueError, match="'rate'"):
+        RateLimit(0)
+    with pytest.raises(ValueError, match="'burst'"):
+        RateLimit(5, burst=0)
+    with pytest.raises(ValueError, match="'max_retries'"):
+        RateLimiter(max_retries=-1)
+
+
+def test_burst():
+    """Test that requests beyond the burst wait for their token, in order"""
+    limiter = RateLimiter(rate=20, burst=2)
+
+    delays = [limiter.reserve(URL) for _ in range(4)]
+
+    assert delays[:2] == [0.0, 0.0]
+    assert delays[2] == pytest.approx(0.05, abs=0.01)
+    assert delays[3] == pytest.approx(0.1, abs=0.01)
+    assert limiter.stats()["waits"] == 2
+
+
+def test_hosts_and_products():
+    """Test limits by host and by product"""
+    limiter = RateLimiter(
+        rate=None,
+        hosts={"example.com": RateLimit(1)},
+        products={"locationforecast": RateLimit(1)},
+    )
+    sunrise = "https://api.met.no/weatherapi/sunrise/3.0/sun"
+
+    assert limiter.reserve(URL) == 0
+    assert limiter.reserve(URL) > 0.9
+    # Other products on the host aren't limited
+    assert limiter.reserve(sunrise) == 0
+    assert limiter.reserve(sunrise) == 0
+
+    assert limiter.reserve("https://example.com/a") == 0
+    assert limiter.reserve("https://example.com/b") > 0.9
+
+
+def test_acquire():
+    """Test that acquire() waits for the token"""
+    limiter = RateLimiter(rate=50, burst=1)
+
+    assert limiter.acquire(URL) == 0
+    waited = limiter.acquire(URL)
+
+    assert waited == pytest.approx(0.02, abs=0.01)
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({"Retry-After": "5"}, 5.0),
+        ({"Retry-After": "-1"}, 0.0),
+        ({"Retry-After": _http_date(-60)}, 0.0),
+        ({"Expires": _http_date(-60)}, None),
+        ({"Expires": "never"}, None),
+        ({}, None),
+    ],
+)
+def test_retry_delay(headers, expected):
+    """Test reading the delay from Retry-After and Expires headers"""
+    assert retry_delay(headers) == expected
+
+
+def test_retry_delay_dates():
+    """Test that dates are converted to seconds from now"""
+    assert retry_delay({"Retry-After": _http_date(30)}) == pytest.approx(30, abs=2)
+    assert retry_delay({"Expires": _http_date(30)}) == pytest.approx(30, abs=2)
+    # Retry-After takes precedence
+    assert retry_delay({"Retry-After": "1", "Expires": _http_date(30)}) == 1.0
+
+
+def test_throttle():
+    """Test that responses asking to wait pause their host"""
+    limiter = RateLimiter(rate=None, backoff=0.5)
+
+    assert limiter.throttle(URL, 200, {"Retry-After": "1"}) is None
+    assert limiter.throttle(URL, 503, {}) is None
+    assert limiter.throttle(URL, 429, {}, attempt=2) == 2.0
+    assert limiter.throttle(URL, 503, {"Retry-After": "0.1"}) == 0.1
+
+    assert limiter.reserve(URL) == pytest.approx(2.0, abs=0.05)
+    assert limiter.reserve("https://example.com/") == 0
+    assert limiter.stats()["throttled"] == 2
+
+
+def test_asks_to_wait():
+    """Test which responses are left to the rate limiter"""
+    assert asks_to_wait(429, {})
+    assert asks_to_wait(503, {"Retry-After": "1"})
+    assert not asks_to_wait(503, {})
+    assert not asks_to_wait(502, {"Retry-After": "1"})
+    assert not asks_to_wait(200, {})
+
+
+def test_acquire_deadline():
+    """Test that the limiter doesn't wait past a deadline"""
+    limiter = RateLimiter(rate=None)
+    limiter.throttle(URL, 429, {"Retry-After": "5"})
+
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        limiter.acquire(URL, Deadline(0.5))
+    assert time.monotonic() - start < 0.1
+
+    assert limiter.acquire("https://example.com/", Deadline(0.5)) == 0
+
+
+def test_aborted_acquire():
+    """Test that a wait given up because of a deadline doesn't delay the next request"""
+    limiter = RateLimiter(rate=1, burst=1)
+    limiter.acquire(URL)
+
+    with pytest.raises(DeadlineExceeded):
+        limiter.acquire(URL, Deadline(0.1))
+
+    # Without the aborted request, the next token is there after one second instead of two
+    assert limiter.reserve(URL) == pytest.approx(1.0, abs=0.05)
+    assert limiter.stats()["requests"] == 2
+
+
+@pytest.mark.usefixtures("restore_default")
+def test_default_limiter():
+    """Test that clients share the default limiter until they're given their own"""
+    shared = APIClient(use_cache=False)
+    own = APIClient(use_cache=False, rate_limiter=RateLimiter(rate=1))
+
+    assert shared.rate_limiter is default_limiter()
+    assert own.rate_limiter is not default_limiter()
+
+    replacement = RateLimiter(rate=5)
+    set_default_limiter(replacement)
+    assert shared.rate_limiter is replacement
+    assert ratelimit.default_limiter() is replacement
+
+    with pytest.raises(TypeError):
+        set_default_limiter(None)  # type: ignore[arg-type]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Number of requests answered with ``status`` before succeeding
+    limited = 0
+    status = 429
+    retry_after = "0.05"
+    received = 0
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Answer with 429 for the first requests, then with a small JSON body."""
+        cls = type(self)
+        cls.received += 1
+        if cls.received <= cls.limited:
+            self.send_response(cls.status)
+            self.send_header("Retry-After", cls.retry_after)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture(name="server")
+def fixture_server():
+    """A local server which answers with 429 for the first ``limited`` requests."""
+    handler = type("Handler", (_Handler,), {})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield handler, f"http://127.0.0.1:{server.server_address[1]}/weatherapi/test"
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_client_retries(server):
+    """Test that a client waits as asked by a 429 response, and sends the request again"""
+    handler, url = server
+    handler.limited = 2
+    limiter = RateLimiter(rate=None)
+    client = APIClient(use_cache=False, rate_limiter=limiter)
+    after = []
+    client.add_hook("after_request", after.append)
+
+    response = client._get(url)
+
+    assert response.status_code == 200
+    assert handler.received == 3
+    assert limiter.stats()["throttled"] == 2
+    assert after[0].phases["rate_limit"] >= 0.08
+    assert after[0].phases["transfer"] < after[0].phases["rate_limit"]
+    assert client.stats()["endpoints"]["test"]["rate_limit_seconds"] >= 0.08
+
+
+def test_client_gives_up(server):
+    """Test that the last response is returned when the retries are used up"""
+    handler, url = server
+    handler.limited = 10
+    client = APIClient(use_cache=False, rate_limiter=RateLimiter(max_retries=1))
+
+    response = client._get(url)
+
+    assert response.status_code == 429
+    assert handler.received == 2
+
+
+def test_client_deadline(server):
+    """Test that a long Retry-After isn't waited for past the deadline of the call"""
+    handler, url = server
+    handler.limited = 10
+    handler.retry_after = "4"
+    client = APIClient(
+        use_cache=False,
+        rate_limiter=RateLimiter(rate=None),
+        retry=RetryPolicy(deadline=1.0),
+    )
+    after = []
+    client.add_hook("after_request", after.append)
+
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        client._get(url)
+
+    assert time.monotonic() - start < 1.0
+    assert handler.received == 1
+    assert isinstance(after[0].error, DeadlineExceeded)
+
+
+def test_unavailable_retried_once(server):
+    """Test that a 503 asking to wait is sent again by the rate limiter only, not by the retry policy as well"""
+    handler, url = server
+    handler.limited = 10
+    handler.status = 503
+    client = APIClient(
+        use_cache=False,
+        rate_limiter=RateLimiter(rate=None, max_retries=1),
+        retry=RetryPolicy(attempts=3, backoff=0),
+    )
+
+    response = client._get(url)
+
+    assert response.status_code == 503
+    assert handler.received == 2
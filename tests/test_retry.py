@@ -0,0 +1,181 @@
+"""Tests for yr_weather.retry"""
+
+import time
+import pytest
+import requests
+
+from benchmarks.transport import StandInAdapter
+from yr_weather import Locationforecast
+from yr_weather.client import APIClient, decode_json
+from yr_weather.retry import Deadline, DeadlineExceeded, RetryPolicy
+
+HEADERS = {"User-Agent": "testing/latest https://github.com/ZeroWave022/yr-weather"}
+
+URL = "https://api.met.no/weatherapi/test"
+
+FAST = RetryPolicy(backoff=0.01, jitter=False)
+
+
+class _TimeoutAdapter(StandInAdapter):
+    """A stand-in adapter which also records the timeout of every request."""
+
+    def __init__(self, handler) -> None:
+        super().__init__(handler)
+        self.timeouts: list = []
+
+    def send(self, request, stream=False, timeout=None, **kwargs):
+        self.timeouts.append(timeout)
+        return super().send(request, stream=stream, timeout=timeout, **kwargs)
+
+
+def _responses(*outcomes):
+    """A handler answering with the outcomes in order, raising those which are exceptions."""
+    remaining = list(outcomes)
+
+    def handler(request):
+        outcome = remaining.pop(0) if len(remaining) > 1 else remaining[0]
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome, {}, b"[]"
+
+    return handler
+
+
+class TestPolicy:
+    """Test RetryPolicy and Deadline"""
+
+    def test_validation(self):
+        """Test that invalid policies are rejected"""
+        with pytest.raises(ValueError, match="'attempts'"):
+            RetryPolicy(attempts=0)
+        with pytest.raises(ValueError, match="'backoff'"):
+            RetryPolicy(backoff=-1)
+        with pytest.raises(ValueError, match="'deadline'"):
+            RetryPolicy(deadline=0)
+
+    def test_delay(self):
+        """Test that delays grow exponentially up to the maximum"""
+        policy = RetryPolicy(backoff=0.5, max_backoff=3, jitter=False)
+
+        assert [policy.delay(retry) for retry in range(5)] == [0.5, 1, 2, 3, 3]
+
+    def test_jitter(self):
+        """Test that jittered delays are spread up to the full delay"""
+        policy = RetryPolicy(backoff=1.0)
+        delays = [policy.delay(2) for _ in range(200)]
+
+        assert all(0 <= delay <= 4 for delay in delays)
+        assert len(set(delays)) > 1
+
+    def test_deadline_timeout(self):
+        """Test that timeouts are shortened to the time left"""
+        assert Deadline(None).timeout((3.05, 30)) == (3.05, 30)
+        assert Deadline(None).remaining() is None
+
+        timeout = Deadline(10).timeout((3.05, 30))
+        assert timeout[0] == 3.05
+        assert 9 < timeout[1] <= 10
+        assert Deadline(10).timeout(None) <= 10
+
+    def test_deadline_exceeded(self):
+        """Test that no attempt is started after the deadline"""
+        deadline = Deadline(0.01)
+        time.sleep(0.02)
+
+        assert deadline.expired
+        with pytest.raises(DeadlineExceeded):
+            deadline.timeout(5)
+
+        # It's handled like any other timeout
+        assert issubclass(DeadlineExceeded, requests.Timeout)
+
+
+class TestClient:
+    """Test retries of APIClient requests"""
+
+    def test_retries_statuses(self, standin):
+        """Test that transient errors are retried until a response succeeds"""
+        client = APIClient(use_cache=False, retry=FAST)
+        adapter = standin(client, _responses(503, 502, 200))
+        after = []
+        client.add_hook("after_request", after.append)
+
+        result = client._get(URL, decode=decode_json)
+
+        assert result == []
+        assert len(adapter.requests) == 3
+        assert client.stats()["retries"] == 2
+        assert after[0].attempts == 3
+        assert after[0].status_code == 200
+        assert after[0].phases["retry"] >= 0.03
+
+    def test_retries_exceptions(self, standin):
+        """Test that connection errors are retried"""
+        client = APIClient(use_cache=False, retry=FAST)
+        adapter = standin(client, _responses(requests.ConnectionError("reset"), 200))
+
+        assert client._get(URL).status_code == 200
+        assert len(adapter.requests) == 2
+
+    def test_attempts_used_up(self, standin):
+        """Test that the last response is returned when the attempts are used up"""
+        client = APIClient(use_cache=False, retry=FAST)
+        adapter = standin(client, _responses(504))
+
+        assert client._get(URL).status_code == 504
+        assert len(adapter.requests) == 3
+
+        adapter.handler = _responses(requests.Timeout("read timed out"))
+        with pytest.raises(requests.Timeout):
+            client._get(URL)
+        assert len(adapter.requests) == 6
+
+    def test_not_retried(self, standin):
+        """Test that other statuses and exceptions aren't retried"""
+        client = APIClient(use_cache=False, retry=FAST)
+        adapter = standin(client, _responses(500))
+
+        assert client._get(URL).status_code == 500
+
+        adapter.handler = _responses(ValueError("invalid"))
+        with pytest.raises(ValueError):
+            client._get(URL)
+
+        assert len(adapter.requests) == 2
+        assert "retries" not in client.stats()
+
+    def test_deadline_stops_retries(self, standin):
+        """Test that a retry isn't waited for if it would start after the deadline"""
+        policy = RetryPolicy(backoff=5, jitter=False, deadline=1)
+        client = APIClient(use_cache=False, retry=policy)
+        adapter = standin(client, _responses(503))
+
+        start = time.perf_counter()
+        assert client._get(URL).status_code == 503
+
+        assert time.perf_counter() - start < 1
+        assert len(adapter.requests) == 1
+
+    def test_timeouts(self):
+        """Test that every attempt has a timeout, shortened by the deadline"""
+        client = APIClient(
+            use_cache=False, retry=RetryPolicy(timeout=(2, 5), deadline=None)
+        )
+        adapter = _TimeoutAdapter(_responses(200))
+        client.session.mount("https://", adapter)
+
+        client._get(URL)
+        client._get(URL, timeout=60)
+        client._get(URL, deadline=1)
+
+        assert adapter.timeouts[0] == (2, 5)
+        assert adapter.timeouts[1] == 60
+        assert all(0 < timeout <= 1 for timeout in adapter.timeouts[2])
+
+    def test_error_status_raises(self, standin):
+        """Test that an unsuccessful forecast response raises an HTTPError instead of a decoding error"""
+        client = Locationforecast(HEADERS, use_cache=False, retry=FAST)
+        standin(client, _responses(503))
+
+        with pytest.raises(requests.HTTPError):
+            client.get_forecast(59.91, 10.75)
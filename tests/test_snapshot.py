@@ -0,0 +1,143 @@
+"""Tests for yr_weather.data.snapshot"""
+
+from datetime import datetime
+import json
+import pytest
+
+from yr_weather.data.locationforecast import Forecast
+
+pytest.importorskip("numpy")
+
+# pylint: disable-next=wrong-import-position
+from yr_weather.data.snapshot import ForecastSnapshot, SnapshotForecast, write_snapshot
+
+
+def _forecast(read_fixture, forecast_type: str, lat: float, lon: float) -> Forecast:
+    """Read a forecast fixture, moved to the given location."""
+    data = json.loads(read_fixture(f"locationforecast_{forecast_type}.json"))
+    data["geometry"]["coordinates"][:2] = [lon, lat]
+    return Forecast(data)
+
+
+def _steps(forecast: Forecast):
+    """All steps of a forecast."""
+    return forecast.between(datetime.min, datetime.max)
+
+
+def _symbol(future):
+    """The symbol code of a period, if it has one."""
+    return future.summary.symbol_code if future.summary else None
+
+
+@pytest.fixture(name="forecasts")
+def fixture_forecasts(read_fixture):
+    """Forecasts for two locations, one complete and one compact."""
+    return [
+        _forecast(read_fixture, "complete", 59.9133, 10.7389),
+        _forecast(read_fixture, "compact", 60.3913, 5.3221),
+    ]
+
+
+@pytest.fixture(name="snapshot")
+def fixture_snapshot(forecasts, tmp_path):
+    """A snapshot of the forecasts."""
+    path = tmp_path / "forecasts.snap"
+    write_snapshot(path, forecasts)
+
+    with ForecastSnapshot(path) as snapshot:
+        yield snapshot
+
+
+def test_locations(snapshot: ForecastSnapshot):
+    """Test the index of locations"""
+    assert len(snapshot) == 2
+    assert list(snapshot) == [(59.9133, 10.7389), (60.3913, 5.3221)]
+    assert (59.9133, 10.7389) in snapshot
+    assert (59.91330001, 10.7389) in snapshot
+    assert (59.0, 10.0) not in snapshot
+
+    with pytest.raises(KeyError):
+        snapshot.get(59.0, 10.0)
+
+
+def test_round_trip(snapshot: ForecastSnapshot, forecasts):
+    """Test that every step of the stored forecasts is read back unchanged"""
+    for original in forecasts:
+        lon, lat = original.geometry.coordinates[:2]
+        forecast = snapshot.get(lat, lon)
+
+        assert isinstance(forecast, SnapshotForecast)
+        assert forecast.type == original.type
+        assert forecast.updated_at == original.updated_at
+        assert forecast.units == original.units
+        assert forecast.geometry == original.geometry
+
+        times = _steps(original)
+        restored = _steps(forecast)
+        assert len(restored) == len(times)
+        for stored, time in zip(restored, times):
+            assert stored.time == time.time
+            assert stored.details == time.details
+            for period in ("next_hour", "next_6_hours", "next_12_hours"):
+                future, stored_future = getattr(time, period), getattr(stored, period)
+                assert stored_future.details == future.details
+                assert _symbol(stored_future) == _symbol(future)
+
+
+def test_queries(snapshot: ForecastSnapshot, forecasts):
+    """Test that a snapshot answers the same queries as the forecast it was made from"""
+    original = forecasts[0]
+    forecast = snapshot.get(59.9133, 10.7389)
+    time = datetime.fromisoformat(_steps(forecast)[5].time[:-1])
+
+    assert (
+        forecast.get_forecast_time(time).details
+        == original.get_forecast_time(time).details
+    )
+    assert forecast.now().time == original.now().time
+
+
+def test_closed(forecasts, tmp_path):
+    """Test that forecasts read from a snapshot can still be used after it's closed"""
+    path = tmp_path / "forecasts.snap"
+    write_snapshot(path, forecasts)
+    snapshot = ForecastSnapshot(path)
+    forecast = snapshot.get(59.9133, 10.7389)
+    first = _steps(forecast)[0]
+
+    snapshot.close()
+
+    assert len(snapshot) == 0
+    with pytest.raises(KeyError):
+        snapshot.get(59.9133, 10.7389)
+
+    assert forecast.now().time == forecasts[0].now().time
+    assert _steps(forecast)[0].details == first.details
+
+
+def test_compact(forecasts, read_fixture, tmp_path):
+    """Test that a snapshot is smaller than the responses it was made from"""
+    path = tmp_path / "forecasts.snap"
+    write_snapshot(path, forecasts)
+
+    responses = len(read_fixture("locationforecast_complete.json")) + len(
+        read_fixture("locationforecast_compact.json")
+    )
+    assert path.stat().st_size < responses / 2
+    # Nothing is left behind by the write
+    assert [file.name for file in tmp_path.iterdir()] == ["forecasts.snap"]
+
+
+def test_duplicate_location(forecasts, tmp_path):
+    """Test that two forecasts can't be stored for one location"""
+    with pytest.raises(ValueError, match="More than one forecast"):
+        write_snapshot(tmp_path / "forecasts.snap", [forecasts[0], forecasts[0]])
+
+
+def test_not_a_snapshot(read_fixture, tmp_path):
+    """Test that other files are rejected"""
+    path = tmp_path / "forecast.json"
+    path.write_bytes(read_fixture("locationforecast_complete.json"))
+
+    with pytest.raises(ValueError, match="not a forecast snapshot"):
+        ForecastSnapshot(path)
@@ -0,0 +1,203 @@
+"""Tests for yr_weather.data.structs"""
+
+import json
+from dataclasses import fields
+import pytest
+import requests
+
+msgspec = pytest.importorskip("msgspec")
+
+# pylint: disable=wrong-import-position
+from yr_weather import Locationforecast
+from yr_weather.data.locationforecast import (
+    Forecast,
+    ForecastTimeDetails,
+    ForecastFutureSummary,
+    ForecastFutureDetails,
+    ForecastUnits,
+)
+from yr_weather.data.sunrise import SunEvents, MoonEvents
+from yr_weather.data.structs import (
+    ForecastStruct,
+    ForecastTimeDetailsStruct,
+    ForecastFutureSummaryStruct,
+    ForecastFutureDetailsStruct,
+    ForecastUnitsStruct,
+    decode_forecast_struct,
+    decode_sun_events_struct,
+    decode_moon_events_struct,
+)
+
+HEADERS = {"User-Agent": "testing/latest https://github.com/ZeroWave022/yr-weather"}
+
+
+@pytest.fixture(name="complete", scope="module")
+def fixture_complete(read_fixture):
+    """A synthetic complete forecast response"""
+    return read_fixture("locationforecast_complete.json")
+
+
+@pytest.mark.parametrize(
+    "struct, dataclass",
+    [
+        (ForecastTimeDetailsStruct, ForecastTimeDetails),
+        (ForecastFutureSummaryStruct, ForecastFutureSummary),
+        (ForecastFutureDetailsStruct, ForecastFutureDetails),
+        (ForecastUnitsStruct, ForecastUnits),
+    ],
+)
+def test_same_fields(struct, dataclass):
+    """Test that the structs have the same fields as the data classes they mirror"""
+    assert struct.__struct_fields__ == tuple(f.name for f in fields(dataclass))
+
+
+class TestForecast:
+    """Test decode_forecast_struct()"""
+
+    @pytest.mark.parametrize("forecast_type", ["complete", "compact"])
+    def test_same_data(self, read_fixture, forecast_type: str):
+        """Test that the structs hold the same data as the data classes"""
+        body = read_fixture(f"locationforecast_{forecast_type}.json")
+        forecast = Forecast(json.loads(body))
+        struct = decode_forecast_struct(body)
+
+        assert struct.type == forecast.type
+        assert struct.geometry.coordinates == forecast.geometry.coordinates
+        assert struct.properties.meta.updated_at == forecast.updated_at
+        assert (
+            ForecastUnits(**msgspec.structs.asdict(struct.properties.meta.units))
+            == forecast.units
+        )
+
+        timeseries = struct.properties.timeseries
+        expected = forecast._timeseries  # pylint: disable=protected-access
+        assert len(timeseries) == len(expected)
+
+        for step, data in zip(timeseries, expected):
+            assert step.time == data["time"]
+            assert ForecastTimeDetails(
+                **msgspec.structs.asdict(step.data.instant.details)
+            ) == ForecastTimeDetails.create(data["data"]["instant"]["details"])
+
+            for period in ("next_1_hours", "next_6_hours", "next_12_hours"):
+                future = getattr(step.data, period)
+                if period not in data["data"]:
+                    assert future is None
+                    continue
+
+                assert ForecastFutureDetails(
+                    **msgspec.structs.asdict(future.details)
+                ) == ForecastFutureDetails.create(data["data"][period]["details"])
+                assert (
+                    future.summary.symbol_code
+                    == data["data"][period]["summary"]["symbol_code"]
+                )
+
+    def test_unknown_keys(self, complete):
+        """Test that keys the structs don't know are ignored"""
+        data = json.loads(complete)
+        data["properties"]["timeseries"][0]["data"]["instant"]["details"]["new"] = 1.0
+
+        struct = decode_forecast_struct(json.dumps(data))
+
+        assert struct == decode_forecast_struct(complete)
+
+    def test_immutable(self, complete):
+        """Test that structs can't be modified, as they may be shared"""
+        struct = decode_forecast_struct(complete)
+
+        with pytest.raises(AttributeError):
+            struct.type = "Point"  # type: ignore[misc]
+
+    def test_invalid_value(self, complete):
+        """Test that an invalid value is reported with its path"""
+        data = json.loads(complete)
+        data["properties"]["timeseries"][3]["data"]["instant"]["details"][
+            "air_temperature"
+        ] = "warm"
+
+        with pytest.raises(msgspec.ValidationError) as info:
+            decode_forecast_struct(json.dumps(data))
+
+        assert isinstance(info.value, ValueError)
+        assert "$.properties.timeseries[3].data.instant.details.air_temperature" in str(
+            info.value
+        )
+
+    def test_missing_field(self, complete):
+        """Test that a missing required field is reported with its path"""
+        data = json.loads(complete)
+        del data["properties"]["timeseries"][5]["time"]
+
+        with pytest.raises(msgspec.ValidationError, match="`time`") as info:
+            decode_forecast_struct(json.dumps(data))
+
+        assert "$.properties.timeseries[5]" in str(info.value)
+
+    def test_malformed(self):
+        """Test that malformed JSON is rejected"""
+        with pytest.raises(msgspec.DecodeError):
+            decode_forecast_struct(b'{"type": "Feature",')
+
+
+class TestEvents:
+    """Test decode_sun_events_struct() and decode_moon_events_struct()"""
+
+    def test_sun(self, read_fixture):
+        """Test that sun events hold the same data as SunEvents"""
+        body = read_fixture("sunrise_sun.json")
+        events = SunEvents(json.loads(body))
+        struct = decode_sun_events_struct(body)
+
+        assert struct.license_url == events.license_url
+        assert struct.when.interval == events.interval
+        assert struct.properties.sunrise.time == events.sunrise.time
+        assert struct.properties.sunset.azimuth == events.sunset.azimuth
+        assert (
+            struct.properties.solarnoon.disc_centre_elevation
+            == events.solarnoon.disc_centre_elevation
+        )
+        assert struct.properties.solarmidnight.visible == events.solarmidnight.visible
+
+    def test_moon(self, read_fixture):
+        """Test that moon events hold the same data as MoonEvents"""
+        body = read_fixture("sunrise_moon.json")
+        events = MoonEvents(json.loads(body))
+        struct = decode_moon_events_struct(body)
+
+        assert struct.properties.moonrise.time == events.moonrise.time
+        assert struct.properties.high_moon.visible == events.high_moon.visible
+        assert struct.properties.moonphase == events.moonphase
+
+    def test_wrong_body(self, read_fixture):
+        """Test that moon events aren't accepted as sun events"""
+        with pytest.raises(msgspec.ValidationError, match=r"\$\.properties\.body"):
+            decode_sun_events_struct(read_fixture("sunrise_moon.json"))
+
+
+class TestClient:
+    """Test Locationforecast.get_forecast_struct()"""
+
+    def test_get_forecast_struct(self, standin, complete):
+        """Test that the struct is decoded from the response, and cached separately from Forecast"""
+        client = Locationforecast(HEADERS, use_cache=False)
+        adapter = standin(
+            client,
+            lambda request: (200, {"Content-Type": "application/json"}, complete),
+        )
+
+        struct = client.get_forecast_struct(59.91, 10.75)
+        forecast = client.get_forecast(59.91, 10.75)
+
+        assert isinstance(struct, ForecastStruct)
+        assert isinstance(forecast, Forecast)
+        assert struct == decode_forecast_struct(complete)
+        assert len(adapter.requests) == 2
+
+    def test_unsuccessful(self, standin):
+        """Test that an unsuccessful response raises an HTTPError"""
+        client = Locationforecast(HEADERS, use_cache=False)
+        standin(client, lambda request: (500, {}, b"Internal Server Error"))
+
+        with pytest.raises(requests.HTTPError):
+            client.get_forecast_struct(59.91, 10.75)
@@ -0,0 +1,127 @@
+"""Stress tests of clients used by many threads, against a local stand-in server"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import pytest
+from requests_cache import CachedSession
+
+from benchmarks.transport import read_fixture
+from yr_weather import Locationforecast
+from yr_weather.cache import CacheConfig, ObjectCache
+from yr_weather.data.locationforecast import Forecast
+from yr_weather.ratelimit import RateLimiter
+
+THREADS = 200
+CALLS = 3
+
+HEADERS_A = {
+    "User-Agent": "testing/a https://github.com/ZeroWave022/yr-weather",
+    "X-Worker": "a",
+}
+HEADERS_B = {
+    "User-Agent": "testing/b https://github.com/ZeroWave022/yr-weather",
+    "X-Worker": "b",
+}
+VALID = {
+    (headers["User-Agent"], headers["X-Worker"]) for headers in (HEADERS_A, HEADERS_B)
+}
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = THREADS
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    body = b""
+    received: list = []
+    lock = threading.Lock()
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Answer with the forecast fixture, recording the headers of the request."""
+        with self.lock:
+            self.received.append(
+                (self.headers.get("User-Agent"), self.headers.get("X-Worker"))
+            )
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.send_header("Expires", "Fri, 01 Jan 2100 00:00:00 GMT")
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture(name="server")
+def fixture_server():
+    """A local server answering forecast requests"""
+    handler = type(
+        "Handler",
+        (_Handler,),
+        {"body": read_fixture("locationforecast_complete.json"), "received": []},
+    )
+    server = _Server(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield handler, f"http://127.0.0.1:{server.server_address[1]}/weatherapi/"
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_many_threads(server, tmp_path):
+    """Test hundreds of threads fetching forecasts while the headers and cache are switched"""
+    handler, base_url = server
+    client = Locationforecast(
+        HEADERS_A,
+        use_cache=CacheConfig(location=tmp_path / "cache"),
+        pool_size=16,
+        # Every call is answered by the HTTP cache or the server
+        object_cache=ObjectCache(max_entries=0),
+        rate_limiter=RateLimiter(rate=None),
+        thread_safe=True,
+    )
+    client._base_url = base_url + "locationforecast/2.0/"
+    points = [(59.0 + i / 100, 10.0) for i in range(40)]
+
+    barrier = threading.Barrier(THREADS)
+    errors = []
+
+    def work(index: int) -> None:
+        try:
+            barrier.wait()
+            for call in range(CALLS):
+                if index % 20 == 0:
+                    client.set_headers(HEADERS_A if call % 2 else HEADERS_B)
+                if index % 50 == 1:
+                    client.toggle_cache(call % 2 == 1)
+
+                lat, lon = points[(index + call) % len(points)]
+                assert isinstance(client.get_forecast(lat, lon), Forecast)
+        except Exception as exc:  # pylint: disable=broad-except
+            errors.append(exc)
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=60)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert not errors
+    assert handler.received
+    # No request was sent with a mix of both header sets
+    assert set(handler.received) <= VALID
+
+    # The HTTP cache is intact, and every stored response can be read
+    client.toggle_cache(True)
+    assert isinstance(client.session, CachedSession)
+    responses = client.session.cache.responses
+    assert 0 < len(responses) <= len(points)
+    for key in responses:
+        assert responses[key].status_code == 200
@@ -5,11 +5,69 @@ Please visit the docs to learn more:
 https://yr-weather.readthedocs.io/en/latest/
 """
 
-from .locationforecast import Locationforecast
-from .radar import Radar
-from .textforecast import Textforecast
-from .sunrise import Sunrise
-from .geosatellite import Geosatellite
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .locationforecast import Locationforecast
+    from .radar import Radar
+    from .textforecast import Textforecast
+    from .sunrise import Sunrise
+    from .geosatellite import Geosatellite
+    from .met import MetClient
 
 __version__ = "0.4.0"
 __author__ = "ZeroWave022"
+
+# The module of every client. A module is imported when its client is first used,
+# so importing yr_weather doesn't import the dependencies of products which aren't used.
+_CLIENTS = {
+    "Locationforecast": "locationforecast",
+    "Radar": "radar",
+    "Textforecast": "textforecast",
+    "Sunrise": "sunrise",
+    "Geosatellite": "geosatellite",
+    "MetClient": "met",
+}
+
+__all__ = list(_CLIENTS)
+
+# Submodules, which are imported when they're used as attributes of the package
+_SUBMODULES = frozenset(
+    {
+        "aio",
+        "api_types",
+        "cache",
+        "client",
+        "data",
+        "decoding",
+        "geosatellite",
+        "instrumentation",
+        "locationforecast",
+        "met",
+        "radar",
+        "ratelimit",
+        "retry",
+        "sunrise",
+        "textforecast",
+    }
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        # Importing a submodule also makes it an attribute of the package
+        return importlib.import_module(f".{name}", __name__)
+    if name not in _CLIENTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Unlike importlib.import_module(), __import__() is reported by "python -X importtime"
+    module = __import__(_CLIENTS[name], globals(), fromlist=[name], level=1)
+    value = getattr(module, name)
+    # Later lookups find the client without calling this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,243 @@
+"""Wrappers of the response storages of requests-cache, used by :meth:`.CacheConfig.create_session`.
+
+They're in a module of their own, so requests-cache is only imported once a cache is used.
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from requests_cache import CachedResponse
+from requests_cache.backends import (
+    BaseCache,
+    FileCache,
+    FileDict,
+    SQLiteCache,
+    SQLiteDict,
+)
+from requests_cache.backends.base import BaseStorage
+
+from .cache import _product, _timestamp
+
+
+class _BoundedStorage(BaseStorage):
+    """A wrapper of a response storage which limits its size, and overrides expiry times by product.
+
+    The size and expiry time of every stored response is tracked in memory,
+    so evicting a response doesn't require reading the others from the storage.
+    With an ``index``, they're also persisted next to the responses, so a new session learns them
+    without reading the stored responses.
+    """
+
+    def __init__(
+        self,
+        storage: BaseStorage,
+        max_bytes: Optional[int],
+        eviction: str,
+        expire_after: Dict[str, timedelta],
+        index: Optional[BaseStorage] = None,
+    ) -> None:
+        super().__init__()
+        self.serializer = None
+
+        self.storage = storage
+        self.max_bytes = max_bytes
+        self.eviction = eviction
+        self.expire_after = expire_after
+        self.index = index
+
+        self._lock = threading.RLock()
+        # Key to (size, expiry timestamp), in order of last use
+        self._entries: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+        self._bytes = 0
+
+        # Index responses stored by earlier runs, the oldest as least recently used
+        stored = []
+        indexed = dict(index.items()) if index is not None else {}
+        for key in list(storage):
+            if key in indexed:
+                size, expires, created = indexed.pop(key).split()
+                stored.append((float(created), key, int(size), float(expires)))
+                continue
+
+            # Only responses stored without an index are read
+            response = storage.get(key)
+            if response is not None:
+                created_at = _timestamp(response.created_at)
+                stored.append(
+                    (created_at, key, response.size, _timestamp(response.expires))
+                )
+                self._write_index(
+                    key, response.size, _timestamp(response.expires), created_at
+                )
+
+        # Entries of responses which were deleted without the index
+        for key in indexed:
+            self._delete_index(key)
+
+        stored.sort()
+        for _, key, size, expires in stored:
+            self._entries[key] = (size, expires)
+            self._bytes += size
+        self._evict()
+
+    def _write_index(self, key: str, size: int, expires: float, created: float) -> None:
+        if self.index is not None:
+            self.index[key] = f"{size} {expires} {created}"
+
+    def _delete_index(self, key: str) -> None:
+        if self.index is not None:
+            try:
+                del self.index[key]
+            except KeyError:
+                pass
+
+    def __getattr__(self, name: str):
+        # Backend specific attributes, like the lock of the filesystem storage
+        if name == "storage":
+            raise AttributeError(name)
+        return getattr(self.storage, name)
+
+    def _track(self, key: str, response: CachedResponse) -> None:
+        self._untrack(key)
+        size = response.size
+        expires = _timestamp(response.expires)
+        self._entries[key] = (size, expires)
+        self._bytes += size
+        self._write_index(key, size, expires, _timestamp(response.created_at))
+
+    def _untrack(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[0]
+            self._delete_index(key)
+
+    def _evict(self) -> None:
+        """Delete responses until the total size is within the limit."""
+        if self.max_bytes is None:
+            return
+
+        while self._bytes > self.max_bytes and self._entries:
+            if self.eviction == "lru":
+                key = next(iter(self._entries))
+            else:
+                # Expired responses have the earliest expiry times, so they are evicted first
+                key = min(self._entries, key=lambda k: self._entries[k][1])
+
+            self._untrack(key)
+            try:
+                del self.storage[key]
+            except KeyError:
+                pass
+
+    def __getitem__(self, key: str) -> CachedResponse:
+        response = self.storage[key]
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        return response
+
+    def __setitem__(self, key: str, response: CachedResponse) -> None:
+        ttl = self.expire_after.get(_product(response.url or ""))
+        if ttl is not None:
+            response.expires = response.created_at + ttl
+
+        self.storage[key] = response
+        with self._lock:
+            self._track(key, response)
+            self._evict()
+
+    def __delitem__(self, key: str) -> None:
+        del self.storage[key]
+        with self._lock:
+            self._untrack(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.storage)
+
+    def __len__(self) -> int:
+        return len(self.storage)
+
+    def clear(self) -> None:
+        self.storage.clear()
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            if self.index is not None:
+                self.index.clear()
+
+    def close(self) -> None:
+        self.storage.close()
+        if self.index is not None:
+            self.index.close()
+
+    @property
+    def total_bytes(self) -> int:
+        """The total size of the stored response bodies, in bytes."""
+        return self._bytes
+
+
+def _index_storage(backend: BaseCache) -> Optional[BaseStorage]:
+    """A storage persisting the index of a :class:`_BoundedStorage` in the same place as the responses.
+
+    The index is a table in the same database for the sqlite backend, and a directory of small files
+    in the cache directory for the filesystem backend. The memory backend needs no index.
+    """
+    if isinstance(backend, SQLiteCache):
+        return SQLiteDict(
+            backend.responses.db_path, table_name="yr_weather_index", serializer=None
+        )
+    if isinstance(backend, FileCache):
+        return FileDict(
+            backend.responses.cache_dir / "yr_weather_index", serializer=None
+        )
+    return None
+
+
+class _LockedStorage(BaseStorage):
+    """A wrapper of a storage which serializes all access to it with a lock.
+
+    The sqlite backend shares one connection between threads, and only serializes writes.
+    """
+
+    def __init__(self, storage: BaseStorage) -> None:
+        super().__init__()
+        self.serializer = None
+
+        self.storage = storage
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name: str):
+        if name == "storage":
+            raise AttributeError(name)
+        return getattr(self.storage, name)
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            return self.storage[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        with self._lock:
+            self.storage[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            del self.storage[key]
+
+    def __iter__(self) -> Iterator[str]:
+        # A snapshot, as the storage may change while the keys are iterated
+        with self._lock:
+            return iter(list(self.storage))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self.storage)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.storage.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            self.storage.close()
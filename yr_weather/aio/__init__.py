@@ -0,0 +1,57 @@
+"""Asynchronous clients for the MET API, built on :mod:`aiohttp`.
+
+aiohttp is an optional dependency, install it with ``pip install yr-weather[async]``.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .client import AsyncAPIClient
+    from .locationforecast import AsyncLocationforecast
+    from .radar import AsyncRadar
+    from .textforecast import AsyncTextforecast
+    from .sunrise import AsyncSunrise
+    from .geosatellite import AsyncGeosatellite
+
+# The module of every client, imported when the client is first used, like in yr_weather
+_CLIENTS = {
+    "AsyncAPIClient": "client",
+    "AsyncLocationforecast": "locationforecast",
+    "AsyncRadar": "radar",
+    "AsyncTextforecast": "textforecast",
+    "AsyncSunrise": "sunrise",
+    "AsyncGeosatellite": "geosatellite",
+}
+
+__all__ = list(_CLIENTS)
+
+# Submodules, which are imported when they're used as attributes of the package
+_SUBMODULES = frozenset(
+    {
+        "client",
+        "geosatellite",
+        "locationforecast",
+        "radar",
+        "sunrise",
+        "textforecast",
+    }
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        # Importing a submodule also makes it an attribute of the package
+        return importlib.import_module(f".{name}", __name__)
+    if name not in _CLIENTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Unlike importlib.import_module(), __import__() is reported by "python -X importtime"
+    module = __import__(_CLIENTS[name], globals(), fromlist=[name], level=1)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,136 @@
+"""A module for the asynchronous API client which other async clients depend on."""
+
+import asyncio
+from typing import Any, Optional, Dict
+
+try:
+    import aiohttp
+except ImportError as exc:
+    raise ImportError(
+        "The async clients require aiohttp. Install it with 'pip install yr-weather[async]'."
+    ) from exc
+
+from ..decoding import loads
+from ..ratelimit import RateLimiter, default_limiter
+
+DEFAULT_POOL_SIZE = 100
+
+
+class AsyncAPIClient:
+    """A base asynchronous API client other async clients inherit.
+
+    All requests are sent through one :class:`aiohttp.ClientSession`, with a keep-alive connection pool
+    of at most ``pool_size`` connections. The session is created on first use, inside the running event loop.
+    Several clients can share one pool by passing the same ``session``.
+
+    The client must be closed with :meth:`close` when it's no longer used,
+    or be used as an async context manager::
+
+        async with AsyncLocationforecast(headers) as client:
+            forecast = await client.get_forecast(59.91, 10.75)
+
+    Requests wait for ``rate_limiter``, or for the :class:`.RateLimiter` shared by all clients if it's None,
+    so async and sync clients stay within the same limits. See :mod:`yr_weather.ratelimit`.
+    """
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        session: Optional[aiohttp.ClientSession] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        if headers is not None and not isinstance(headers, dict):
+            raise TypeError("The 'headers' parameter must be of type 'dict' or None.")
+
+        self._base_url = "https://api.met.no/weatherapi/"
+        self._global_headers = headers
+        self._pool_size = pool_size
+        self._session = session
+        # A session passed in by the caller is shared, and is closed by them
+        self._owns_session = session is None
+        self._rate_limiter = rate_limiter
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The :class:`aiohttp.ClientSession` used by this client."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self._pool_size)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._owns_session = True
+
+        return self._session
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """The :class:`.RateLimiter` requests of this client wait for."""
+        if self._rate_limiter is not None:
+            return self._rate_limiter
+        return default_limiter()
+
+    def set_headers(self, headers: dict) -> dict:
+        """Set new headers of the client.
+
+        This will override any old headers, and replace them with the new headers from the ``headers`` parameter.
+
+        Parameters
+        ----------
+        headers: :class:`dict`
+            The new headers, which will override the old ones.
+
+        Returns
+        -------
+        :class:`dict`
+            The headers which were set.
+        """
+        if not isinstance(headers, dict):
+            raise TypeError("The 'headers' parameter must be of type 'dict'.")
+
+        self._global_headers = headers
+        return headers
+
+    async def close(self) -> None:
+        """Close the connection pool of this client, if it was created by the client."""
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _get(self, url: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+        """Send a GET request and return the body of the response.
+
+        Raises :class:`aiohttp.ClientResponseError` for unsuccessful responses.
+        Responses asking the client to wait are retried, as allowed by the client's rate limiter.
+        """
+        if params is not None:
+            # aiohttp doesn't allow None values, which requests leaves out
+            params = {key: value for key, value in params.items() if value is not None}
+
+        limiter = self.rate_limiter
+        attempt = 0
+        while True:
+            delay = limiter.reserve(url)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            async with self.session.get(
+                url, params=params, headers=self._global_headers
+            ) as response:
+                if attempt < limiter.max_retries and (
+                    limiter.throttle(url, response.status, response.headers, attempt)
+                    is not None
+                ):
+                    attempt += 1
+                    continue
+
+                response.raise_for_status()
+                return await response.read()
+
+    async def _get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Send a GET request and decode the JSON body of the response."""
+        body = await self._get(url, params)
+        return loads(body)
@@ -0,0 +1,57 @@
+"""A module with the asynchronous client for the MET Geosatellite API."""
+
+from typing import Optional, Literal, Dict
+
+import aiohttp
+
+from .client import AsyncAPIClient, DEFAULT_POOL_SIZE
+from ..geosatellite import _image_query
+from ..api_types.geosatellite import SatArea
+from ..ratelimit import RateLimiter
+
+
+class AsyncGeosatellite(AsyncAPIClient):
+    """An asynchronous client for interacting with the MET Geosatellite API.
+
+    This is the asynchronous counterpart of :class:`yr_weather.Geosatellite`.
+    """
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        session: Optional[aiohttp.ClientSession] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        super().__init__(headers, pool_size, session, rate_limiter)
+
+        self._base_url += "geosatellite/1.4/"
+
+    async def get_image(
+        self,
+        area: SatArea = "europe",
+        img_type: Literal["infrared", "visible"] = "infrared",
+        time: Optional[str] = None,
+        size: Literal["normal", "small"] = "normal",
+    ) -> bytes:
+        """Get a geosatellite image.
+
+        Parameters
+        ----------
+        area: :data:`.SatArea`
+            Optional: The area for the image. Must be a valid :data:`.SatArea`. Default is ``"europe"``.
+        img_type: Literal["infrared", "visible"]
+            Optional: The image type. Either "infrared" or "visible". Default is ``"infrared"``.
+        time: :class:`str`
+            Optional: The time formatted as described in MET.no's documentation. Default is :class:`None`.
+        size: Literal["normal, small"]
+            Optional: Image resolution. Either "normal" or "small" for thumbnails. Default is ``"normal"``.
+
+        Returns
+        -------
+        :class:`bytes`
+            The image.
+        """
+        url = self._base_url + _image_query(area, img_type, time, size)
+
+        return await self._get(url)
@@ -0,0 +1,236 @@
+"""A module with the asynchronous client for the Locationforecast API."""
+
+import asyncio
+from typing import Optional, Literal, Dict, Iterable, AsyncIterator, Tuple
+
+import aiohttp
+
+from .client import AsyncAPIClient, DEFAULT_POOL_SIZE
+from ..locationforecast import (
+    _ensure_valid_forecast_type,
+    _ensure_valid_normalization,
+    _forecast_path,
+    _normalize_coordinates,
+)
+from ..decoding import decode_forecast
+from ..data.locationforecast import (
+    Forecast,
+    ForecastTimeDetails,
+    ForecastUnits,
+    ForecastResult,
+)
+from ..api_types.locationforecast import APIForecast
+from ..ratelimit import RateLimiter
+
+
+class AsyncLocationforecast(AsyncAPIClient):
+    """An asynchronous client for interacting with the MET Locationforecast API.
+
+    This is the asynchronous counterpart of :class:`yr_weather.Locationforecast`, returning the same data classes.
+
+    It must be initialized with a ``headers`` dict, which at least includes a User-Agent.
+    Coordinates are normalized with ``precision`` and ``grid_spacing`` like the synchronous client does,
+    so both clients send the same requests for the same location.
+    """
+
+    def __init__(
+        self,
+        headers: Dict[str, str],
+        pool_size: int = DEFAULT_POOL_SIZE,
+        session: Optional[aiohttp.ClientSession] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        precision: int = 4,
+        grid_spacing: Optional[float] = None,
+    ) -> None:
+        header_keys = [key.lower() for key in headers]
+        if "user-agent" not in header_keys:
+            raise ValueError("A custom 'User-Agent' is required in the 'headers' dict.")
+
+        _ensure_valid_normalization(precision, grid_spacing)
+
+        super().__init__(headers, pool_size, session, rate_limiter)
+
+        self._base_url += "locationforecast/2.0/"
+        self._precision = precision
+        self._grid_spacing = grid_spacing
+
+    def normalize_coordinates(self, lat: float, lon: float) -> Tuple[float, float]:
+        """Normalize coordinates the way this client does before requesting a forecast.
+
+        See :meth:`yr_weather.Locationforecast.normalize_coordinates`.
+
+        Parameters
+        ----------
+        lat: :class:`float` | :class:`int`
+            The latitude of the location.
+        lon: :class:`float` | :class:`int`
+            The longitude of the location.
+
+        Returns
+        -------
+        tuple[:class:`float`, :class:`float`]
+            The normalized latitude and longitude.
+        """
+        return _normalize_coordinates(lat, lon, self._precision, self._grid_spacing)
+
+    def set_headers(self, headers: dict) -> dict:
+        header_keys = [key.lower() for key in headers]
+        if "user-agent" not in header_keys:
+            raise ValueError("A custom 'User-Agent' is required in the 'headers' dict.")
+
+        return super().set_headers(headers)
+
+    async def get_forecast(
+        self,
+        lat: float,
+        lon: float,
+        forecast_type: Literal["complete", "compact"] = "complete",
+        max_steps: Optional[int] = None,
+    ) -> Forecast:
+        """Retrieve a complete or compact forecast for a selected location.
+
+        Parameters
+        ----------
+        lat: :class:`float` | :class:`int`
+            The latitude of the location.
+        lon: :class:`float` | :class:`int`
+            The longitude of the location.
+        forecast_type: Literal["complete", "compact"]
+            Optional: Specify the type of forecast, either ``"complete"`` or ``"compact"``.
+            Default is ``"complete"``.
+        max_steps: Optional[:class:`int`]
+            Optional: Only decode the first ``max_steps`` steps of the timeseries.
+            See :meth:`yr_weather.Locationforecast.get_forecast`.
+
+        Returns
+        -------
+        :class:`.Forecast`
+            An instance of :class:`.Forecast` with helper functions and values from the API.
+        """
+        lat, lon = self.normalize_coordinates(lat, lon)
+        url = self._base_url + _forecast_path(forecast_type, lat, lon)
+
+        body = await self._get(url)
+
+        return Forecast(decode_forecast(body, max_steps))
+
+    async def get_forecasts(
+        self,
+        points: Iterable[Tuple[float, float]],
+        forecast_type: Literal["complete", "compact"] = "complete",
+        max_concurrency: int = 50,
+    ) -> AsyncIterator[ForecastResult]:
+        """Retrieve forecasts for many locations concurrently.
+
+        At most ``max_concurrency`` requests are in flight at the same time.
+        Results are yielded as soon as each of them completes, so the order may differ from ``points``.
+        Errors are captured per location, so one failing location does not stop the others.
+
+        Parameters
+        ----------
+        points: Iterable[tuple[:class:`float`, :class:`float`]]
+            The (latitude, longitude) pairs to get forecasts for.
+        forecast_type: Literal["complete", "compact"]
+            Optional: Specify the type of forecast, either ``"complete"`` or ``"compact"``.
+            Default is ``"complete"``.
+        max_concurrency: :class:`int`
+            Optional: The maximum number of forecasts fetched at the same time. Default is ``50``.
+
+        Returns
+        -------
+        AsyncIterator[:class:`.ForecastResult`]
+            The result for every location, with either a forecast or an error.
+        """
+        _ensure_valid_forecast_type(forecast_type)
+
+        if max_concurrency < 1:
+            raise ValueError("The 'max_concurrency' parameter must be at least 1.")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(point: Tuple[float, float]) -> ForecastResult:
+            async with semaphore:
+                try:
+                    forecast = await self.get_forecast(*point, forecast_type)
+                except Exception as exc:  # pylint: disable=broad-exception-caught
+                    return ForecastResult(point, error=exc)
+                return ForecastResult(point, forecast=forecast)
+
+        tasks = [asyncio.ensure_future(fetch(point)) for point in points]
+
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def get_air_temperature(
+        self, lat: float, lon: float, altitude: Optional[int] = None
+    ) -> Optional[float]:
+        """Retrieve the air temperature at a given location.
+
+        This function returns the latest data available, meaning it provides the current air temperature.
+
+        Parameters
+        ----------
+        lat: :class:`float` | :class:`int`
+            The latitude of the location.
+        lon: :class:`float` | :class:`int`
+            The longitude of the location.
+        altitude: Optional[:class:`int`]
+            The altitude of the location, given in whole meters.
+
+        Returns
+        -------
+        :class:`float`
+            The air temperature, given in the current scale used by the Yr Locationforecast API (this is usually degrees Celsius).
+        """
+        lat, lon = self.normalize_coordinates(lat, lon)
+        url = self._base_url + _forecast_path("compact", lat, lon, altitude)
+
+        data: APIForecast = await self._get_json(url)
+
+        return Forecast(data).now().details.air_temperature
+
+    async def get_instant_data(
+        self, lat: float, lon: float, altitude: Optional[int] = None
+    ) -> ForecastTimeDetails:
+        """Retrieve current weather information about a location.
+
+        This includes air pressure, temperature, humidity, wind and more.
+
+        Parameters
+        ----------
+        lat: :class:`float` | :class:`int`
+            The latitude of the location.
+        lon: :class:`float` | :class:`int`
+            The longitude of the location.
+        altitude: Optional[:class:`int`]
+            The altitude of the location, given in whole meters.
+
+        Returns
+        -------
+        :class:`.ForecastTimeDetails`
+            A dataclass with info received from the API.
+        """
+        lat, lon = self.normalize_coordinates(lat, lon)
+        url = self._base_url + _forecast_path("complete", lat, lon, altitude)
+
+        data: APIForecast = await self._get_json(url)
+
+        return Forecast(data).now().details
+
+    async def get_units(self) -> ForecastUnits:
+        """Retrieve a list of units used by the MET Locationforecast API.
+
+        Returns
+        -------
+        :class:`.ForecastUnits`
+            A dataclass with units currently used.
+        """
+        data: APIForecast = await self._get_json(
+            self._base_url + "complete?lat=0&lon=0"
+        )
+
+        return Forecast(data).units
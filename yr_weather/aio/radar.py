@@ -0,0 +1,119 @@
+"""A module with the asynchronous client for the Radar API."""
+
+from typing import Optional, Dict
+
+import aiohttp
+
+from .client import AsyncAPIClient, DEFAULT_POOL_SIZE
+from ..radar import (
+    _radar_query,
+    _parse_radar_options,
+    _parse_radar_global_status,
+    _find_radar_status,
+)
+from ..data.radar import RadarOptions, RadarGlobalStatus, RadarStatus
+from ..api_types.radar import RadarContentType
+from ..ratelimit import RateLimiter
+
+
+class AsyncRadar(AsyncAPIClient):
+    """An asynchronous client for interacting with the MET Radar API.
+
+    This is the asynchronous counterpart of :class:`yr_weather.Radar`, returning the same data classes.
+    """
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        session: Optional[aiohttp.ClientSession] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        super().__init__(headers, pool_size, session, rate_limiter)
+
+        self._base_url += "radar/2.0/"
+
+    async def get_radar(
+        self,
+        area: str,
+        radar_type: str,
+        content: RadarContentType = "image",
+        time: Optional[str] = None,
+    ) -> bytes:
+        """Get a radar image (png) or animation (gif).
+
+        For more information about what arguments are valid, please see:
+        https://api.met.no/weatherapi/radar/2.0/documentation
+
+        Parameters
+        ----------
+        area: :data:`.RadarArea`
+            A string of one the of the possible values for area, based on valid MET Radar API literals.
+        radar_type: :data:`.RadarType`
+            A string of one of the possible values for type, based on valid MET Radar API literals.
+        content: :data:`.RadarContentType`
+            Optional: Either the string "image" or "animation", based on the desired result from the API. Default is ``"image"``.
+        time: Optional[:class:`str`]
+            An optional string containing the time when the image was taken, provided in ISO 8601 format. Default is None.
+
+        Returns
+        -------
+        :class:`bytes`
+            The image or animation.
+        """
+        url = self._base_url + _radar_query(area, radar_type, content, time)
+
+        return await self._get(url)
+
+    async def get_available_radars(self) -> RadarOptions:
+        """Get available types of radars.
+
+        This function retrieves all types of radars, as well as which areas they are available in.
+        The dataclass returned also includes available types of content (image or animation).
+
+        Returns
+        -------
+        :class:`.RadarOptions`
+            A dataclass with available radars and additional info.
+        """
+        options = await self._get_json(self._base_url + "radaroptions")
+
+        return _parse_radar_options(options)
+
+    async def get_all_statuses(self) -> RadarGlobalStatus:
+        """Get the operational status of all radars.
+
+        Returns
+        -------
+        :class:`.RadarGlobalStatus`
+            A dataclass with statuses of radars.
+        """
+        status = await self._get_json(self._base_url + "status")
+
+        return _parse_radar_global_status(status)
+
+    async def get_status(
+        self, area: Optional[str] = None, sitename: Optional[str] = None
+    ) -> Optional[RadarStatus]:
+        """Get the operational status of a single radar.
+
+        Either ``area`` or ``sitename`` must be used to find a radar.
+
+        Parameters
+        ----------
+        area: Optional[:class:`str`]
+            The name of the area of the radar to search for.
+        sitename: Optional[:class:`str`]
+            The sitename of the radar to search for.
+
+        Returns
+        -------
+        Optional[:class:`.RadarStatus`]
+            A dataclass with radar status. Can be None if no radar is found.
+        """
+        if not area and not sitename:
+            raise ValueError("Neither an area or a sitename was specified.")
+
+        status = await self._get_json(self._base_url + "status")
+
+        return _find_radar_status(_parse_radar_global_status(status), area, sitename)
@@ -0,0 +1,97 @@
+"""A module with the asynchronous client for the Sunrise API."""
+
+from typing import Optional, Dict
+
+import aiohttp
+
+from .client import AsyncAPIClient, DEFAULT_POOL_SIZE
+from ..sunrise import _events_params
+from ..data.sunrise import SunEvents, MoonEvents
+from ..api_types.sunrise import APISunData, APIMoonData
+from ..ratelimit import RateLimiter
+
+
+class AsyncSunrise(AsyncAPIClient):
+    """An asynchronous client for interacting with the Yr Sunrise API.
+
+    This is the asynchronous counterpart of :class:`yr_weather.Sunrise`, returning the same data classes.
+    """
+
+    def __init__(
+        self,
+        headers: Dict[str, str],
+        pool_size: int = DEFAULT_POOL_SIZE,
+        session: Optional[aiohttp.ClientSession] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        header_keys = [key.lower() for key in headers]
+        if "user-agent" not in header_keys:
+            raise ValueError("A custom 'User-Agent' is required in the 'headers' dict.")
+
+        super().__init__(headers, pool_size, session, rate_limiter)
+
+        self._base_url += "sunrise/3.0/"
+
+    async def get_sun_events(
+        self,
+        date: str,
+        lat: float,
+        lon: float,
+        offset: Optional[str] = None,
+    ) -> SunEvents:
+        """Get sun events data (sunrise, sunset, etc).
+
+        For more information, please see: https://api.met.no/weatherapi/sunrise/3.0/documentation
+
+        Parameters
+        ----------
+        date: :class:`str`
+            A date formatted in ISO 8601 format, like so: `YYYY-MM-DD`.
+        lat: :class:`float` | :class:`int`
+            The latitude of the location.
+        lon: :class:`float` | :class:`int`
+            The longitude of the location.
+        offset: Optional[:class:`str`]
+            The timezone offset, given in the following format: `+HH:MM` or `-HH:MM`.
+
+        Returns
+        -------
+        :class:`.SunEvents`
+        """
+        params = _events_params(date, lat, lon, offset)
+
+        data: APISunData = await self._get_json(self._base_url + "sun", params)
+
+        return SunEvents(data)
+
+    async def get_moon_events(
+        self,
+        date: str,
+        lat: float,
+        lon: float,
+        offset: Optional[str] = None,
+    ) -> MoonEvents:
+        """Get moon events data (moonrise, moonset, etc).
+
+        For more information, please see: https://api.met.no/weatherapi/sunrise/3.0/documentation
+
+        Parameters
+        ----------
+        date: :class:`str`
+            A date formatted in ISO 8601 format, like so: `YYYY-MM-DD`.
+        lat: :class:`float` | :class:`int`
+            The latitude of the location.
+        lon: :class:`float` | :class:`int`
+            The longitude of the location.
+        offset: Optional[:class:`str`]
+            The timezone offset, given in the following format: `+HH:MM` or `-HH:MM`.
+
+        Returns
+        -------
+        :class:`.MoonEvents`
+        """
+        params = _events_params(date, lat, lon, offset)
+
+        data: APIMoonData = await self._get_json(self._base_url + "moon", params)
+
+        return MoonEvents(data)
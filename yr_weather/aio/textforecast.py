@@ -0,0 +1,80 @@
+"""A module with the asynchronous client for the Textforecast API."""
+
+from typing import Literal, List, Optional, Dict
+
+import aiohttp
+
+from .client import AsyncAPIClient, DEFAULT_POOL_SIZE
+from ..textforecast import (
+    _ensure_valid_forecast,
+    _ensure_valid_area_type,
+    _parse_xml,
+    _parse_areas,
+)
+from ..data.textforecast import TextForecasts, TextForecastArea
+from ..ratelimit import RateLimiter
+
+
+class AsyncTextforecast(AsyncAPIClient):
+    """An asynchronous client for interacting with the Yr Textforecast API.
+
+    This is the asynchronous counterpart of :class:`yr_weather.Textforecast`, returning the same data classes.
+    """
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        session: Optional[aiohttp.ClientSession] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        super().__init__(headers, pool_size, session, rate_limiter)
+
+        self._base_url += "textforecast/2.0/"
+
+    async def get_forecasts(
+        self,
+        forecast: Literal[
+            "landoverview", "coast_en", "coast_no", "sea_en", "sea_no", "sea_wmo"
+        ],
+    ) -> TextForecasts:
+        """Get text forcasts for a selected area.
+
+        Parameters
+        ----------
+        forecast: Literal["landoverview", "coast_en", "coast_no", "sea_en", "sea_no", "sea_wmo"]
+            One of the possible forecast areas.
+
+        Returns
+        -------
+        :class:`.TextForecasts`
+            A class with text forecasts for the selected area defined in the forecast parameter.
+        """
+        _ensure_valid_forecast(forecast)
+
+        body = await self._get(self._base_url + f"?forecast={forecast}")
+
+        parsed = _parse_xml(body.decode("utf-8"))
+
+        return TextForecasts(parsed["textforecast"], forecast)
+
+    async def get_areas(
+        self, area_type: Literal["land", "sea", "coast"]
+    ) -> List[TextForecastArea]:
+        """Get available areas and their polygons.
+
+        Parameters
+        ----------
+        forecast: Literal["land", "sea", "coast"]
+            One of the possible areas.
+
+        Returns
+        -------
+        list[:class:`TextForecastArea`]
+            A list of land, coast or sea areas, their polygons and names.
+        """
+        _ensure_valid_area_type(area_type)
+
+        body = await self._get(self._base_url + f"areas?type={area_type}")
+
+        return list(_parse_areas(_parse_xml(body.decode("utf-8"))))
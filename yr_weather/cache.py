@@ -0,0 +1,256 @@
+"""The HTTP cache and the cache of built objects used by the API clients."""
+
+import math
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlsplit
+
+import requests
+
+if TYPE_CHECKING:
+    from requests_cache import CachedSession
+
+_BACKENDS = ["sqlite", "filesystem", "memory"]
+_EVICTION_POLICIES = ["lru", "expiry"]
+
+
+@dataclass
+class CacheConfig:
+    """The configuration of a client's HTTP cache.
+
+    Pass it as ``use_cache`` when creating a client::
+
+        config = CacheConfig(backend="memory", max_bytes=50_000_000, expire_after={"locationforecast": 600})
+        client = yr_weather.Locationforecast(headers, use_cache=config)
+
+    The default configuration is the same as ``use_cache=True``: an unbounded sqlite database named ``yr_cache.sqlite``
+    in the working directory.
+
+    Attributes
+    ----------
+    backend: Literal["sqlite", "filesystem", "memory"]
+        Where responses are stored. ``"memory"`` keeps them in the process only,
+        ``"filesystem"`` stores one file per response and ``"sqlite"`` stores them in one database. Default is ``"sqlite"``.
+    location: :class:`str` | :class:`os.PathLike`
+        The path of the sqlite database or of the filesystem cache directory.
+        Not used by the memory backend. Default is ``"yr_cache"``.
+    max_bytes: Optional[:class:`int`]
+        The maximum total size of the cached response bodies, in bytes.
+        When it's exceeded, responses are evicted according to ``eviction``. Default is no limit.
+    eviction: Literal["lru", "expiry"]
+        Which responses are evicted first when the cache is full: ``"lru"`` evicts the least recently used responses,
+        ``"expiry"`` evicts expired responses, and then those which expire first. Default is ``"lru"``.
+    expire_after: dict[:class:`str`, :class:`int` | :class:`datetime.timedelta`]
+        How long responses are cached by product (like ``"locationforecast"``), in seconds or as a timedelta.
+        This overrides the expiry time given by the API for the product. Note that MET's Terms of Service
+        ask clients to not request data again before it expires.
+    """
+
+    backend: Literal["sqlite", "filesystem", "memory"] = "sqlite"
+    location: Union[str, "os.PathLike[str]"] = "yr_cache"
+    max_bytes: Optional[int] = None
+    eviction: Literal["lru", "expiry"] = "lru"
+    expire_after: Dict[str, Union[int, timedelta]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if self.backend not in _BACKENDS:
+            raise ValueError(
+                f"The 'backend' argument must be one of the following: {', '.join(_BACKENDS)}."
+            )
+
+        if self.eviction not in _EVICTION_POLICIES:
+            raise ValueError(
+                f"The 'eviction' argument must be one of the following: {', '.join(_EVICTION_POLICIES)}."
+            )
+
+        if self.max_bytes is not None and self.max_bytes <= 0:
+            raise ValueError("The 'max_bytes' parameter must be positive.")
+
+    def create_session(self, thread_safe: bool = False) -> "CachedSession":
+        """Create a session which caches responses as configured.
+
+        With ``thread_safe``, all access to the stored responses is serialized,
+        so the session can be used by many threads at once.
+        """
+        # requests-cache takes long to import, so it's only imported once a cache is used
+        # pylint: disable=import-outside-toplevel
+        from requests_cache import CachedSession
+        from requests_cache.backends import BaseCache, FileCache, SQLiteCache
+
+        from ._storage import _BoundedStorage, _LockedStorage, _index_storage
+
+        backend: BaseCache
+        if self.backend == "sqlite":
+            backend = SQLiteCache(os.fspath(self.location))
+        elif self.backend == "filesystem":
+            backend = FileCache(os.fspath(self.location))
+        else:
+            backend = BaseCache()
+
+        if self.max_bytes is not None or self.expire_after:
+            expire_after = {
+                product: ttl if isinstance(ttl, timedelta) else timedelta(seconds=ttl)
+                for product, ttl in self.expire_after.items()
+            }
+            backend.responses = _BoundedStorage(
+                backend.responses,
+                self.max_bytes,
+                self.eviction,
+                expire_after,
+                _index_storage(backend),
+            )
+
+        if thread_safe:
+            backend.responses = _LockedStorage(backend.responses)
+            backend.redirects = _LockedStorage(backend.redirects)
+
+        return CachedSession(backend=backend, cache_control=True)
+
+
+def _product(url: str) -> str:
+    """Get the product of a MET API URL, like ``"locationforecast"``."""
+    path = urlsplit(url).path.split("/weatherapi/", 1)[-1]
+    return path.split("/", 1)[0]
+
+
+def _is_cached(session: requests.Session) -> bool:
+    """Whether a session caches responses."""
+    # A session can only be cached if requests-cache has been imported
+    module = sys.modules.get("requests_cache")
+    return module is not None and isinstance(session, module.CachedSession)
+
+
+def _timestamp(expires: Optional[datetime]) -> float:
+    """Convert the expiry time of a response to seconds since the epoch (infinite if it never expires)."""
+    if expires is None:
+        return math.inf
+    if expires.tzinfo is None:
+        expires = expires.replace(tzinfo=timezone.utc)
+    return expires.timestamp()
+
+
+class _CacheEntry(NamedTuple):
+    validator: Optional[Tuple[Optional[str], Optional[str]]]
+    expires: float
+    value: Any
+
+
+class ObjectCache:
+    """A cache of decoded and built objects, like :class:`.Forecast`, by the request they were built from.
+
+    Clients look up an object here before sending a request. Until the response it was built from expires,
+    the same object is returned again without sending a request or decoding anything.
+    After that, the request is sent, and if the response has the same validator (``ETag`` and ``Last-Modified`` headers)
+    as before, the object is reused instead of being built again.
+
+    Objects from the cache are shared between all callers, and must therefore not be modified.
+    Plain lists, dicts and sets are never cached, and clients return new lists of cached immutable items instead.
+
+    Parameters
+    ----------
+    max_entries: :class:`int`
+        Optional: The maximum number of objects kept. Use ``0`` to disable the cache. Default is ``128``.
+    eviction: Literal["lru", "expiry"]
+        Optional: Which objects are evicted first when the cache is full: ``"lru"`` evicts the least recently used objects,
+        ``"expiry"`` evicts those which expire first. Default is ``"lru"``.
+    """
+
+    def __init__(
+        self, max_entries: int = 128, eviction: Literal["lru", "expiry"] = "lru"
+    ) -> None:
+        if max_entries < 0:
+            raise ValueError("The 'max_entries' parameter must not be negative.")
+
+        if eviction not in _EVICTION_POLICIES:
+            raise ValueError(
+                f"The 'eviction' argument must be one of the following: {', '.join(_EVICTION_POLICIES)}."
+            )
+
+        self.max_entries = max_entries
+        self.eviction = eviction
+
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[_CacheEntry]:
+        """Get an entry, whether it has expired or not."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def get_fresh(self, key: Hashable) -> Any:
+        """Get an object which hasn't expired yet, or None."""
+        entry = self.get(key)
+        if entry is not None and entry.expires > time.time():
+            return entry.value
+        return None
+
+    def put(self, key: Hashable, entry: _CacheEntry) -> None:
+        if self.max_entries == 0:
+            return
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                if self.eviction == "lru":
+                    self._entries.popitem(last=False)
+                else:
+                    del self._entries[
+                        min(self._entries, key=lambda k: self._entries[k].expires)
+                    ]
+
+    def clear(self) -> None:
+        """Remove all objects from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _validator(
+    response: requests.Response,
+) -> Optional[Tuple[Optional[str], Optional[str]]]:
+    """Get the validator of a response, which identifies the version of its content."""
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+
+    if etag is None and last_modified is None:
+        return None
+    return etag, last_modified
+
+
+def _expires(response: requests.Response) -> float:
+    """Get the time a response expires at, in seconds since the epoch (0 if unknown).
+
+    The expiry time determined by the HTTP cache is used if there is one, as it respects product overrides.
+    """
+    expires = getattr(response, "expires", None)
+    if isinstance(expires, datetime):
+        return _timestamp(expires)
+
+    try:
+        return parsedate_to_datetime(response.headers["Expires"]).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return 0.0
@@ -1,32 +1,594 @@
 """A module for API classes which other modules depend on."""
 
-from typing import Optional, Union, Dict
+import threading
+import time
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Hashable,
+    Optional,
+    Union,
+    Dict,
+    List,
+    Tuple,
+)
+from urllib.parse import urlsplit
 import requests
-from requests_cache import CachedSession
+
+from .cache import (
+    CacheConfig,
+    ObjectCache,
+    _CacheEntry,
+    _expires,
+    _is_cached,
+    _validator,
+)
+from .decoding import loads
+from .ratelimit import RateLimiter, asks_to_wait, default_limiter
+from .retry import Deadline, DeadlineExceeded, RetryPolicy, Timeout
+from .instrumentation import (
+    PHASES,
+    InstrumentedAdapter,
+    RequestInfo,
+    start_transport_timing,
+    stop_transport_timing,
+)
+
+if TYPE_CHECKING:
+    from requests_cache import CachedSession
+
+DEFAULT_POOL_SIZE = 10
+
+Hook = Callable[[RequestInfo], Any]
+
+
+def decode_json(response: requests.Response) -> Any:
+    """Decode the JSON body of a response, with the fastest available decoder."""
+    return loads(response.content)
+
+
+class _Call:
+    """A call in progress, which other callers with the same key can wait for."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _SingleFlight:
+    """Runs concurrent calls with the same key only once, sharing the outcome between the callers."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Call ``func``, unless a call with the same key is already in progress.
+        In that case, wait for that call and return its result (or raise its exception) instead.
+
+        Returns the result, and whether it was shared from another caller's call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result, False
+
+
+def _cache_key(
+    url: str,
+    params: Optional[Dict[str, Any]],
+    decode: Optional[Callable[[requests.Response], Any]],
+    build: Optional[Callable[[Any], Any]],
+) -> Hashable:
+    """The key of a request in the object cache, which is also used to coalesce requests."""
+    return (url, tuple(params.items()) if params else None, decode, build)
+
+
+def _endpoint(url: str) -> str:
+    """Get the endpoint of a MET API URL, which is its path after ``/weatherapi/``."""
+    return urlsplit(url).path.split("/weatherapi/", 1)[-1]
+
+
+def create_session(
+    use_cache: Union[bool, CacheConfig] = True,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    rate_limiter: Optional[RateLimiter] = None,
+    thread_safe: bool = False,
+) -> Union["CachedSession", requests.Session]:
+    """Create a session for API clients.
+
+    A session can be shared by several clients by passing it as their ``session``,
+    so they use one connection pool and one HTTP cache. See also :class:`.MetClient`.
+
+    Parameters
+    ----------
+    use_cache: :class:`bool` | :class:`.CacheConfig`
+        Optional: Whether responses are cached, and how. Default is True.
+    pool_size: :class:`int`
+        Optional: The maximum number of kept-alive connections to each host. Default is ``10``.
+    rate_limiter: Optional[:class:`.RateLimiter`]
+        Optional: The rate limiter requests wait for. Default is the limiter shared by all clients.
+    thread_safe: :class:`bool`
+        Optional: Whether all access to the HTTP cache is serialized, so the session can be used
+        by many threads at once. Default is False.
+
+    Returns
+    -------
+    :class:`requests_cache.CachedSession` | :class:`requests.Session`
+        The session.
+    """
+    session: Union[CachedSession, requests.Session]
+    if isinstance(use_cache, CacheConfig):
+        session = use_cache.create_session(thread_safe)
+    elif use_cache:
+        session = CacheConfig().create_session(thread_safe)
+    else:
+        session = requests.Session()
+
+    adapter = InstrumentedAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, rate_limiter=rate_limiter
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
 
 
 class APIClient:
-    """A base API client other clients inherit."""
+    """A base API client other clients inherit.
+
+    Responses are cached as configured by ``use_cache``, which is either a bool, or a :class:`.CacheConfig`.
+    The objects built from responses are kept in ``object_cache``, see :class:`.ObjectCache`.
+
+    Every request sent by the client is described by a :class:`.RequestInfo`,
+    which is passed to the functions in ``hooks``: ``hooks["before_request"]`` are called before a request is sent,
+    and ``hooks["after_request"]`` are called after its response has been decoded, or it failed.
+    Use :meth:`add_hook` to add hooks. Counters of all requests by endpoint are reported by :meth:`stats`.
+
+    Failed requests are retried as described by ``retry``, and every call to the client ends by the deadline
+    of its :class:`.RetryPolicy`. The default policy sends a request at most 3 times within 60 seconds.
+
+    Requests sent through the network wait for ``rate_limiter``, or for the :class:`.RateLimiter` shared by all clients
+    if it's None, see :mod:`yr_weather.ratelimit`.
+
+    Clients create their own session, unless they are given a ``session`` made by :func:`create_session`,
+    which can be shared with other clients. ``use_cache`` and ``pool_size`` aren't used then,
+    and changing the headers of one client changes them for all clients sharing its session.
+
+    Clients used by many threads at once should be created with ``thread_safe``, which serializes
+    all access to the HTTP cache. Changing the headers with :meth:`set_headers` or the cache with :meth:`toggle_cache`
+    is atomic in any case: requests in progress keep the session and headers they started with.
+    """
 
     def __init__(
-        self, headers: Optional[Dict[str, str]] = None, use_cache: bool = True
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        use_cache: Union[bool, CacheConfig] = True,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        object_cache: Optional[ObjectCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        session: Optional[Union["CachedSession", requests.Session]] = None,
+        thread_safe: bool = False,
     ) -> None:
         if headers is not None and not isinstance(headers, dict):
             raise TypeError("The 'headers' parameter must be of type 'dict' or None.")
 
+        self._cache_config = (
+            use_cache if isinstance(use_cache, CacheConfig) else CacheConfig()
+        )
+
         self._base_url = "https://api.met.no/weatherapi/"
         self._global_headers = headers
+        self._pool_size = pool_size
+        self._rate_limiter = rate_limiter
+        self._thread_safe = thread_safe
+        # Serializes replacing the session or its headers
+        self._session_lock = threading.Lock()
 
-        if use_cache:
-            self.session: Union[CachedSession, requests.Session] = CachedSession(
-                cache_name="yr_cache", cache_control=True
-            )
+        self._stats: Dict[str, int] = {}
+        self._stats_lock = threading.Lock()
+        self._endpoint_stats: Dict[str, Dict[str, float]] = {}
+        self._in_flight = _SingleFlight()
+
+        self.object_cache = object_cache if object_cache is not None else ObjectCache()
+        self.retry = retry if retry is not None else RetryPolicy()
+
+        self.hooks: Dict[str, List[Hook]] = {"before_request": [], "after_request": []}
+
+        # A session given to the client, which it returns to when its cache is turned back on
+        self._shared_session = session
+
+        self.session: Union[CachedSession, requests.Session]
+        if session is not None:
+            self.session = session
         else:
-            self.session = requests.Session()
+            self.session = self._new_session(bool(use_cache))
 
         if headers is not None:
             self.session.headers = self._global_headers  # type: ignore
 
+    def _new_session(self, use_cache: bool) -> Union["CachedSession", requests.Session]:
+        """Create a new session, with a connection pool of the client's pool size.
+
+        A client given a session keeps using its connection pool and cache instead.
+        """
+        shared = self._shared_session
+        if shared is not None:
+            if use_cache:
+                if not _is_cached(shared):
+                    raise ValueError(
+                        "The cache can't be turned on for a client given a session without a cache."
+                    )
+                return shared
+
+            # The adapters hold the connection pool and rate limiter of the shared session
+            session = requests.Session()
+            session.headers = shared.headers
+            for prefix, adapter in shared.adapters.items():
+                session.mount(prefix, adapter)
+            return session
+
+        return create_session(
+            self._cache_config if use_cache else False,
+            self._pool_size,
+            self._rate_limiter,
+            self._thread_safe,
+        )
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """The :class:`.RateLimiter` requests of this client wait for."""
+        if self._rate_limiter is not None:
+            return self._rate_limiter
+        return default_limiter()
+
+    def add_hook(self, event: str, hook: Hook) -> None:
+        """Add a function to be called for every request sent by this client.
+
+        Parameters
+        ----------
+        event: :class:`str`
+            Either ``"before_request"`` or ``"after_request"``.
+        hook: Callable[[:class:`.RequestInfo`], Any]
+            The function, which receives a :class:`.RequestInfo` describing the request.
+        """
+        if event not in self.hooks:
+            raise ValueError(
+                f"The 'event' argument must be one of the following: {', '.join(self.hooks)}."
+            )
+
+        self.hooks[event].append(hook)
+
+    def _cached(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        decode: Optional[Callable[[requests.Response], Any]] = None,
+        build: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """Get the object :meth:`_get` would return from the object cache, if it hasn't expired yet."""
+        return self.object_cache.get_fresh(_cache_key(url, params, decode, build))
+
+    def _get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        decode: Optional[Callable[[requests.Response], Any]] = None,
+        build: Optional[Callable[[Any], Any]] = None,
+        stream: bool = False,
+        timeout: Optional[Timeout] = None,
+        deadline: Optional[float] = None,
+    ) -> Any:
+        """Send a GET request with the client's session.
+
+        The request is retried as described by the client's :class:`.RetryPolicy`, whose timeout and deadline are used
+        unless ``timeout`` (for every attempt) or ``deadline`` (for the whole call) are given. The number of retries is
+        reported as ``retries`` by :meth:`stats`.
+
+        If ``decode`` is given, the response is decoded with it (for example with :func:`decode_json`),
+        and if ``build`` is given, the decoded data is passed to it to build a model object.
+        The last of the response, decoded data and built object is returned.
+
+        Decoded and built objects are kept in the client's :class:`.ObjectCache`,
+        and returned again without a request until they expire. The number of such calls is reported
+        as ``object_cache_hits`` by :meth:`stats`, and the number of responses which were unchanged,
+        so their object was reused, as ``object_cache_revalidations``.
+
+        Concurrent calls for the same URL, decoder and builder are coalesced:
+        only one request is sent, and every caller receives its result.
+        The number of merged calls is reported as ``requests_coalesced`` by :meth:`stats`.
+        Streamed requests are never coalesced, as their body can only be read once.
+        """
+        key = _cache_key(url, params, decode, build)
+        cacheable = not stream and (decode is not None or build is not None)
+
+        if cacheable:
+            cached = self.object_cache.get_fresh(key)
+            if cached is not None:
+                self._count("object_cache_hits")
+                return cached
+
+        def send() -> Any:
+            prepared_url = str(
+                requests.Request("GET", url, params=params).prepare().url
+            )
+            info = RequestInfo(url=prepared_url, endpoint=_endpoint(prepared_url))
+            for hook in self.hooks["before_request"]:
+                hook(info)
+
+            # The session is read once, as it may be replaced by another thread
+            session = self.session
+            budget = Deadline(deadline if deadline is not None else self.retry.deadline)
+            timings = start_transport_timing(budget)
+            start = perf_counter()
+            try:
+                response = self._send(
+                    session, url, params, stream, timeout, budget, info, timings
+                )
+                self._time_response(
+                    info,
+                    response,
+                    perf_counter() - start,
+                    timings,
+                    stream,
+                    _is_cached(session),
+                )
+
+                if cacheable:
+                    result = self._decode_cached(key, response, info, decode, build)
+                else:
+                    result = self._decode(response, info, decode, build)
+            except BaseException as exc:
+                info.error = exc
+                raise
+            finally:
+                stop_transport_timing()
+                info.elapsed = perf_counter() - start
+                self._record(info)
+                for hook in self.hooks["after_request"]:
+                    hook(info)
+
+            return result
+
+        if stream:
+            return send()
+
+        result, shared = self._in_flight.do(key, send)
+
+        if shared:
+            self._count("requests_coalesced")
+
+        return result
+
+    def _send(
+        self,
+        session: requests.Session,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        stream: bool,
+        timeout: Optional[Timeout],
+        budget: Deadline,
+        info: RequestInfo,
+        timings: Dict[str, float],
+    ) -> requests.Response:
+        """Send a request, retrying it as described by the client's retry policy.
+
+        Responses asking the client to wait are left to the rate limiter, which already sent them again.
+        """
+        policy = self.retry
+        if timeout is None:
+            timeout = policy.timeout
+
+        retry = 0
+        while True:
+            attempt_timeout = budget.timeout(timeout)
+            start = perf_counter()
+            try:
+                response = session.get(
+                    url, params=params, stream=stream, timeout=attempt_timeout
+                )
+            except DeadlineExceeded:
+                raise
+            except policy.exceptions:
+                if not self._backoff(retry, budget, start, timings):
+                    raise
+            else:
+                if (
+                    response.status_code not in policy.statuses
+                    or asks_to_wait(response.status_code, response.headers)
+                    or not self._backoff(retry, budget, start, timings)
+                ):
+                    return response
+                response.close()
+
+            retry += 1
+            info.attempts += 1
+
+    def _backoff(
+        self, retry: int, budget: Deadline, start: float, timings: Dict[str, float]
+    ) -> bool:
+        """Wait before a retry, unless the attempts are used up or the deadline would pass while waiting.
+
+        Returns whether the request should be sent again.
+        """
+        policy = self.retry
+        if retry + 1 >= policy.attempts:
+            return False
+
+        delay = policy.delay(retry)
+        remaining = budget.remaining()
+        if remaining is not None and delay >= remaining:
+            return False
+
+        time.sleep(delay)
+        self._count("retries")
+
+        # The failed attempt, including its transport phases, is reported as retrying
+        timings["retry"] += perf_counter() - start
+        for phase in ("rate_limit", "queue", "connect"):
+            timings[phase] = 0.0
+
+        return True
+
+    @staticmethod
+    def _decode(
+        response: requests.Response,
+        info: RequestInfo,
+        decode: Optional[Callable[[requests.Response], Any]],
+        build: Optional[Callable[[Any], Any]],
+    ) -> Any:
+        """Decode a response and build an object from it, timing both phases."""
+        result: Any = response
+        if decode is not None:
+            start = perf_counter()
+            result = decode(result)
+            info.phases["decode"] = perf_counter() - start
+        if build is not None:
+            start = perf_counter()
+            result = build(result)
+            info.phases["build"] = perf_counter() - start
+        return result
+
+    def _decode_cached(
+        self,
+        key: Hashable,
+        response: requests.Response,
+        info: RequestInfo,
+        decode: Optional[Callable[[requests.Response], Any]],
+        build: Optional[Callable[[Any], Any]],
+    ) -> Any:
+        """Decode a response, reusing the cached object if the response is unchanged, and cache the result."""
+        validator = _validator(response)
+        entry = self.object_cache.get(key)
+
+        if (
+            response.ok
+            and validator is not None
+            and entry is not None
+            and entry.validator == validator
+        ):
+            self._count("object_cache_revalidations")
+            result = entry.value
+        else:
+            result = self._decode(response, info, decode, build)
+
+        # Plain containers are left out, as a caller changing them would change the cached object
+        if (
+            response.ok
+            and result is not None
+            and not isinstance(result, (list, dict, set))
+        ):
+            self.object_cache.put(
+                key, _CacheEntry(validator, _expires(response), result)
+            )
+
+        return result
+
+    def _time_response(
+        self,
+        info: RequestInfo,
+        response: requests.Response,
+        session_time: float,
+        timings: Dict[str, float],
+        stream: bool,
+        cached_session: bool,
+    ) -> None:
+        """Fill in the response and transport details of a request."""
+        info.status_code = response.status_code
+        info.from_cache = getattr(response, "from_cache", False)
+
+        if stream:
+            # The body of a streamed response hasn't been read yet
+            info.size = int(response.headers.get("Content-Length", 0))
+        else:
+            info.size = len(response.content)
+
+        # The elapsed time of a response is the time spent in the transport adapter
+        transport = 0.0 if info.from_cache else response.elapsed.total_seconds()
+        for phase in ("retry", "rate_limit", "queue", "connect"):
+            info.phases[phase] = timings[phase]
+        info.phases["transfer"] = max(
+            0.0,
+            transport - timings["rate_limit"] - timings["queue"] - timings["connect"],
+        )
+        if cached_session:
+            info.phases["cache_lookup"] = max(
+                0.0, session_time - timings["retry"] - transport
+            )
+
+    def _record(self, info: RequestInfo) -> None:
+        """Add a request to the counters of its endpoint."""
+        with self._stats_lock:
+            counters = self._endpoint_stats.get(info.endpoint)
+            if counters is None:
+                counters = self._endpoint_stats[info.endpoint] = {
+                    "requests": 0,
+                    "from_cache": 0,
+                    "errors": 0,
+                    "bytes": 0,
+                    "seconds": 0.0,
+                    **{f"{phase}_seconds": 0.0 for phase in PHASES},
+                }
+
+            counters["requests"] += 1
+            counters["from_cache"] += info.from_cache
+            counters["errors"] += info.failed
+            counters["bytes"] += info.size
+            counters["seconds"] += info.elapsed
+            for phase, seconds in info.phases.items():
+                counters[f"{phase}_seconds"] += seconds
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        """Increase one of the client's counters, which are reported by :meth:`stats`."""
+        with self._stats_lock:
+            self._stats[name] = self._stats.get(name, 0) + amount
+
+    def stats(self) -> Dict[str, Any]:
+        """Get a snapshot of the client's counters.
+
+        The ``"endpoints"`` key holds counters for every endpoint requested by the client:
+        the number of ``requests``, how many were answered ``from_cache``, how many ``errors`` occured,
+        the total ``bytes`` received, and the total ``seconds`` spent, also split by phase (like ``decode_seconds``).
+        See :class:`.RequestInfo` for a description of the phases.
+
+        Returns
+        -------
+        :class:`dict`
+            A copy of the counters, by name.
+        """
+        with self._stats_lock:
+            snapshot: Dict[str, Any] = dict(self._stats)
+            snapshot["endpoints"] = {
+                endpoint: dict(counters)
+                for endpoint, counters in self._endpoint_stats.items()
+            }
+            return snapshot
+
     def set_headers(self, headers: dict) -> dict:
         """Set new headers of the client.
 
@@ -45,13 +607,17 @@ class APIClient:
         if not isinstance(headers, dict):
             raise TypeError("The 'headers' parameter must be of type 'dict'.")
 
-        self._global_headers = headers
-        self.session.headers = headers
-        return self.session.headers
+        with self._session_lock:
+            self._global_headers = headers
+            self.session.headers = headers
+        return headers
 
     def toggle_cache(self, toggle: bool) -> bool:
         """Toggle the usage of cache on or off.
 
+        A client given a ``session`` keeps using its connection pool while the cache is off,
+        and uses the session again when the cache is turned back on.
+
         Parameters
         ----------
         toggle: :class:`bool`
@@ -62,13 +628,15 @@ class APIClient:
         :class:`bool`
             The new state of the cache (on/off).
         """
-        if toggle:
-            if not isinstance(self.session, CachedSession):
-                self.session = CachedSession(cache_name="yr_cache", cache_control=True)
-                self.session.headers = self._global_headers  # type: ignore
-            return True
-
-        if not isinstance(self.session, requests.Session):
-            self.session = requests.Session()
-            self.session.headers = self._global_headers
-        return False
+        if not isinstance(toggle, bool):
+            raise TypeError("The 'toggle' parameter must be of type 'bool'.")
+
+        with self._session_lock:
+            if _is_cached(self.session) != toggle:
+                # The new session is complete before it replaces the old one
+                session = self._new_session(toggle)
+                if self._global_headers is not None:
+                    session.headers = self._global_headers  # type: ignore
+                self.session = session
+
+        return toggle
@@ -0,0 +1,504 @@
+"""A columnar view of a locationforecast timeseries, backed by NumPy.
+
+NumPy is an optional dependency, install it with ``pip install yr-weather[numpy]``.
+"""
+
+from dataclasses import dataclass, fields
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import pytz
+
+try:
+    import numpy as np
+except ImportError as exc:
+    raise ImportError(
+        "ForecastFrame requires numpy. Install it with 'pip install yr-weather[numpy]'."
+    ) from exc
+
+from yr_weather.api_types.locationforecast import (
+    APIForecastTime,
+    APIForecastFutureData,
+)
+from yr_weather.data.locationforecast import (
+    ForecastTimeDetails,
+    ForecastFutureDetails,
+    _parse_time,
+    _to_epoch,
+)
+
+INSTANT_VARIABLES: Tuple[str, ...] = tuple(f.name for f in fields(ForecastTimeDetails))
+FUTURE_VARIABLES: Tuple[str, ...] = tuple(f.name for f in fields(ForecastFutureDetails))
+PERIODS: Tuple[str, ...] = ("next_1_hours", "next_6_hours", "next_12_hours")
+_PERIOD_SECONDS = {
+    "next_1_hours": 3600,
+    "next_6_hours": 6 * 3600,
+    "next_12_hours": 12 * 3600,
+}
+_DAY = 24 * 3600
+_EPOCH_DATE = date(1970, 1, 1)
+
+_INSTANT_INDEX = {name: i for i, name in enumerate(INSTANT_VARIABLES)}
+_FUTURE_INDEX = {name: i for i, name in enumerate(FUTURE_VARIABLES)}
+
+
+# Instant variables which are angles in degrees, and are interpolated along the shortest arc
+_CIRCULAR_VARIABLES = frozenset({"wind_from_direction"})
+
+
+def _to_epochs(times: Union[np.ndarray, Iterable[datetime]]) -> np.ndarray:
+    """Convert datetimes, datetime64 values or seconds since the epoch to a float64 array of seconds."""
+    if isinstance(times, np.ndarray):
+        if np.issubdtype(times.dtype, np.datetime64):
+            seconds = times.astype("datetime64[s]").astype(np.int64).astype(np.float64)
+            seconds[np.isnat(times)] = np.nan
+            return seconds
+        if np.issubdtype(times.dtype, np.number):
+            return times.astype(np.float64)
+
+    epochs = []
+    for time in times:
+        if not isinstance(time, datetime):
+            raise TypeError(
+                "The 'times' parameter must be datetimes, or a numpy array of datetime64 values or seconds since the epoch."
+            )
+        epochs.append(_to_epoch(time))
+
+    return np.array(epochs, dtype=np.float64)
+
+
+def _utc_offset(epoch: int, tz: tzinfo) -> int:
+    return datetime.fromtimestamp(epoch, tz).utcoffset() // timedelta(seconds=1)  # type: ignore[operator]
+
+
+def _utc_offsets(times: np.ndarray, tz: tzinfo) -> np.ndarray:
+    """Get the UTC offset in seconds of every time (in seconds since the epoch) in a sorted array.
+
+    Offsets only change a few times a year, so instead of looking up every time, the offsets are looked up
+    at the ends of the array, and the array is split in halves until the ends of every part have the same offset.
+    Changes back and forth between two times with the same offset (weeks apart in practice) are therefore not seen.
+    """
+    fixed = tz.utcoffset(None)
+    if fixed is not None:
+        return np.full(len(times), fixed // timedelta(seconds=1), dtype=np.int64)
+
+    offsets = np.empty(len(times), dtype=np.int64)
+    if not len(times):
+        return offsets
+
+    epochs = times.tolist()
+    parts = [
+        (0, len(epochs) - 1, _utc_offset(epochs[0], tz), _utc_offset(epochs[-1], tz))
+    ]
+    while parts:
+        first, last, first_offset, last_offset = parts.pop()
+        if first_offset == last_offset or last - first <= 1:
+            offsets[first:last] = first_offset
+            offsets[last] = last_offset
+            continue
+
+        middle = (first + last) // 2
+        middle_offset = _utc_offset(epochs[middle], tz)
+        parts.append((first, middle, first_offset, middle_offset))
+        parts.append((middle, last, middle_offset, last_offset))
+
+    return offsets
+
+
+@dataclass
+class DailySummary:
+    """Daily aggregates of a forecast, with one value per local day in every column.
+
+    Missing values are NaN, or None for symbol codes.
+
+    Attributes
+    ----------
+    date: list[:class:`datetime.date`]
+        The local date of every day.
+    air_temperature_min: :class:`numpy.ndarray`
+        The lowest air temperature of every day.
+    air_temperature_max: :class:`numpy.ndarray`
+        The highest air temperature of every day.
+    precipitation_amount: :class:`numpy.ndarray`
+        The total precipitation of every day.
+    wind_speed_of_gust_max: :class:`numpy.ndarray`
+        The strongest wind gust of every day.
+    symbol_code: list[Optional[:class:`str`]]
+        The symbol code covering the most hours of every day.
+    covered_hours: :class:`numpy.ndarray`
+        The number of hours of every day which are covered by the precipitation and symbol periods.
+        This is less than 24 for the first and last day of a forecast.
+    """
+
+    date: List[date]
+    air_temperature_min: np.ndarray
+    air_temperature_max: np.ndarray
+    precipitation_amount: np.ndarray
+    wind_speed_of_gust_max: np.ndarray
+    symbol_code: List[Optional[str]]
+    covered_hours: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.date)
+
+
+class ForecastFrame:
+    """A columnar view of a forecast timeseries.
+
+    Every variable is stored as a row of a contiguous float64 array, with NaN where the API
+    did not provide a value. Aggregations can therefore be done with NumPy directly,
+    for example ``numpy.nanmax(frame.instant, axis=1)``.
+
+    Attributes
+    ----------
+    time: :class:`numpy.ndarray`
+        The start time of every step, as int64 seconds since the epoch (UTC).
+    instant: :class:`numpy.ndarray`
+        A float64 array with shape ``(len(INSTANT_VARIABLES), len(time))``
+        holding the fields of :class:`.ForecastTimeDetails`.
+    next_1_hours: :class:`numpy.ndarray`
+        A float64 array with shape ``(len(FUTURE_VARIABLES), len(time))``
+        holding the fields of :class:`.ForecastFutureDetails` for the next hour.
+    next_6_hours: :class:`numpy.ndarray`
+        Like ``next_1_hours``, for the next 6 hours.
+    next_12_hours: :class:`numpy.ndarray`
+        Like ``next_1_hours``, for the next 12 hours.
+    symbols: list[:class:`str`]
+        All symbol codes used in this frame. Symbol codes are stored as indices into this list.
+    symbol_codes: dict[:class:`str`, :class:`numpy.ndarray`]
+        An int16 array of symbol code indices for every period, with -1 where no symbol was given.
+    """
+
+    def __init__(self, timeseries: List[APIForecastTime]) -> None:
+        steps = len(timeseries)
+
+        self.time = np.empty(steps, dtype=np.int64)
+        self.instant = np.full((len(INSTANT_VARIABLES), steps), np.nan)
+        self.next_1_hours = np.full((len(FUTURE_VARIABLES), steps), np.nan)
+        self.next_6_hours = np.full((len(FUTURE_VARIABLES), steps), np.nan)
+        self.next_12_hours = np.full((len(FUTURE_VARIABLES), steps), np.nan)
+
+        self.symbols: List[str] = []
+        self.symbol_codes: Dict[str, np.ndarray] = {
+            period: np.full(steps, -1, dtype=np.int16) for period in PERIODS
+        }
+
+        symbol_index: Dict[str, int] = {}
+        period_values = {period: getattr(self, period) for period in PERIODS}
+
+        # Read every step once, filling all columns at the same time
+        for step, forecast_time in enumerate(timeseries):
+            self.time[step] = _parse_time(forecast_time["time"])
+            data = forecast_time["data"]
+
+            for name, value in data["instant"]["details"].items():
+                row = _INSTANT_INDEX.get(name)
+                if row is not None and value is not None:
+                    self.instant[row, step] = value
+
+            for period in PERIODS:
+                future: Optional[APIForecastFutureData] = data.get(period)  # type: ignore[assignment]
+                if not future:
+                    continue
+
+                values = period_values[period]
+                for name, value in future.get("details", {}).items():
+                    row = _FUTURE_INDEX.get(name)
+                    if row is not None and value is not None:
+                        values[row, step] = value
+
+                symbol = future.get("summary", {}).get("symbol_code")
+                if symbol is not None:
+                    code = symbol_index.get(symbol)
+                    if code is None:
+                        code = symbol_index[symbol] = len(self.symbols)
+                        self.symbols.append(symbol)
+                    self.symbol_codes[period][step] = code
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.column(column)
+
+    @property
+    def columns(self) -> List[str]:
+        """The names of all columns which can be retrieved with :meth:`column`."""
+        names = list(INSTANT_VARIABLES)
+        for period in PERIODS:
+            names.extend(f"{period}.{name}" for name in FUTURE_VARIABLES)
+        return names
+
+    def column(self, column: str) -> np.ndarray:
+        """Get the values of a single variable.
+
+        Parameters
+        ----------
+        column: :class:`str`
+            The name of an instant variable, like ``"air_temperature"``,
+            or a period and a variable, like ``"next_6_hours.precipitation_amount"``.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            A float64 array with one value per step. This is a view, not a copy.
+        """
+        period, _, name = column.rpartition(".")
+
+        if not period:
+            if name not in _INSTANT_INDEX:
+                raise KeyError(f"Unknown instant variable: '{name}'.")
+            return self.instant[_INSTANT_INDEX[name]]
+
+        if period not in PERIODS or name not in _FUTURE_INDEX:
+            raise KeyError(f"Unknown column: '{column}'.")
+
+        values: np.ndarray = getattr(self, period)
+        return values[_FUTURE_INDEX[name]]
+
+    def symbol_code(self, period: str) -> List[Optional[str]]:
+        """Get the symbol codes of a period as strings.
+
+        Parameters
+        ----------
+        period: :class:`str`
+            One of ``"next_1_hours"``, ``"next_6_hours"`` or ``"next_12_hours"``.
+
+        Returns
+        -------
+        list[Optional[:class:`str`]]
+            The symbol code for every step, or None if no symbol was given.
+        """
+        if period not in PERIODS:
+            raise KeyError(f"Unknown period: '{period}'.")
+
+        return [
+            self.symbols[code] if code >= 0 else None
+            for code in self.symbol_codes[period].tolist()
+        ]
+
+    def _periods(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Select one period per step, so the selected periods don't overlap.
+
+        Every step uses the longest period which ends before the next step starts, if it has a value for it.
+        That is the 1 hour period in the hourly part of the timeseries, and the 6 hour period in the 6-hourly part.
+
+        Returns the length of the selected period of every step in seconds (0 if none was selected),
+        and its precipitation amount and symbol code.
+        """
+        steps = len(self.time)
+        # The time until the next step. The last step is assumed to be as far from the end
+        # of the forecast as from the step before it.
+        gap = np.diff(self.time)
+        gap = np.append(gap, gap[-1] if len(gap) else np.iinfo(np.int64).max)
+
+        length = np.zeros(steps, dtype=np.int64)
+        precipitation = np.full(steps, np.nan)
+        symbol = np.full(steps, -1, dtype=np.int16)
+        row = _FUTURE_INDEX["precipitation_amount"]
+
+        # Shorter periods are selected first, and replaced by longer periods which fit
+        for period in PERIODS:
+            amount = getattr(self, period)[row]
+            codes = self.symbol_codes[period]
+            fits = (_PERIOD_SECONDS[period] <= gap) & (~np.isnan(amount) | (codes >= 0))
+
+            length[fits] = _PERIOD_SECONDS[period]
+            precipitation[fits] = amount[fits]
+            symbol[fits] = codes[fits]
+
+        return length, precipitation, symbol
+
+    def daily_summary(self, tz: Union[str, tzinfo] = timezone.utc) -> DailySummary:
+        """Aggregate the forecast by local day.
+
+        The steps are assigned to days in the ``tz`` timezone. For every day, the summary has:
+
+        - The lowest and highest air temperature, from the instant values and the 6 hour minimum and maximum
+          temperatures of periods within the day.
+        - The total precipitation.
+        - The strongest wind gust.
+        - The symbol code covering the most hours of the day.
+
+        The 1, 6 and 12 hour periods of the timeseries overlap. To not count any hour twice,
+        each step only contributes its longest period which ends before the next step starts
+        (the 1 hour period in the hourly part of the timeseries, and the 6 hour period in the 6-hourly part).
+        Periods which cross midnight are split between the two days in proportion to their hours in each day.
+
+        Parameters
+        ----------
+        tz: :class:`str` | :class:`datetime.tzinfo`
+            Optional: The timezone of the days, as a tzinfo or a name like ``"Europe/Oslo"``. Default is UTC.
+
+        Returns
+        -------
+        :class:`.DailySummary`
+        """
+        if isinstance(tz, str):
+            tz = pytz.timezone(tz)
+        elif not isinstance(tz, tzinfo):
+            raise TypeError(
+                "The 'tz' parameter must be a datetime.tzinfo or a timezone name."
+            )
+
+        offset = _utc_offsets(self.time, tz)
+        local = self.time + offset
+        day = local // _DAY
+
+        length, precipitation, symbol = self._periods()
+
+        # The part of every period before the next local midnight belongs to the day it starts in,
+        # and the rest to the next day
+        first_part = np.minimum(length, (day + 1) * _DAY - local)
+        second_part = length - first_part
+
+        first = int(day.min()) if len(day) else 0
+        last = int(np.max(np.where(second_part > 0, day + 1, day))) if len(day) else -1
+        days = last - first + 1
+        index = day - first
+
+        temperature_min = np.full(days, np.nan)
+        temperature_max = np.full(days, np.nan)
+        gust = np.full(days, np.nan)
+        temperature = self.instant[_INSTANT_INDEX["air_temperature"]]
+        np.fmin.at(temperature_min, index, temperature)
+        np.fmax.at(temperature_max, index, temperature)
+        np.fmax.at(gust, index, self.instant[_INSTANT_INDEX["wind_speed_of_gust"]])
+
+        # 6 hour extremes are only used if the whole period is within the day
+        within = (second_part == 0) & (length == _PERIOD_SECONDS["next_6_hours"])
+        np.fmin.at(
+            temperature_min,
+            index[within],
+            self.next_6_hours[_FUTURE_INDEX["air_temperature_min"]][within],
+        )
+        np.fmax.at(
+            temperature_max,
+            index[within],
+            self.next_6_hours[_FUTURE_INDEX["air_temperature_max"]][within],
+        )
+
+        # Periods are split by the seconds in each day
+        split_index = np.concatenate((index, index + 1))
+        split_seconds = np.concatenate((first_part, second_part))
+        split_fraction = split_seconds / np.maximum(np.concatenate((length, length)), 1)
+        split_precipitation = np.concatenate((precipitation, precipitation))
+        has_precipitation = ~np.isnan(split_precipitation) & (split_seconds > 0)
+
+        total = np.bincount(
+            split_index[has_precipitation],
+            weights=(split_precipitation * split_fraction)[has_precipitation],
+            minlength=days,
+        )[:days]
+        covered = np.bincount(
+            split_index[has_precipitation],
+            weights=split_seconds[has_precipitation],
+            minlength=days,
+        )[:days]
+        total[covered == 0] = np.nan
+
+        split_symbol = np.concatenate((symbol, symbol))
+        has_symbol = (split_symbol >= 0) & (split_seconds > 0)
+        symbol_seconds = np.zeros((days, max(len(self.symbols), 1)))
+        np.add.at(
+            symbol_seconds,
+            (split_index[has_symbol], split_symbol[has_symbol]),
+            split_seconds[has_symbol],
+        )
+        # Ties are won by the symbol which appears first in the forecast
+        dominant = np.argmax(symbol_seconds, axis=1)
+        has_any = symbol_seconds.max(axis=1) > 0
+
+        covered_seconds = np.bincount(
+            split_index[split_seconds > 0],
+            weights=split_seconds[split_seconds > 0],
+            minlength=days,
+        )[:days]
+
+        return DailySummary(
+            date=[_EPOCH_DATE + timedelta(days=first + i) for i in range(days)],
+            air_temperature_min=temperature_min,
+            air_temperature_max=temperature_max,
+            precipitation_amount=total,
+            wind_speed_of_gust_max=gust,
+            symbol_code=[
+                self.symbols[code] if found else None
+                for code, found in zip(dominant.tolist(), has_any.tolist())
+            ],
+            covered_hours=covered_seconds / 3600,
+        )
+
+    def interpolate(
+        self,
+        times: Union[np.ndarray, Iterable[datetime]],
+        variables: Optional[Iterable[str]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Interpolate instant variables at any number of times at once.
+
+        Values are interpolated linearly between the two steps around every time, and ``wind_from_direction``
+        is interpolated along the shortest arc between the two directions (so between 350° and 10° it's 0°).
+        Between the steps of the 6-hourly part of the timeseries, values are interpolated over the 6 hours.
+        If either of the two steps has no value for a variable, the result is NaN.
+
+        All times are looked up in one vectorized search over the timestamps of the frame.
+
+        Parameters
+        ----------
+        times: :class:`numpy.ndarray` | Iterable[datetime.datetime]
+            The times to interpolate at, as datetimes (naive datetimes are treated as UTC),
+            or as a numpy array of datetime64 values or seconds since the epoch.
+        variables: Optional[Iterable[:class:`str`]]
+            Optional: The names of the instant variables to interpolate. Default is all of them.
+
+        Returns
+        -------
+        dict[:class:`str`, :class:`numpy.ndarray`]
+            A float64 array of values for every variable, with one value per time.
+            Values for times outside the timeseries are NaN.
+        """
+        epochs = _to_epochs(times)
+
+        names = INSTANT_VARIABLES if variables is None else tuple(variables)
+        for name in names:
+            if name not in _INSTANT_INDEX:
+                raise KeyError(f"Unknown instant variable: '{name}'.")
+
+        values = self.instant[[_INSTANT_INDEX[name] for name in names]]
+        axis = self.time.astype(np.float64)
+        if not len(axis):
+            return {name: np.full(len(epochs), np.nan) for name in names}
+
+        # NaN times are outside too
+        outside = ~((epochs >= axis[0]) & (epochs <= axis[-1]))
+
+        if len(axis) < 2:
+            # A single step can only be matched exactly
+            result = np.full((len(names), len(epochs)), np.nan)
+            result[:, ~outside] = values[:, :1]
+            return dict(zip(names, result))
+
+        # The steps before and after every time
+        after = np.clip(np.searchsorted(axis, epochs, side="right"), 1, len(axis) - 1)
+        before = after - 1
+        weight = (epochs - axis[before]) / (axis[after] - axis[before])
+
+        def lerp(data: np.ndarray) -> np.ndarray:
+            start, end = data[..., before], data[..., after]
+            # Times at a step use its value, even if the other step has no value
+            return np.where(
+                weight == 0,
+                start,
+                np.where(weight == 1, end, start + (end - start) * weight),
+            )
+
+        result = lerp(values)
+
+        for row, name in enumerate(names):
+            if name in _CIRCULAR_VARIABLES:
+                radians = np.radians(values[row])
+                angle = np.arctan2(lerp(np.sin(radians)), lerp(np.cos(radians)))
+                result[row] = np.degrees(angle) % 360
+
+        result[:, outside] = np.nan
+
+        return dict(zip(names, result))
@@ -1,16 +1,82 @@
 """Classes storing data used by yr_weather.locationforecast"""
 
-from datetime import datetime, timedelta
-from typing import Optional, List
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    List,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
 from dataclasses import dataclass, fields
 
 from yr_weather.api_types.locationforecast import (
     APIForecast,
     APIForecastTime,
+    APIForecastTimeData,
     APIForecastFutureSummary,
     APIForecastFutureDetails,
 )
 
+if TYPE_CHECKING:
+    from datetime import tzinfo
+
+    import numpy as np
+
+    from yr_weather.data.frame import DailySummary, ForecastFrame
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _parse_time(time: str) -> int:
+    """Convert an API timestamp (``YYYY-MM-DDTHH:MM:SSZ``) to seconds since the epoch."""
+    return int((datetime.fromisoformat(time[:-1]) - _EPOCH).total_seconds())
+
+
+def _to_epoch(time: datetime) -> int:
+    """Convert a datetime to seconds since the epoch.
+
+    Naive datetimes are assumed to be in UTC, like the timestamps used by the API.
+    """
+    if time.tzinfo is not None:
+        time = time.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return int((time - _EPOCH).total_seconds())
+
+
+def _round_to_nearest_hour(epoch: int) -> int:
+    return (epoch + 1800) // 3600 * 3600
+
+
+def _ensure_datetime(time: datetime) -> None:
+    if not isinstance(time, datetime):
+        raise ValueError(
+            "Type of time should be datetime.datetime.\nFor more information, see https://docs.python.org/3/library/datetime.html"
+        )
+
+
+def _seconds(interval: timedelta, name: str) -> int:
+    """Convert a positive interval to whole seconds."""
+    if not isinstance(interval, timedelta) or interval.total_seconds() < 1:
+        raise ValueError(
+            f"The '{name}' parameter must be a datetime.timedelta of at least one second."
+        )
+    return int(interval.total_seconds())
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> FrozenSet[str]:
+    """The field names of a dataclass, computed once per class."""
+    return frozenset(field.name for field in fields(cls))
+
 
 class _ForecastData:
     """A base class for dataclasses which use certain classmethods."""
@@ -21,7 +87,12 @@ class _ForecastData:
         This function filters and removes any unexpected keyword arguments which will cause an exception.
         """
 
-        parameters = [field.name for field in fields(cls)]
+        parameters = _field_names(cls)
+
+        # Only build a filtered copy when the API sent a key this class doesn't know
+        if parameters.issuperset(given_dict):
+            return cls(**given_dict)
+
         return cls(**{k: v for k, v in given_dict.items() if k in parameters})
 
 
@@ -124,10 +195,11 @@ class ForecastGeometry(_ForecastData):
     coordinates: Optional[List[int]] = None
 
 
-@dataclass
 class ForecastFuture:
     """A class holding a forecast predicting the weather in the future from a specified time.
 
+    The summary and details are parsed when they are first accessed.
+
     Attributes
     ----------
     summary: :class:`.ForecastFutureSummary`
@@ -136,18 +208,41 @@ class ForecastFuture:
         The forecast data for this forecast.
     """
 
+    __slots__ = ("_raw_summary", "_raw_details", "_summary", "_details")
+
     def __init__(
         self,
         summary: Optional[APIForecastFutureSummary] = None,
         details: Optional[APIForecastFutureDetails] = None,
     ):
-        self.summary = ForecastFutureSummary.create(summary) if summary else None
-        self.details = ForecastFutureDetails.create(details) if details else None
+        self._raw_summary = summary
+        self._raw_details = details
+        self._summary: Optional[ForecastFutureSummary] = None
+        self._details: Optional[ForecastFutureDetails] = None
+
+    @property
+    def summary(self) -> Optional[ForecastFutureSummary]:
+        """A summary for this forecast."""
+        if self._raw_summary:
+            self._summary = ForecastFutureSummary.create(self._raw_summary)
+            self._raw_summary = None
+        return self._summary
+
+    @property
+    def details(self) -> Optional[ForecastFutureDetails]:
+        """The forecast data for this forecast."""
+        if self._raw_details:
+            self._details = ForecastFutureDetails.create(self._raw_details)
+            self._raw_details = None
+        return self._details
 
 
 class ForecastTime:
     """A class holding data about a forecast for a specific time.
 
+    Only the time is read when a ForecastTime is created.
+    The other attributes are parsed when they are first accessed.
+
     Attributes
     ----------
     time: :class:`str`
@@ -162,12 +257,204 @@ class ForecastTime:
         A ForecastFuture with data about the forecast the 12 hours.
     """
 
+    __slots__ = (
+        "time",
+        "_data",
+        "_details",
+        "_next_hour",
+        "_next_6_hours",
+        "_next_12_hours",
+    )
+
     def __init__(self, _data: APIForecastTime):
         self.time = _data["time"]
-        self.details = ForecastTimeDetails.create(_data["data"]["instant"]["details"])
-        self.next_hour = ForecastFuture(**_data["data"]["next_1_hours"])
-        self.next_6_hours = ForecastFuture(**_data["data"]["next_6_hours"])
-        self.next_12_hours = ForecastFuture(**_data["data"]["next_12_hours"])
+        self._data: APIForecastTimeData = _data["data"]
+        self._details: Optional[ForecastTimeDetails] = None
+        self._next_hour: Optional[ForecastFuture] = None
+        self._next_6_hours: Optional[ForecastFuture] = None
+        self._next_12_hours: Optional[ForecastFuture] = None
+
+    @property
+    def details(self) -> ForecastTimeDetails:
+        """The forecast data for this ForecastTime."""
+        if self._details is None:
+            self._details = ForecastTimeDetails.create(self._data["instant"]["details"])
+        return self._details
+
+    # Steps in the 6-hourly part of the timeseries have no next_1_hours,
+    # and the last steps may have no next_6_hours or next_12_hours either.
+
+    @property
+    def next_hour(self) -> ForecastFuture:
+        """A ForecastFuture with data about the forecast the next hour."""
+        if self._next_hour is None:
+            self._next_hour = ForecastFuture(**self._data.get("next_1_hours", {}))
+        return self._next_hour
+
+    @property
+    def next_6_hours(self) -> ForecastFuture:
+        """A ForecastFuture with data about the forecast the 6 hours."""
+        if self._next_6_hours is None:
+            self._next_6_hours = ForecastFuture(**self._data.get("next_6_hours", {}))
+        return self._next_6_hours
+
+    @property
+    def next_12_hours(self) -> ForecastFuture:
+        """A ForecastFuture with data about the forecast the 12 hours."""
+        if self._next_12_hours is None:
+            self._next_12_hours = ForecastFuture(**self._data.get("next_12_hours", {}))
+        return self._next_12_hours
+
+
+class ForecastTimes(Sequence[ForecastTime]):
+    """A view of some of the steps of a :class:`Forecast`, in chronological order.
+
+    The view only stores the positions of its steps in the forecast's timeseries.
+    Nothing is copied, and the :class:`ForecastTime` of a step is created when it's accessed.
+    Views can be indexed, sliced and narrowed further, for example
+    ``forecast.between(start, end).resample(timedelta(hours=3))``.
+    """
+
+    __slots__ = ("_timeseries", "_times", "_indices")
+
+    def __init__(
+        self,
+        timeseries: List[APIForecastTime],
+        times: List[int],
+        indices: Sequence[int],
+    ) -> None:
+        self._timeseries = timeseries
+        self._times = times
+        # Positions in the timeseries, in ascending order (a range, unless the view was resampled)
+        self._indices = indices
+
+    def _view(self, indices: Sequence[int]) -> "ForecastTimes":
+        return ForecastTimes(self._timeseries, self._times, indices)
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    @overload
+    def __getitem__(self, index: int) -> ForecastTime: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ForecastTimes": ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[ForecastTime, "ForecastTimes"]:
+        if isinstance(index, slice):
+            return self._view(self._indices[index])
+        return ForecastTime(self._timeseries[self._indices[index]])
+
+    def __iter__(self) -> Iterator[ForecastTime]:
+        for index in self._indices:
+            yield ForecastTime(self._timeseries[index])
+
+    def __repr__(self) -> str:
+        if not self._indices:
+            return "<ForecastTimes (empty)>"
+        first = self._timeseries[self._indices[0]]["time"]
+        last = self._timeseries[self._indices[-1]]["time"]
+        return f"<ForecastTimes {len(self)} steps from {first} to {last}>"
+
+    def _position(self, epoch: int) -> int:
+        """The position in this view of the first step starting at or after the time."""
+        return bisect_left(self._indices, bisect_left(self._times, epoch))
+
+    def between(self, start: datetime, end: datetime) -> "ForecastTimes":
+        """Get the steps starting from ``start`` (inclusive) until ``end`` (exclusive).
+
+        Naive datetimes are treated as UTC.
+
+        Parameters
+        ----------
+        start: datetime.datetime
+            The earliest start time of the steps.
+        end: datetime.datetime
+            The time all steps must start before.
+
+        Returns
+        -------
+        :class:`.ForecastTimes`
+            A view of the steps, which is empty if there are none.
+        """
+        _ensure_datetime(start)
+        _ensure_datetime(end)
+
+        first = self._position(_to_epoch(start))
+        last = max(first, self._position(_to_epoch(end)))
+
+        return self._view(self._indices[first:last])
+
+    def iter_times(
+        self, step: timedelta = timedelta(hours=1)
+    ) -> Iterator[ForecastTime]:
+        """Iterate over the steps, at least ``step`` apart.
+
+        Starting with the first step, the next step yielded is the first one starting at least ``step`` later.
+        In the 6-hourly part of the timeseries, a ``step`` shorter than 6 hours therefore yields every step,
+        without repeating any of them.
+
+        Parameters
+        ----------
+        step: datetime.timedelta
+            Optional: The minimum time between the steps yielded. Default is one hour.
+
+        Returns
+        -------
+        Iterator[:class:`.ForecastTime`]
+        """
+        seconds = _seconds(step, "step")
+
+        position = 0
+        while position < len(self._indices):
+            index = self._indices[position]
+            yield ForecastTime(self._timeseries[index])
+            position = max(position + 1, self._position(self._times[index] + seconds))
+
+    def resample(self, interval: timedelta) -> "ForecastTimes":
+        """Get the steps covering every multiple of ``interval`` since midnight UTC.
+
+        For every time which is a multiple of the interval (like 00:00, 06:00, 12:00 and 18:00 UTC
+        for 6 hours), the step covering that time is selected. A step covers the time from its start until
+        the next step starts. Steps are never repeated, so in the 6-hourly part of the timeseries,
+        an interval shorter than 6 hours selects every step.
+
+        Parameters
+        ----------
+        interval: datetime.timedelta
+            The interval between the times to select steps for.
+
+        Returns
+        -------
+        :class:`.ForecastTimes`
+            A view of the selected steps.
+        """
+        seconds = _seconds(interval, "interval")
+
+        selected: List[int] = []
+        if not self._indices:
+            return self._view(selected)
+
+        last = self._times[self._indices[-1]]
+        # The first multiple at or after the first step, as earlier times aren't covered
+        boundary = -(-self._times[self._indices[0]] // seconds) * seconds
+
+        while boundary <= last:
+            # The step covering the boundary is the last one starting at or before it
+            position = (
+                bisect_right(self._indices, bisect_right(self._times, boundary) - 1) - 1
+            )
+            selected.append(self._indices[position])
+
+            if position + 1 == len(self._indices):
+                break
+            # Skip the boundaries covered by the same step
+            following = self._times[self._indices[position + 1]]
+            boundary = max(boundary + seconds, -(-following // seconds) * seconds)
+
+        return self._view(selected)
 
 
 class Forecast:
@@ -196,13 +483,26 @@ class Forecast:
         # The timeseries used internally is kept as a dict
         self._timeseries = forecast_data["properties"]["timeseries"]
 
-    def _conv_to_nearest_hour(self, date: datetime) -> datetime:
-        if date.minute >= 30:
-            return date.replace(
-                microsecond=0, second=0, minute=0, hour=date.hour
-            ) + timedelta(hours=1)
+        # Index of the timeseries, built once: sorted epoch timestamps for
+        # binary search, and a dict for exact lookups.
+        self._times: List[int] = [_parse_time(t["time"]) for t in self._timeseries]
+        self._time_index: Dict[int, int] = {t: i for i, t in enumerate(self._times)}
+
+    def _find_index(self, epoch: int) -> Optional[int]:
+        """Find the index of the step which covers the given time.
+
+        An exact match is returned if one exists. Otherwise, the latest step starting before
+        the time is used, which covers times in the 6-hourly part of the timeseries.
+        None is returned if the time is outside the timeseries.
+        """
+        index = self._time_index.get(epoch)
+        if index is not None:
+            return index
+
+        if not self._times or not self._times[0] <= epoch <= self._times[-1]:
+            return None
 
-        return date.replace(microsecond=0, second=0, minute=0)
+        return bisect_right(self._times, epoch) - 1
 
     def now(self) -> ForecastTime:
         """Get the newest :class:`ForecastTime` for this Forecast.
@@ -211,18 +511,13 @@ class Forecast:
         -------
         :class:`.ForecastTime`
         """
-        now = datetime.utcnow()
-        time = self._conv_to_nearest_hour(now)
-
-        nearest_hour = time.strftime("%Y-%m-%dT%H:%M:%SZ")
+        now = _to_epoch(datetime.now(timezone.utc))
 
         # Try to get the data for the nearest hour from API data
-        filtered_time = list(
-            filter(lambda t: t["time"] == nearest_hour, self._timeseries)
-        )
+        index = self._find_index(_round_to_nearest_hour(now))
 
-        if filtered_time:
-            return ForecastTime(filtered_time[0])
+        if index is not None:
+            return ForecastTime(self._timeseries[index])
 
         return ForecastTime(self._timeseries[0])
 
@@ -230,6 +525,10 @@ class Forecast:
         """Get a certain :class:`ForecastTime` by specifying the time.
         The time will be rounded to the nearest hour.
 
+        If the timeseries has no step at that hour (which is the case for the 6-hourly
+        part of the forecast), the step covering the time is returned.
+        Naive datetimes are treated as UTC.
+
         Parameters
         ----------
         time: datetime.datetime
@@ -239,19 +538,259 @@ class Forecast:
         -------
         :class:`.ForecastTime` | None
         """
-        if not isinstance(time, datetime):
-            raise ValueError(
-                "Type of time should be datetime.datetime.\nFor more information, see https://docs.python.org/3/library/datetime.html"
-            )
+        _ensure_datetime(time)
 
-        time = self._conv_to_nearest_hour(time)
-        formatted_time = time.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        found_time = list(
-            filter(lambda t: t["time"] == formatted_time, self._timeseries)
-        )
+        index = self._find_index(_round_to_nearest_hour(_to_epoch(time)))
 
-        if found_time:
-            return ForecastTime(found_time[0])
+        if index is not None:
+            return ForecastTime(self._timeseries[index])
 
         return None
+
+    def get_closest_forecast_time(self, time: datetime) -> ForecastTime:
+        """Get the :class:`ForecastTime` closest to the specified time.
+
+        Unlike :meth:`get_forecast_time`, this never returns None: times before or after
+        the timeseries return the first or the last step respectively.
+        Naive datetimes are treated as UTC.
+
+        Parameters
+        ----------
+        time: datetime.datetime
+            The datetime to find the closest forecast step for.
+
+        Returns
+        -------
+        :class:`.ForecastTime`
+        """
+        _ensure_datetime(time)
+
+        epoch = _to_epoch(time)
+        index = bisect_right(self._times, epoch)
+
+        if index == 0:
+            return ForecastTime(self._timeseries[0])
+
+        if index == len(self._times):
+            return ForecastTime(self._timeseries[-1])
+
+        # Pick whichever neighbour is closer
+        if epoch - self._times[index - 1] <= self._times[index] - epoch:
+            index -= 1
+
+        return ForecastTime(self._timeseries[index])
+
+    def _view(self) -> ForecastTimes:
+        return ForecastTimes(self._timeseries, self._times, range(len(self._times)))
+
+    def between(self, start: datetime, end: datetime) -> ForecastTimes:
+        """Get the steps starting from ``start`` (inclusive) until ``end`` (exclusive).
+
+        For example, ``forecast.between(datetime(2024, 1, 16, 6), datetime(2024, 1, 16, 18))``
+        gets the steps from 06:00 until 18:00 UTC on January 16th.
+        Naive datetimes are treated as UTC.
+
+        Parameters
+        ----------
+        start: datetime.datetime
+            The earliest start time of the steps.
+        end: datetime.datetime
+            The time all steps must start before.
+
+        Returns
+        -------
+        :class:`.ForecastTimes`
+            A view of the steps, which is empty if there are none.
+        """
+        return self._view().between(start, end)
+
+    def iter_times(
+        self, step: timedelta = timedelta(hours=1)
+    ) -> Iterator[ForecastTime]:
+        """Iterate over the steps of the timeseries, at least ``step`` apart.
+
+        See :meth:`ForecastTimes.iter_times`.
+
+        Parameters
+        ----------
+        step: datetime.timedelta
+            Optional: The minimum time between the steps yielded. Default is one hour.
+
+        Returns
+        -------
+        Iterator[:class:`.ForecastTime`]
+        """
+        return self._view().iter_times(step)
+
+    def resample(self, interval: timedelta) -> ForecastTimes:
+        """Get the steps covering every multiple of ``interval`` since midnight UTC.
+
+        See :meth:`ForecastTimes.resample`.
+
+        Parameters
+        ----------
+        interval: datetime.timedelta
+            The interval between the times to select steps for.
+
+        Returns
+        -------
+        :class:`.ForecastTimes`
+            A view of the selected steps.
+        """
+        return self._view().resample(interval)
+
+    def to_frame(self) -> "ForecastFrame":
+        """Build a columnar :class:`.ForecastFrame` of this forecast's timeseries.
+
+        This requires NumPy, which can be installed with ``pip install yr-weather[numpy]``.
+
+        Returns
+        -------
+        :class:`.ForecastFrame`
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from yr_weather.data.frame import ForecastFrame
+
+        return ForecastFrame(self._timeseries)
+
+    def daily_summary(self, tz: Union[str, "tzinfo"] = timezone.utc) -> "DailySummary":
+        """Aggregate this forecast by local day, in one vectorized pass over the timeseries.
+
+        Every day has the lowest and highest air temperature, the total precipitation,
+        the strongest wind gust and the symbol code covering the most hours of the day.
+        See :meth:`ForecastFrame.daily_summary`.
+
+        This requires NumPy, which can be installed with ``pip install yr-weather[numpy]``.
+
+        Parameters
+        ----------
+        tz: :class:`str` | :class:`datetime.tzinfo`
+            Optional: The timezone of the days, as a tzinfo or a name like ``"Europe/Oslo"``. Default is UTC.
+
+        Returns
+        -------
+        :class:`.DailySummary`
+        """
+        return self.to_frame().daily_summary(tz)
+
+    def interpolate(
+        self,
+        times: Union["np.ndarray", Iterable[datetime]],
+        variables: Optional[Iterable[str]] = None,
+    ) -> Dict[str, "np.ndarray"]:
+        """Interpolate instant variables at any number of times at once, like the ETAs along a route.
+
+        Unlike :meth:`get_forecast_time`, times aren't rounded, and times in the 6-hourly part of the timeseries
+        are interpolated between the 6-hourly steps. ``wind_from_direction`` is interpolated along the shortest arc.
+        See :meth:`ForecastFrame.interpolate`.
+
+        This requires NumPy, which can be installed with ``pip install yr-weather[numpy]``.
+
+        Parameters
+        ----------
+        times: :class:`numpy.ndarray` | Iterable[datetime.datetime]
+            The times to interpolate at, as datetimes (naive datetimes are treated as UTC),
+            or as a numpy array of datetime64 values or seconds since the epoch.
+        variables: Optional[Iterable[:class:`str`]]
+            Optional: The names of the instant variables to interpolate, like ``"air_temperature"``.
+            Default is all of them.
+
+        Returns
+        -------
+        dict[:class:`str`, :class:`numpy.ndarray`]
+            A float64 array of values for every variable, with one value per time.
+            Values for times outside the timeseries are NaN.
+        """
+        return self.to_frame().interpolate(times, variables)
+
+
+@dataclass
+class ForecastResult:
+    """The result of fetching a forecast for one point in a batch.
+
+    Attributes
+    ----------
+    point: tuple[:class:`float`, :class:`float`]
+        The (latitude, longitude) pair which was requested.
+    forecast: Optional[:class:`.Forecast`]
+        The forecast, or None if fetching it failed.
+    error: Optional[:class:`Exception`]
+        The exception raised while fetching the forecast, or None if it succeeded.
+    """
+
+    point: Tuple[float, float]
+    forecast: Optional[Forecast] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the forecast was fetched successfully."""
+        return self.error is None
+
+
+class ForecastArea:
+    """Forecasts for a regular lattice of points covering an area, returned by :meth:`yr_weather.Locationforecast.prefetch_area`.
+
+    The lattice is indexed by position, so :meth:`nearest` finds the forecast of the nearest lattice point
+    to any location without searching. Lattice points which were normalized to the same coordinates share a forecast.
+
+    Attributes
+    ----------
+    bbox: tuple[:class:`float`, :class:`float`, :class:`float`, :class:`float`]
+        The area covered, as (south, west, north, east) in degrees.
+    spacing: :class:`float`
+        The distance between the lattice points in degrees.
+    shape: tuple[:class:`int`, :class:`int`]
+        The number of rows (latitudes) and columns (longitudes) of the lattice.
+    """
+
+    def __init__(
+        self,
+        bbox: Tuple[float, float, float, float],
+        spacing: float,
+        shape: Tuple[int, int],
+        cells: List[Tuple[float, float]],
+        results: Dict[Tuple[float, float], ForecastResult],
+    ) -> None:
+        self.bbox = bbox
+        self.spacing = spacing
+        self.shape = shape
+        # The normalized point of every lattice point, row by row from the south-west corner
+        self._cells = cells
+        self._results = results
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __iter__(self) -> Iterator[ForecastResult]:
+        return iter(self._results.values())
+
+    @property
+    def points(self) -> List[Tuple[float, float]]:
+        """The unique (latitude, longitude) pairs which were fetched."""
+        return list(self._results)
+
+    def nearest(self, lat: float, lon: float) -> ForecastResult:
+        """Get the result of the lattice point nearest to a location.
+
+        Locations outside the area get the result of the nearest point on its edge.
+
+        Parameters
+        ----------
+        lat: :class:`float` | :class:`int`
+            The latitude of the location.
+        lon: :class:`float` | :class:`int`
+            The longitude of the location.
+
+        Returns
+        -------
+        :class:`.ForecastResult`
+            The result of the nearest point, with either a forecast or an error.
+        """
+        south, west = self.bbox[0], self.bbox[1]
+        rows, columns = self.shape
+
+        row = min(max(round((lat - south) / self.spacing), 0), rows - 1)
+        column = min(max(round((lon - west) / self.spacing), 0), columns - 1)
+
+        return self._results[self._cells[row * columns + column]]
@@ -0,0 +1,429 @@
+"""A compact binary file of parsed forecasts, which can be memory-mapped.
+
+:func:`write_snapshot` stores a set of :class:`.Forecast` objects in one file, and :class:`ForecastSnapshot`
+memory-maps it again, so a restarted process can answer queries like :meth:`.Forecast.now` right away,
+without downloading or parsing anything. Only the parts of the file which are used are read from disk.
+
+The file holds one row of float32 values per variable, covering the steps of all forecasts,
+a column of step times in seconds since the epoch, the symbol code of every period as an index into
+a table of strings, and an index of where the steps of every location are. Symbol confidences aren't stored.
+
+NumPy is an optional dependency, install it with ``pip install yr-weather[numpy]``.
+"""
+
+import json
+import os
+import struct
+from datetime import timedelta
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+try:
+    import numpy as np
+except ImportError as exc:
+    raise ImportError(
+        "ForecastSnapshot requires numpy. Install it with 'pip install yr-weather[numpy]'."
+    ) from exc
+
+from yr_weather.api_types.locationforecast import APIForecastTime
+from yr_weather.data.frame import FUTURE_VARIABLES, INSTANT_VARIABLES, PERIODS
+from yr_weather.data.locationforecast import (
+    Forecast,
+    ForecastGeometry,
+    ForecastUnits,
+    _EPOCH,
+)
+
+_MAGIC = b"YRSNAP\x00\x00"
+_VERSION = 1
+# Magic, version, number of locations, number of steps, and the size of the metadata
+_HEADER = struct.Struct("<8sIQQQ")
+
+_LOCATION_DTYPE = np.dtype(
+    [("lat", "<f8"), ("lon", "<f8"), ("start", "<i8"), ("count", "<i8")]
+)
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) // 8 * 8
+
+
+def _layout(
+    locations: int, steps: int, instant: int, future: int
+) -> Dict[str, Tuple[int, np.dtype, Tuple[int, ...]]]:
+    """The offset, type and shape of every array in a snapshot, in the order they're stored."""
+    arrays = {
+        "locations": (_LOCATION_DTYPE, (locations,)),
+        "time": (np.dtype("<i8"), (steps,)),
+        "instant": (np.dtype("<f4"), (instant, steps)),
+        "future": (np.dtype("<f4"), (len(PERIODS), future, steps)),
+        "symbols": (np.dtype("<i2"), (len(PERIODS), steps)),
+    }
+
+    layout = {}
+    offset = _HEADER.size
+    for name, (dtype, shape) in arrays.items():
+        layout[name] = (offset, dtype, shape)
+        offset = _align(offset + dtype.itemsize * int(np.prod(shape)))
+
+    return layout
+
+
+def _key(lat: float, lon: float) -> Tuple[float, float]:
+    """The key of a location, rounded to the precision used in requests."""
+    return round(lat, 4), round(lon, 4)
+
+
+def write_snapshot(
+    path: Union[str, "os.PathLike[str]"], forecasts: Iterable[Forecast]
+) -> None:
+    """Write forecasts to a snapshot file, which can be opened with :class:`ForecastSnapshot`.
+
+    Every forecast is stored under the location in its geometry, rounded to 4 decimals.
+    The file is written next to ``path`` first and then replaces it, so readers never see a partial file.
+
+    Parameters
+    ----------
+    path: :class:`str` | :class:`os.PathLike`
+        The path of the file.
+    forecasts: Iterable[:class:`.Forecast`]
+        The forecasts, for different locations.
+    """
+    frames = []
+    metadata: List[Dict[str, Any]] = []
+    keys = set()
+
+    for forecast in forecasts:
+        coordinates = forecast.geometry.coordinates
+        if not coordinates or len(coordinates) < 2:
+            raise ValueError("Every forecast must have coordinates in its geometry.")
+
+        key = _key(coordinates[1], coordinates[0])
+        if key in keys:
+            raise ValueError(f"More than one forecast is for the location {key}.")
+        keys.add(key)
+
+        frames.append((key, forecast.to_frame()))
+        metadata.append(
+            {
+                "type": forecast.type,
+                "geometry": {
+                    "type": forecast.geometry.type,
+                    "coordinates": coordinates,
+                },
+                "updated_at": forecast.updated_at,
+                "units": {
+                    name: value
+                    for name, value in vars(forecast.units).items()
+                    if value is not None
+                },
+            }
+        )
+
+    steps = sum(len(frame) for _, frame in frames)
+    layout = _layout(len(frames), steps, len(INSTANT_VARIABLES), len(FUTURE_VARIABLES))
+    arrays = {
+        name: np.zeros(shape, dtype=dtype) for name, (_, dtype, shape) in layout.items()
+    }
+
+    strings: Dict[str, int] = {}
+    start = 0
+    for location, (key, frame) in enumerate(frames):
+        end = start + len(frame)
+        arrays["locations"][location] = (key[0], key[1], start, len(frame))
+        arrays["time"][start:end] = frame.time
+        arrays["instant"][:, start:end] = frame.instant
+
+        # Symbol codes are indices into the frame's symbols, which become indices into the string table.
+        # The last entry maps the -1 of steps without a symbol to itself.
+        codes = np.array(
+            [strings.setdefault(symbol, len(strings)) for symbol in frame.symbols]
+            + [-1],
+            dtype=np.int16,
+        )
+        for period_index, period in enumerate(PERIODS):
+            arrays["future"][period_index, :, start:end] = getattr(frame, period)
+            arrays["symbols"][period_index, start:end] = codes[
+                frame.symbol_codes[period]
+            ]
+
+        start = end
+
+    meta = json.dumps(
+        {
+            "instant": INSTANT_VARIABLES,
+            "future": FUTURE_VARIABLES,
+            "strings": list(strings),
+            "locations": metadata,
+        }
+    ).encode("utf-8")
+
+    temporary = f"{os.fspath(path)}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(_HEADER.pack(_MAGIC, _VERSION, len(frames), steps, len(meta)))
+        for name, (offset, _, _) in layout.items():
+            file.write(b"\0" * (offset - file.tell()))
+            file.write(arrays[name].tobytes())
+        file.write(b"\0" * (_align(file.tell()) - file.tell()))
+        file.write(meta)
+
+    os.replace(temporary, path)
+
+
+def _values(names: Sequence[str], column: np.ndarray) -> Dict[str, float]:
+    """The values of a column of float32 values which aren't missing, by variable name."""
+    # The shortest representation of a float32 is the decimal value it was stored from
+    return {
+        name: float(str(value))
+        for name, value in zip(names, column)
+        if not np.isnan(value)
+    }
+
+
+class _SnapshotArrays:
+    """The memory-mapped steps of a snapshot, shared by the snapshot and its forecasts."""
+
+    __slots__ = (
+        "time",
+        "instant",
+        "future",
+        "symbols",
+        "instant_names",
+        "future_names",
+        "strings",
+    )
+
+    def __init__(
+        self,
+        time: np.ndarray,
+        instant: np.ndarray,
+        future: np.ndarray,
+        symbols: np.ndarray,
+        meta: Dict[str, Any],
+    ) -> None:
+        self.time = time
+        self.instant = instant
+        self.future = future
+        self.symbols = symbols
+        self.instant_names: List[str] = meta["instant"]
+        self.future_names: List[str] = meta["future"]
+        self.strings: List[str] = meta["strings"]
+
+    def step(self, step: int) -> APIForecastTime:
+        """Build the API data of a step."""
+        time = _EPOCH + timedelta(seconds=int(self.time[step]))
+        data: Dict[str, Any] = {
+            "instant": {"details": _values(self.instant_names, self.instant[:, step])}
+        }
+
+        for period_index, period in enumerate(PERIODS):
+            details = _values(self.future_names, self.future[period_index, :, step])
+            symbol = int(self.symbols[period_index, step])
+            if not details and symbol < 0:
+                continue
+
+            future: Dict[str, Any] = {"details": details}
+            if symbol >= 0:
+                future["summary"] = {"symbol_code": self.strings[symbol]}
+            data[period] = future
+
+        return {"time": time.strftime("%Y-%m-%dT%H:%M:%SZ"), "data": data}  # type: ignore[typeddict-item]
+
+
+class _SnapshotTimeseries(Sequence[APIForecastTime]):
+    """The timeseries of a forecast in a snapshot, building the API data of a step when it's used."""
+
+    __slots__ = ("_arrays", "_start", "_count")
+
+    def __init__(self, arrays: _SnapshotArrays, start: int, count: int) -> None:
+        self._arrays = arrays
+        self._start = start
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> APIForecastTime: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[APIForecastTime]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Step index out of range")
+
+        return self._arrays.step(self._start + index)
+
+    def __iter__(self) -> Iterator[APIForecastTime]:
+        for index in range(self._count):
+            yield self[index]
+
+
+class SnapshotForecast(Forecast):
+    """A :class:`.Forecast` stored in a :class:`ForecastSnapshot`.
+
+    It has all the methods of :class:`.Forecast`, but its steps are read from the snapshot when they're used.
+    It keeps the file mapped, so it can still be used after the snapshot is closed.
+    """
+
+    # pylint: disable-next=super-init-not-called
+    def __init__(self, snapshot: "ForecastSnapshot", location: int) -> None:
+        meta = snapshot._meta["locations"][location]  # pylint: disable=protected-access
+        entry = snapshot._locations[location]  # pylint: disable=protected-access
+        start, count = int(entry["start"]), int(entry["count"])
+
+        self.type = meta["type"]
+        self.geometry = ForecastGeometry.create(meta["geometry"])
+        self.updated_at = meta["updated_at"]
+        self.units = ForecastUnits.create(meta["units"])
+
+        arrays = snapshot._arrays  # pylint: disable=protected-access
+        self._timeseries = _SnapshotTimeseries(arrays, start, count)  # type: ignore[assignment]
+        self._times = arrays.time[start : start + count].tolist()
+        self._time_index = {t: i for i, t in enumerate(self._times)}
+
+
+class ForecastSnapshot:
+    """Forecasts stored by :func:`write_snapshot`, memory-mapped from the file.
+
+    Opening a snapshot only reads its header and its index of locations. The forecasts are read
+    from the file as they're used::
+
+        write_snapshot("forecasts.snap", forecasts)
+        ...
+        snapshot = ForecastSnapshot("forecasts.snap")
+        snapshot.get(59.91, 10.75).now()
+
+    Parameters
+    ----------
+    path: :class:`str` | :class:`os.PathLike`
+        The path of the file.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = os.fspath(path)
+
+        with open(self.path, "rb") as file:
+            header = file.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError(f"{self.path} is not a forecast snapshot.")
+
+            magic, version, locations, steps, meta_size = _HEADER.unpack(header)
+            if magic != _MAGIC:
+                raise ValueError(f"{self.path} is not a forecast snapshot.")
+            if version != _VERSION:
+                raise ValueError(
+                    f"{self.path} has version {version} of the snapshot format, which isn't supported."
+                )
+
+            size = file.seek(0, os.SEEK_END)
+            file.seek(size - meta_size)
+            self._meta = json.loads(file.read(meta_size))
+
+        layout = _layout(
+            locations, steps, len(self._meta["instant"]), len(self._meta["future"])
+        )
+        arrays = {
+            name: (
+                np.memmap(self.path, dtype=dtype, mode="r", offset=offset, shape=shape)
+                if np.prod(shape)
+                else np.zeros(shape, dtype=dtype)
+            )
+            for name, (offset, dtype, shape) in layout.items()
+        }
+        self._locations = arrays["locations"]
+        self._arrays = _SnapshotArrays(
+            arrays["time"],
+            arrays["instant"],
+            arrays["future"],
+            arrays["symbols"],
+            self._meta,
+        )
+
+        self._index: Dict[Tuple[float, float], int] = {
+            (float(lat), float(lon)): location
+            for location, (lat, lon) in enumerate(
+                zip(self._locations["lat"].tolist(), self._locations["lon"].tolist())
+            )
+        }
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, location: object) -> bool:
+        if not isinstance(location, tuple) or len(location) != 2:
+            return False
+        return _key(*location) in self._index
+
+    def __iter__(self) -> Iterator[Tuple[float, float]]:
+        """Iterate over the (lat, lon) locations of the forecasts."""
+        return iter(self._index)
+
+    def __repr__(self) -> str:
+        return f"<ForecastSnapshot {self.path!r} ({len(self)} locations)>"
+
+    def close(self) -> None:
+        """Stop using the file.
+
+        No more forecasts can be read from the snapshot, but the forecasts read before keep working:
+        the file is unmapped once none of them is used either.
+        """
+        # Forecasts read before keep their own reference to the mapped arrays
+        empty = [
+            np.zeros(array.shape[:-1] + (0,), dtype=array.dtype)
+            for array in (
+                self._arrays.time,
+                self._arrays.instant,
+                self._arrays.future,
+                self._arrays.symbols,
+            )
+        ]
+        self._arrays = _SnapshotArrays(
+            empty[0], empty[1], empty[2], empty[3], self._meta
+        )
+        self._locations = np.zeros(0, dtype=_LOCATION_DTYPE)
+        self._index = {}
+
+    def __enter__(self) -> "ForecastSnapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get(self, lat: float, lon: float) -> SnapshotForecast:
+        """Get the forecast of a location.
+
+        Parameters
+        ----------
+        lat: :class:`float`
+            The latitude of the location.
+        lon: :class:`float`
+            The longitude of the location.
+
+        Returns
+        -------
+        :class:`SnapshotForecast`
+            The forecast, which is a :class:`.Forecast`.
+        """
+        location = self._index.get(_key(lat, lon))
+        if location is None:
+            raise KeyError(
+                f"No forecast for the location ({lat}, {lon}) in the snapshot."
+            )
+
+        return SnapshotForecast(self, location)
@@ -0,0 +1,300 @@
+"""Compact struct types, decoded and validated directly from API responses, backed by msgspec.
+
+The data classes in :mod:`yr_weather.data` are built from the dicts the JSON decoder returns,
+so every response is held twice while they are built. The decoders in this module instead build
+the structs below while decoding the response body, without any intermediate dicts.
+Every field is validated against its type while decoding, and malformed responses raise a
+:class:`msgspec.ValidationError` (a subclass of :class:`ValueError`) which includes the path
+of the invalid value, like ``$.properties.timeseries[3].data.instant.details.air_temperature``.
+
+Keys which the structs don't know are ignored, like by the data classes.
+Structs are immutable, as they may be shared by the clients' caches, and as they can't contain
+reference cycles, they're not tracked by the garbage collector.
+
+msgspec is an optional dependency, install it with ``pip install yr-weather[msgspec]``.
+"""
+
+from typing import List, Literal, Optional, Union
+
+try:
+    import msgspec
+except ImportError as exc:
+    raise ImportError(
+        "The struct decoders require msgspec. Install it with 'pip install yr-weather[msgspec]'."
+    ) from exc
+
+
+class ForecastGeometryStruct(msgspec.Struct, frozen=True, gc=False):
+    """Geometry data for a forecast, like :class:`.ForecastGeometry`."""
+
+    type: str
+    coordinates: List[float]
+
+
+class ForecastUnitsStruct(msgspec.Struct, frozen=True, gc=False):
+    """Units used by a forecast, like :class:`.ForecastUnits`."""
+
+    air_pressure_at_sea_level: Optional[str] = None
+    air_temperature: Optional[str] = None
+    air_temperature_max: Optional[str] = None
+    air_temperature_min: Optional[str] = None
+    air_temperature_percentile_10: Optional[str] = None
+    air_temperature_percentile_90: Optional[str] = None
+    cloud_area_fraction: Optional[str] = None
+    cloud_area_fraction_high: Optional[str] = None
+    cloud_area_fraction_low: Optional[str] = None
+    cloud_area_fraction_medium: Optional[str] = None
+    dew_point_temperature: Optional[str] = None
+    fog_area_fraction: Optional[str] = None
+    precipitation_amount: Optional[str] = None
+    precipitation_amount_max: Optional[str] = None
+    precipitation_amount_min: Optional[str] = None
+    probability_of_precipitation: Optional[str] = None
+    probability_of_thunder: Optional[str] = None
+    relative_humidity: Optional[str] = None
+    ultraviolet_index_clear_sky: Optional[str] = None
+    wind_from_direction: Optional[str] = None
+    wind_speed: Optional[str] = None
+    wind_speed_of_gust: Optional[str] = None
+    wind_speed_percentile_10: Optional[str] = None
+    wind_speed_percentile_90: Optional[str] = None
+
+
+class ForecastMetaStruct(msgspec.Struct, frozen=True, gc=False):
+    """Forecast metadata."""
+
+    updated_at: str
+    units: ForecastUnitsStruct
+
+
+class ForecastTimeDetailsStruct(msgspec.Struct, frozen=True, gc=False):
+    """Details of weather data for a forecast time, like :class:`.ForecastTimeDetails`."""
+
+    air_pressure_at_sea_level: Optional[float] = None
+    air_temperature: Optional[float] = None
+    air_temperature_percentile_10: Optional[float] = None
+    air_temperature_percentile_90: Optional[float] = None
+    cloud_area_fraction: Optional[float] = None
+    cloud_area_fraction_high: Optional[float] = None
+    cloud_area_fraction_low: Optional[float] = None
+    cloud_area_fraction_medium: Optional[float] = None
+    dew_point_temperature: Optional[float] = None
+    fog_area_fraction: Optional[float] = None
+    relative_humidity: Optional[float] = None
+    ultraviolet_index_clear_sky: Optional[float] = None
+    wind_from_direction: Optional[float] = None
+    wind_speed: Optional[float] = None
+    wind_speed_of_gust: Optional[float] = None
+    wind_speed_percentile_10: Optional[float] = None
+    wind_speed_percentile_90: Optional[float] = None
+
+
+class ForecastInstantStruct(msgspec.Struct, frozen=True, gc=False):
+    """Instant data for a forecast time."""
+
+    details: ForecastTimeDetailsStruct
+
+
+class ForecastFutureSummaryStruct(msgspec.Struct, frozen=True, gc=False):
+    """Summary for a forecast predicting the weather in the future, like :class:`.ForecastFutureSummary`."""
+
+    symbol_code: Optional[str] = None
+    symbol_confidence: Optional[str] = None
+
+
+class ForecastFutureDetailsStruct(msgspec.Struct, frozen=True, gc=False):
+    """Details for a forecast predicting the weather in the future, like :class:`.ForecastFutureDetails`."""
+
+    air_pressure_at_sea_level: Optional[float] = None
+    air_temperature: Optional[float] = None
+    air_temperature_max: Optional[float] = None
+    air_temperature_min: Optional[float] = None
+    air_temperature_percentile_10: Optional[float] = None
+    air_temperature_percentile_90: Optional[float] = None
+    cloud_area_fraction: Optional[float] = None
+    cloud_area_fraction_high: Optional[float] = None
+    cloud_area_fraction_low: Optional[float] = None
+    cloud_area_fraction_medium: Optional[float] = None
+    dew_point_temperature: Optional[float] = None
+    fog_area_fraction: Optional[float] = None
+    precipitation_amount: Optional[float] = None
+    precipitation_amount_max: Optional[float] = None
+    precipitation_amount_min: Optional[float] = None
+    probability_of_precipitation: Optional[float] = None
+    probability_of_thunder: Optional[float] = None
+    relative_humidity: Optional[float] = None
+    ultraviolet_index_clear_sky: Optional[float] = None
+    wind_from_direction: Optional[float] = None
+    wind_speed: Optional[float] = None
+    wind_speed_of_gust: Optional[float] = None
+    wind_speed_percentile_10: Optional[float] = None
+    wind_speed_percentile_90: Optional[float] = None
+
+
+class ForecastFutureStruct(msgspec.Struct, frozen=True, gc=False):
+    """A forecast predicting the weather in the future, like :class:`.ForecastFuture`."""
+
+    summary: Optional[ForecastFutureSummaryStruct] = None
+    details: Optional[ForecastFutureDetailsStruct] = None
+
+
+class ForecastTimeDataStruct(msgspec.Struct, frozen=True, gc=False):
+    """The data of a forecast time.
+
+    Steps in the 6-hourly part of the timeseries have no ``next_1_hours``,
+    and the last steps may have no ``next_6_hours`` or ``next_12_hours`` either.
+    """
+
+    instant: ForecastInstantStruct
+    next_1_hours: Optional[ForecastFutureStruct] = None
+    next_6_hours: Optional[ForecastFutureStruct] = None
+    next_12_hours: Optional[ForecastFutureStruct] = None
+
+
+class ForecastTimeStruct(msgspec.Struct, frozen=True, gc=False):
+    """A forecast for a specific time, like :class:`.ForecastTime`."""
+
+    time: str
+    data: ForecastTimeDataStruct
+
+
+class ForecastPropertiesStruct(msgspec.Struct, frozen=True, gc=False):
+    """Forecast properties."""
+
+    meta: ForecastMetaStruct
+    timeseries: List[ForecastTimeStruct]
+
+
+class ForecastStruct(msgspec.Struct, frozen=True, gc=False):
+    """A location forecast, like :class:`.Forecast`."""
+
+    type: str
+    geometry: ForecastGeometryStruct
+    properties: ForecastPropertiesStruct
+
+
+class EventsGeometryStruct(msgspec.Struct, frozen=True, gc=False):
+    """Coordinates of sun or moon events, like :class:`.EventsGeometry`."""
+
+    type: str
+    coordinates: List[float]
+
+
+class EventsWhenStruct(msgspec.Struct, frozen=True, gc=False):
+    """The interval sun or moon events were calculated for."""
+
+    interval: List[str]
+
+
+class TimeWithAzimuthStruct(msgspec.Struct, frozen=True, gc=False):
+    """An event time with azimuth, like :class:`.TimeWithAzimuth`.
+
+    Both are None if the event doesn't happen, like sunrise during the polar night.
+    """
+
+    time: Optional[str] = None
+    azimuth: Optional[float] = None
+
+
+class TimeWithElevationStruct(msgspec.Struct, frozen=True, gc=False):
+    """An event time with disc centre elevation, like :class:`.TimeWithElevation`."""
+
+    time: str
+    disc_centre_elevation: float
+    visible: bool
+
+
+class SunPropertiesStruct(msgspec.Struct, frozen=True, gc=False):
+    """Sun events."""
+
+    body: Literal["Sun"]
+    sunrise: TimeWithAzimuthStruct
+    sunset: TimeWithAzimuthStruct
+    solarnoon: TimeWithElevationStruct
+    solarmidnight: TimeWithElevationStruct
+
+
+class MoonPropertiesStruct(msgspec.Struct, frozen=True, gc=False):
+    """Moon events."""
+
+    body: Literal["Moon"]
+    moonrise: TimeWithAzimuthStruct
+    moonset: TimeWithAzimuthStruct
+    high_moon: TimeWithElevationStruct
+    low_moon: TimeWithElevationStruct
+    moonphase: float
+
+
+class SunEventsStruct(msgspec.Struct, frozen=True, gc=False):
+    """Sun event data, like :class:`.SunEvents`."""
+
+    type: str
+    copyright: str
+    license_url: str = msgspec.field(name="licenseURL")
+    geometry: EventsGeometryStruct
+    when: EventsWhenStruct
+    properties: SunPropertiesStruct
+
+
+class MoonEventsStruct(msgspec.Struct, frozen=True, gc=False):
+    """Moon event data, like :class:`.MoonEvents`."""
+
+    type: str
+    copyright: str
+    license_url: str = msgspec.field(name="licenseURL")
+    geometry: EventsGeometryStruct
+    when: EventsWhenStruct
+    properties: MoonPropertiesStruct
+
+
+_forecast_decoder = msgspec.json.Decoder(ForecastStruct)
+_sun_events_decoder = msgspec.json.Decoder(SunEventsStruct)
+_moon_events_decoder = msgspec.json.Decoder(MoonEventsStruct)
+
+
+def decode_forecast_struct(document: Union[str, bytes]) -> ForecastStruct:
+    """Decode and validate a Locationforecast response.
+
+    Parameters
+    ----------
+    document: :class:`str` | :class:`bytes`
+        The body of the response.
+
+    Returns
+    -------
+    :class:`ForecastStruct`
+        The decoded forecast.
+    """
+    return _forecast_decoder.decode(document)
+
+
+def decode_sun_events_struct(document: Union[str, bytes]) -> SunEventsStruct:
+    """Decode and validate a Sunrise sun events response.
+
+    Parameters
+    ----------
+    document: :class:`str` | :class:`bytes`
+        The body of the response.
+
+    Returns
+    -------
+    :class:`SunEventsStruct`
+        The decoded events.
+    """
+    return _sun_events_decoder.decode(document)
+
+
+def decode_moon_events_struct(document: Union[str, bytes]) -> MoonEventsStruct:
+    """Decode and validate a Sunrise moon events response.
+
+    Parameters
+    ----------
+    document: :class:`str` | :class:`bytes`
+        The body of the response.
+
+    Returns
+    -------
+    :class:`MoonEventsStruct`
+        The decoded events.
+    """
+    return _moon_events_decoder.decode(document)
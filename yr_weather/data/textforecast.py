@@ -11,7 +11,7 @@ from yr_weather.api_types.textforecast import (
 )
 
 
-@dataclass
+@dataclass(frozen=True)
 class TextForecastArea:
     """A text forecast area from the /areas endpoint"""
 
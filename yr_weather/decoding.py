@@ -0,0 +1,224 @@
+"""Decoders for API responses.
+
+JSON is decoded with :func:`loads`, which uses `orjson <https://pypi.org/project/orjson/>`__
+or `msgspec <https://pypi.org/project/msgspec/>`__ if one of them is installed, as they are considerably faster
+than the :mod:`json` module. Install orjson with ``pip install yr-weather[fast]``.
+
+A complete forecast is large, and most callers only use its first steps.
+:func:`decode_forecast` can decode only the start of the timeseries, skipping the rest of
+the document without building Python objects for it.
+"""
+
+import json
+import re
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+
+from yr_weather.api_types.locationforecast import APIForecast
+
+# Available JSON decoders by name, in order of preference
+JSON_BACKENDS: Dict[str, Callable[[Union[str, bytes]], Any]] = {}
+
+try:
+    import orjson
+
+    JSON_BACKENDS["orjson"] = orjson.loads
+except ImportError:
+    pass
+
+try:
+    import msgspec
+
+    JSON_BACKENDS["msgspec"] = msgspec.json.decode
+except ImportError:
+    pass
+
+JSON_BACKENDS["json"] = json.loads
+
+JSON_BACKEND = next(iter(JSON_BACKENDS))
+"""The name of the JSON decoder used by :func:`loads`."""
+
+loads = JSON_BACKENDS[JSON_BACKEND]
+"""Decode a JSON document, given as :class:`str` or UTF-8 encoded :class:`bytes`.
+
+Raises a :class:`ValueError` if the document is invalid, like :func:`json.loads`.
+"""
+
+_decoder = json.JSONDecoder()
+_whitespace = re.compile(r"[ \t\n\r]*")
+# Strings (which may contain brackets) and brackets, the only tokens that matter when skipping
+_skip_tokens = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]')
+
+
+class _Scanner:
+    """Walks a JSON document, decoding only the values which are asked for."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.pos = 0
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.text, self.pos)
+
+    def _next(self) -> str:
+        """Get the next character which isn't whitespace, and move past it."""
+        self.pos = _whitespace.match(self.text, self.pos).end()  # type: ignore[union-attr]
+        if self.pos >= len(self.text):
+            raise self._error("Unexpected end of document")
+
+        char = self.text[self.pos]
+        self.pos += 1
+        return char
+
+    def _expect(self, char: str) -> None:
+        if self._next() != char:
+            self.pos -= 1
+            raise self._error(f"Expecting '{char}'")
+
+    def value(self) -> Any:
+        """Decode the next value."""
+        self.pos = _whitespace.match(self.text, self.pos).end()  # type: ignore[union-attr]
+        value, self.pos = _decoder.raw_decode(self.text, self.pos)
+        return value
+
+    def skip(self, depth: int = 0) -> None:
+        """Move past the next value without decoding it.
+
+        With a ``depth`` above 0, the scanner is inside that many arrays or objects,
+        and moves past the end of all of them.
+        """
+        if depth == 0:
+            self.pos = _whitespace.match(self.text, self.pos).end()  # type: ignore[union-attr]
+            if self.text[self.pos : self.pos + 1] not in ("{", "["):
+                self.value()
+                return
+
+        for token in _skip_tokens.finditer(self.text, self.pos):
+            char = token.group()
+            if char in ("{", "["):
+                depth += 1
+            elif char in ("}", "]"):
+                depth -= 1
+                if depth == 0:
+                    self.pos = token.end()
+                    return
+
+        self.pos = len(self.text)
+        raise self._error("Unterminated array or object")
+
+    def members(self) -> Iterator[str]:
+        """Iterate over the keys of the next object.
+
+        The value of every key must be decoded or skipped before the next key is read.
+        """
+        self._expect("{")
+        if self._next() == "}":
+            return
+        self.pos -= 1
+
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise self._error("Expecting property name")
+            self._expect(":")
+
+            yield key
+
+            char = self._next()
+            if char == "}":
+                return
+            if char != ",":
+                self.pos -= 1
+                raise self._error("Expecting ',' delimiter")
+
+    def items(self) -> Iterator[None]:
+        """Iterate over the items of the next array, like :meth:`members`."""
+        self._expect("[")
+        if self._next() == "]":
+            return
+        self.pos -= 1
+
+        while True:
+            yield None
+
+            char = self._next()
+            if char == "]":
+                return
+            if char != ",":
+                self.pos -= 1
+                raise self._error("Expecting ',' delimiter")
+
+
+def _decode_forecast(text: str, max_steps: int) -> Tuple[APIForecast, int]:
+    """Decode the first ``max_steps`` steps of a forecast.
+
+    Returns the forecast, and the number of characters which were read.
+    Reading stops as soon as everything needed has been found.
+    """
+    scanner = _Scanner(text)
+    forecast: dict = {}
+    properties: dict = {}
+    steps: list = []
+
+    def done() -> bool:
+        return (
+            "type" in forecast
+            and "geometry" in forecast
+            and "meta" in properties
+            and len(steps) >= max_steps
+        )
+
+    for key in scanner.members():
+        if key != "properties":
+            forecast[key] = scanner.value()
+            continue
+
+        forecast["properties"] = properties
+        for prop in scanner.members():
+            if prop != "timeseries":
+                properties[prop] = scanner.value()
+                continue
+
+            properties["timeseries"] = steps
+            for _ in scanner.items():
+                if len(steps) == max_steps:
+                    if done():
+                        return forecast, scanner.pos  # type: ignore[return-value]
+                    # The rest of the array is skipped, the scanner is inside it
+                    scanner.skip(depth=1)
+                    break
+                steps.append(scanner.value())
+
+            if done():
+                return forecast, scanner.pos  # type: ignore[return-value]
+
+    return forecast, scanner.pos  # type: ignore[return-value]
+
+
+def decode_forecast(
+    document: Union[str, bytes], max_steps: Optional[int] = None
+) -> APIForecast:
+    """Decode a Locationforecast response.
+
+    Parameters
+    ----------
+    document: :class:`str` | :class:`bytes`
+        The body of the response.
+    max_steps: Optional[:class:`int`]
+        Optional: Only decode the first ``max_steps`` steps of the timeseries.
+        The rest of the timeseries is skipped without being decoded. Default is to decode all steps.
+
+    Returns
+    -------
+    :class:`.APIForecast`
+        The decoded forecast.
+    """
+    if max_steps is None:
+        return loads(document)
+
+    if max_steps < 1:
+        raise ValueError("The 'max_steps' parameter must be at least 1.")
+
+    if isinstance(document, bytes):
+        document = document.decode("utf-8")
+
+    return _decode_forecast(document, max_steps)[0]
@@ -3,15 +3,63 @@
 from typing import Optional, Literal, get_args
 import requests
 from .client import APIClient
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
 
 from .api_types.geosatellite import SatArea
 
 
+def _image_query(
+    area: str, img_type: str, time: Optional[str] = None, size: str = "normal"
+) -> str:
+    """Validate the parameters of an image request and build its query."""
+    area_args = list(get_args(SatArea))
+    type_args = ["infrared", "visible"]
+    size_args = ["normal", "small"]
+
+    if area not in area_args:
+        raise ValueError(
+            f"The 'area' parameter must be one of the possible SatAreas: {area_args}"
+        )
+
+    if img_type not in type_args:
+        raise ValueError(
+            f"The 'img_type' parameter must be one of the possible image types: {type_args}"
+        )
+
+    if size not in size_args:
+        raise ValueError(
+            f"The 'size' parameter must be one of the possible sizes: {size_args}"
+        )
+
+    query = f"?area={area}&type={img_type}&size={size}"
+
+    if time:
+        query += f"&time={time}"
+
+    return query
+
+
 class Geosatellite(APIClient):
     """A client for interacting with the MET Geosatellite API."""
 
-    def __init__(self, headers=None, use_cache=True) -> None:
-        super().__init__(headers, use_cache)
+    def __init__(
+        self,
+        headers=None,
+        use_cache=True,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        session: Optional[requests.Session] = None,
+        thread_safe: bool = False,
+    ) -> None:
+        super().__init__(
+            headers,
+            use_cache,
+            rate_limiter=rate_limiter,
+            retry=retry,
+            session=session,
+            thread_safe=thread_safe,
+        )
 
         self._base_url += "geosatellite/1.4/"
 
@@ -40,31 +88,9 @@ class Geosatellite(APIClient):
         :class:`requests.Response`
             A Response class enabling saving or further management of the data received.
         """
-        area_args = list(get_args(SatArea))
-        type_args = ["infrared", "visible"]
-        size_args = ["normal", "small"]
-
-        if area not in area_args:
-            raise ValueError(
-                f"The 'area' parameter must be one of the possible SatAreas: {area_args}"
-            )
-
-        if img_type not in type_args:
-            raise ValueError(
-                f"The 'img_type' parameter must be one of the possible image types: {type_args}"
-            )
-
-        if size not in size_args:
-            raise ValueError(
-                f"The 'size' parameter must be one of the possible sizes: {size_args}"
-            )
-
-        url = self._base_url + f"?area={area}&type={img_type}&size={size}"
-
-        if time:
-            url += f"&time={time}"
+        url = self._base_url + _image_query(area, img_type, time, size)
 
-        request = requests.get(url, stream=True, timeout=60)
+        request: requests.Response = self._get(url, stream=True, timeout=60)
 
         if not request.ok:
             raise requests.HTTPError(
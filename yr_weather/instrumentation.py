@@ -0,0 +1,204 @@
+"""Instrumentation of the requests sent by the API clients.
+
+Every request sent by a client is described by a :class:`RequestInfo`, which is passed to the client's hooks
+and added to the per-endpoint counters reported by :meth:`yr_weather.client.APIClient.stats`.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Dict, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .ratelimit import RateLimiter, default_limiter
+from .retry import Deadline
+
+PHASES = (
+    "retry",
+    "rate_limit",
+    "queue",
+    "connect",
+    "transfer",
+    "cache_lookup",
+    "decode",
+    "build",
+)
+
+
+@dataclass
+class RequestInfo:
+    """Information about a request sent by a client.
+
+    Attributes
+    ----------
+    url: :class:`str`
+        The full URL of the request.
+    endpoint: :class:`str`
+        The endpoint of the request, which is the path of the URL after ``/weatherapi/``,
+        like ``"locationforecast/2.0/complete"``.
+    status_code: Optional[:class:`int`]
+        The status code of the response, or None if no response was received.
+    attempts: :class:`int`
+        The number of times the request was sent.
+    from_cache: :class:`bool`
+        Whether the response was read from the cache instead of the network.
+    size: :class:`int`
+        The size of the response body in bytes.
+    phases: dict[:class:`str`, :class:`float`]
+        The time spent in every phase of the request, in seconds. The phases are:
+
+        - ``retry``: earlier attempts which failed, and the delays before retrying them, see :class:`.RetryPolicy`.
+        - ``rate_limit``: waiting for the client's :class:`.RateLimiter`, including pauses asked for by the API.
+        - ``queue``: waiting for a free connection in the connection pool.
+        - ``connect``: opening new connections (0 if a kept-alive connection was reused).
+        - ``transfer``: sending the request and receiving the response.
+        - ``cache_lookup``: looking up and storing the response in the cache.
+        - ``decode``: decoding the response body.
+        - ``build``: building the data classes returned by the client.
+    elapsed: :class:`float`
+        The total time of the request, in seconds.
+    error: Optional[:class:`BaseException`]
+        The exception raised by the request, if any.
+    """
+
+    url: str
+    endpoint: str
+    status_code: Optional[int] = None
+    attempts: int = 1
+    from_cache: bool = False
+    size: int = 0
+    phases: Dict[str, float] = field(default_factory=lambda: dict.fromkeys(PHASES, 0.0))
+    elapsed: float = 0.0
+    error: Optional[BaseException] = None
+
+    @property
+    def failed(self) -> bool:
+        """Whether the request raised an exception or received an error status code."""
+        return self.error is not None or (
+            self.status_code is not None and self.status_code >= 400
+        )
+
+
+# Transport timings and deadline of the request currently sent by each thread.
+_transport = threading.local()
+
+
+def start_transport_timing(deadline: Optional[Deadline] = None) -> Dict[str, float]:
+    """Start collecting the transport timings of a request sent by the current thread.
+
+    The adapter doesn't wait for the rate limiter past the ``deadline`` of the request.
+    """
+    timings = {"retry": 0.0, "rate_limit": 0.0, "queue": 0.0, "connect": 0.0}
+    _transport.timings = timings
+    _transport.deadline = deadline
+    return timings
+
+
+def stop_transport_timing() -> None:
+    _transport.timings = None
+    _transport.deadline = None
+
+
+def _add_timing(phase: str, seconds: float) -> None:
+    timings = getattr(_transport, "timings", None)
+    if timings is not None:
+        timings[phase] += seconds
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self) -> None:
+        start = perf_counter()
+        try:
+            super().connect()
+        finally:
+            _add_timing("connect", perf_counter() - start)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self) -> None:
+        start = perf_counter()
+        try:
+            super().connect()
+        finally:
+            _add_timing("connect", perf_counter() - start)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+    def _get_conn(self, timeout=None):
+        start = perf_counter()
+        try:
+            return super()._get_conn(timeout)
+        finally:
+            _add_timing("queue", perf_counter() - start)
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection  # type: ignore[assignment]
+
+    def _get_conn(self, timeout=None):
+        start = perf_counter()
+        try:
+            return super()._get_conn(timeout)
+        finally:
+            _add_timing("queue", perf_counter() - start)
+
+
+class InstrumentedAdapter(HTTPAdapter):
+    """A transport adapter which times waiting for a connection and opening connections.
+
+    Unless the response is streamed, its body is read before :meth:`send` returns,
+    so the elapsed time of the response includes transferring the body.
+
+    Every request waits for ``rate_limiter`` before it's sent, or for the limiter shared by all clients if it's None,
+    and is sent again if its response asks the client to wait (see :mod:`yr_weather.ratelimit`).
+    Waiting, and the timeouts of the requests sent again, are bounded by the deadline of the client's call:
+    :class:`~yr_weather.retry.DeadlineExceeded` is raised instead of waiting past it.
+    """
+
+    def __init__(
+        self, *args, rate_limiter: Optional[RateLimiter] = None, **kwargs
+    ) -> None:
+        self.rate_limiter = rate_limiter
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+    def send(self, request, stream=False, **kwargs):
+        limiter = (
+            self.rate_limiter if self.rate_limiter is not None else default_limiter()
+        )
+        url = str(request.url)
+        deadline = getattr(_transport, "deadline", None)
+
+        for attempt in range(limiter.max_retries + 1):
+            start = perf_counter()
+            try:
+                limiter.acquire(url, deadline)
+            finally:
+                _add_timing("rate_limit", perf_counter() - start)
+            if attempt > 0 and deadline is not None:
+                kwargs["timeout"] = deadline.timeout(kwargs.get("timeout"))
+            response = super().send(request, stream=stream, **kwargs)
+
+            if attempt == limiter.max_retries:
+                break
+            if (
+                limiter.throttle(url, response.status_code, response.headers, attempt)
+                is None
+            ):
+                break
+            response.close()
+
+        if not stream:
+            _ = response.content
+        return response
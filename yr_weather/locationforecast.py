@@ -1,10 +1,157 @@
 """A module with classes for the Locationforecast API."""
 
-from typing import Optional, Literal, Dict
-from .client import APIClient
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from functools import lru_cache
+import math
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Literal,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    Set,
+)
+import requests
+from .client import APIClient, DEFAULT_POOL_SIZE
+from .cache import ObjectCache
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .decoding import decode_forecast
+
+from .data.locationforecast import (
+    Forecast,
+    ForecastArea,
+    ForecastTimeDetails,
+    ForecastUnits,
+    ForecastResult,
+)
+
+if TYPE_CHECKING:
+    from .api_types.locationforecast import APIForecast
+    from .data.structs import ForecastStruct
+
+# The number of requested coordinates which are remembered, to count collisions
+_MAX_TRACKED_COORDINATES = 10_000
+
+# The units are the same for every forecast, so they are kept once per process,
+# and only replaced if a complete forecast arrives with different units.
+_units: Optional[ForecastUnits] = None
+_units_lock = threading.Lock()
+
+
+def _update_units(units: ForecastUnits) -> None:
+    global _units  # pylint: disable=global-statement
+
+    with _units_lock:
+        if units != _units:
+            _units = units
+
+
+def _ensure_ok(response: requests.Response) -> None:
+    """Raise an HTTPError if a response was unsuccessful, instead of decoding its error page."""
+    if not response.ok:
+        raise requests.HTTPError(
+            f"Unsuccessful response received: {response.status_code} {response.reason}.",
+            request=None,
+            response=response,
+        )
+
+
+def _decode_forecast(response: requests.Response) -> "APIForecast":
+    """Decode the JSON of a forecast response, raising an exception if it was unsuccessful."""
+    _ensure_ok(response)
+    return decode_forecast(response.content)
+
+
+def _build_complete_forecast(data: "APIForecast") -> Forecast:
+    """Build a complete forecast, keeping its units."""
+    forecast = Forecast(data)
+    _update_units(forecast.units)
+    return forecast
+
+
+def _forecast_builder(forecast_type: str) -> Callable[["APIForecast"], Forecast]:
+    """The function building a :class:`.Forecast` of the given type from its decoded data."""
+    return _build_complete_forecast if forecast_type == "complete" else Forecast
+
+
+def _decode_forecast_struct(response: requests.Response) -> "ForecastStruct":
+    """Decode a forecast response into a :class:`.ForecastStruct`, raising an exception if it was unsuccessful."""
+    # pylint: disable-next=import-outside-toplevel
+    from .data.structs import decode_forecast_struct
+
+    _ensure_ok(response)
+    return decode_forecast_struct(response.content)
 
-from .data.locationforecast import Forecast, ForecastTimeDetails, ForecastUnits
-from .api_types.locationforecast import APIForecast
+
+@lru_cache(maxsize=None)
+def _partial_decoder(max_steps: int) -> Callable[[requests.Response], "APIForecast"]:
+    """A decoder for forecasts limited to ``max_steps`` steps.
+
+    The same decoder is returned for the same number of steps, so concurrent requests are coalesced.
+    """
+
+    def decode(response: requests.Response) -> "APIForecast":
+        _ensure_ok(response)
+        return decode_forecast(response.content, max_steps)
+
+    return decode
+
+
+def _lattice(start: float, end: float, spacing: float) -> List[float]:
+    """Coordinates from ``start`` to ``end`` (inclusive), ``spacing`` apart."""
+    # The tolerance keeps ``end`` when the range is a multiple of the spacing, despite rounding errors
+    count = math.floor((end - start) / spacing + 1e-9) + 1
+    return [start + spacing * i for i in range(count)]
+
+
+def _ensure_valid_forecast_type(forecast_type: str) -> None:
+    if forecast_type not in ["complete", "compact"]:
+        raise ValueError(
+            "Value of forecast_type must be 'complete', or 'compact'.\nNote that 'classic' is not supported, as it's obsolete."
+        )
+
+
+def _forecast_path(
+    forecast_type: str, lat: float, lon: float, altitude: Optional[int] = None
+) -> str:
+    """Build the path and query of a forecast request, relative to the product's base URL."""
+    _ensure_valid_forecast_type(forecast_type)
+
+    path = f"{forecast_type}?lat={lat}&lon={lon}"
+
+    if altitude:
+        if not isinstance(altitude, int):
+            raise TypeError("Type of altitude must be int.")
+        path += f"&altitude={altitude}"
+
+    return path
+
+
+def _ensure_valid_normalization(precision: int, grid_spacing: Optional[float]) -> None:
+    """Check the ``precision`` and ``grid_spacing`` parameters of a client."""
+    if not isinstance(precision, int) or not 0 <= precision <= 4:
+        raise ValueError("The 'precision' parameter must be an int from 0 to 4.")
+
+    if grid_spacing is not None and grid_spacing <= 0:
+        raise ValueError("The 'grid_spacing' parameter must be positive.")
+
+
+def _normalize_coordinates(
+    lat: float, lon: float, precision: int, grid_spacing: Optional[float]
+) -> Tuple[float, float]:
+    """Snap coordinates to a grid (if given) and round them, as the sync and async clients do."""
+    if grid_spacing:
+        lat = round(lat / grid_spacing) * grid_spacing
+        lon = round(lon / grid_spacing) * grid_spacing
+
+    return round(lat, precision), round(lon, precision)
 
 
 class Locationforecast(APIClient):
@@ -15,18 +162,110 @@ class Locationforecast(APIClient):
     It must be initialized with a ``headers`` dict, which at least includes a User-Agent.
     The headers will be used with the :mod:`requests` library.
 
+    Coordinates are rounded to ``precision`` decimals (at most 4, as required by MET) before they are used in a request,
+    and optionally snapped to a grid with ``grid_spacing`` degrees between points.
+    See :meth:`normalize_coordinates`. The number of requests which normalization merged
+    with an earlier request for other coordinates is reported as ``coordinate_collisions`` by :meth:`stats`.
+    Only the 10,000 most recently requested coordinates are remembered for this.
+
+    Parsed forecasts are kept in the client's :class:`.ObjectCache`, and reused until their response expires.
+    Compact requests are answered from a complete forecast of the same location if one is available.
+
     For usage examples, see the documentation.
     """
 
-    def __init__(self, headers: Dict[str, str], use_cache=True) -> None:
+    def __init__(
+        self,
+        headers: Dict[str, str],
+        use_cache=True,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        precision: int = 4,
+        grid_spacing: Optional[float] = None,
+        object_cache: Optional[ObjectCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        session: Optional[requests.Session] = None,
+        thread_safe: bool = False,
+    ) -> None:
         header_keys = [key.lower() for key in headers]
         if "user-agent" not in header_keys:
             raise ValueError("A custom 'User-Agent' is required in the 'headers' dict.")
 
-        super().__init__(headers, use_cache)
+        _ensure_valid_normalization(precision, grid_spacing)
+
+        super().__init__(
+            headers,
+            use_cache,
+            pool_size,
+            object_cache,
+            rate_limiter,
+            retry,
+            session,
+            thread_safe,
+        )
 
         self._base_url += "locationforecast/2.0/"
 
+        self._precision = precision
+        self._grid_spacing = grid_spacing
+        # Recently requested coordinates and their normalized coordinates, least recently used first,
+        # and how many of them every normalized coordinates have
+        self._requested_coordinates: (
+            "OrderedDict[Tuple[float, float], Tuple[float, float]]"
+        ) = OrderedDict()
+        self._normalized_counts: Dict[Tuple[float, float], int] = {}
+
+    def normalize_coordinates(self, lat: float, lon: float) -> Tuple[float, float]:
+        """Normalize coordinates the way this client does before requesting a forecast.
+
+        The coordinates are snapped to the client's ``grid_spacing`` (if set),
+        and rounded to the client's ``precision``.
+        Equivalent coordinates therefore result in the same request, and share cache entries.
+
+        Parameters
+        ----------
+        lat: :class:`float` | :class:`int`
+            The latitude of the location.
+        lon: :class:`float` | :class:`int`
+            The longitude of the location.
+
+        Returns
+        -------
+        tuple[:class:`float`, :class:`float`]
+            The normalized latitude and longitude.
+        """
+        return _normalize_coordinates(lat, lon, self._precision, self._grid_spacing)
+
+    def _normalized(self, lat: float, lon: float) -> Tuple[float, float]:
+        """Normalize coordinates, counting requests which normalization deduplicated."""
+        normalized = self.normalize_coordinates(lat, lon)
+
+        if normalized != (lat, lon):
+            self._count("coordinates_normalized")
+
+        requested = self._requested_coordinates
+        counts = self._normalized_counts
+        with self._stats_lock:
+            # New coordinates which would have been a separate request and cache entry
+            collision = (lat, lon) not in requested and normalized in counts
+
+            if (lat, lon) in requested:
+                requested.move_to_end((lat, lon))
+            else:
+                requested[(lat, lon)] = normalized
+                counts[normalized] = counts.get(normalized, 0) + 1
+
+                if len(requested) > _MAX_TRACKED_COORDINATES:
+                    _, evicted = requested.popitem(last=False)
+                    counts[evicted] -= 1
+                    if not counts[evicted]:
+                        del counts[evicted]
+
+        if collision:
+            self._count("coordinate_collisions")
+
+        return normalized
+
     def set_headers(self, headers: dict) -> dict:
         header_keys = [key.lower() for key in headers]
         if "user-agent" not in header_keys:
@@ -39,6 +278,7 @@ class Locationforecast(APIClient):
         lat: float,
         lon: float,
         forecast_type: Literal["complete", "compact"] = "complete",
+        max_steps: Optional[int] = None,
     ) -> Forecast:
         """Retrieve a complete or compact forecast for a selected location.
 
@@ -51,6 +291,10 @@ class Locationforecast(APIClient):
         forecast_type: Literal["complete", "compact"]
             Optional: Specify the type of forecast, either ``"complete"`` or ``"compact"``.
             Default is ``"complete"``.
+        max_steps: Optional[:class:`int`]
+            Optional: Only decode the first ``max_steps`` steps of the timeseries, for example ``24``
+            when only the next 24 hours are needed. The rest of the response is skipped without being decoded,
+            which is considerably faster. Default is to decode all steps.
 
         Returns
         -------
@@ -58,18 +302,187 @@ class Locationforecast(APIClient):
             An instance of :class:`.Forecast` with helper functions and values from the API.
         """
 
-        if forecast_type not in ["complete", "compact"]:
+        return self._get_forecast(forecast_type, lat, lon, max_steps=max_steps)
+
+    def get_forecast_struct(
+        self,
+        lat: float,
+        lon: float,
+        forecast_type: Literal["complete", "compact"] = "complete",
+    ) -> "ForecastStruct":
+        """Retrieve a forecast for a selected location as a :class:`.ForecastStruct`.
+
+        The response is decoded and validated directly into compact structs, without building dicts first.
+        This requires msgspec, which can be installed with ``pip install yr-weather[msgspec]``.
+
+        Parameters
+        ----------
+        lat: :class:`float` | :class:`int`
+            The latitude of the location.
+        lon: :class:`float` | :class:`int`
+            The longitude of the location.
+        forecast_type: Literal["complete", "compact"]
+            Optional: Specify the type of forecast, either ``"complete"`` or ``"compact"``.
+            Default is ``"complete"``.
+
+        Returns
+        -------
+        :class:`.ForecastStruct`
+            The forecast.
+
+        Raises
+        ------
+        :class:`msgspec.ValidationError`
+            If the response doesn't match the structs. The message includes the path of the invalid value.
+        """
+        lat, lon = self._normalized(lat, lon)
+        url = self._base_url + _forecast_path(forecast_type, lat, lon)
+
+        return self._get(url, decode=_decode_forecast_struct)
+
+    def get_forecasts(
+        self,
+        points: Iterable[Tuple[float, float]],
+        forecast_type: Literal["complete", "compact"] = "complete",
+        max_workers: int = 8,
+    ) -> Iterator[ForecastResult]:
+        """Retrieve forecasts for many locations concurrently.
+
+        The forecasts are fetched by a pool of at most ``max_workers`` threads sharing this client's session,
+        and are yielded as soon as each of them completes, so the order may differ from ``points``.
+        Errors are captured per location, so one failing location does not stop the others.
+
+        For best performance, ``max_workers`` should not be larger than the client's ``pool_size``.
+
+        Parameters
+        ----------
+        points: Iterable[tuple[:class:`float`, :class:`float`]]
+            The (latitude, longitude) pairs to get forecasts for.
+        forecast_type: Literal["complete", "compact"]
+            Optional: Specify the type of forecast, either ``"complete"`` or ``"compact"``.
+            Default is ``"complete"``.
+        max_workers: :class:`int`
+            Optional: The maximum number of forecasts fetched at the same time. Default is ``8``.
+
+        Returns
+        -------
+        Iterator[:class:`.ForecastResult`]
+            The result for every location, with either a forecast or an error.
+        """
+        _ensure_valid_forecast_type(forecast_type)
+
+        if max_workers < 1:
+            raise ValueError("The 'max_workers' parameter must be at least 1.")
+
+        points = iter(points)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: Set[Future] = set()
+            point_of: Dict[Future, Tuple[float, float]] = {}
+
+            def submit_next() -> bool:
+                point = next(points, None)
+                if point is None:
+                    return False
+
+                future = executor.submit(self.get_forecast, *point, forecast_type)
+                pending.add(future)
+                point_of[future] = point
+                return True
+
+            # Only keep a bounded number of points queued, so huge iterables aren't consumed up front
+            while len(pending) < max_workers * 2 and submit_next():
+                pass
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    point = point_of.pop(future)
+                    error = future.exception()
+
+                    if error is None:
+                        yield ForecastResult(point, forecast=future.result())
+                    else:
+                        yield ForecastResult(point, error=error)  # type: ignore[arg-type]
+
+                    submit_next()
+
+    def prefetch_area(
+        self,
+        bbox: Tuple[float, float, float, float],
+        spacing: float,
+        forecast_type: Literal["complete", "compact"] = "complete",
+        max_workers: int = 8,
+        max_points: int = 1000,
+    ) -> ForecastArea:
+        """Retrieve forecasts for a regular lattice of points covering an area, like the tiles of a map.
+
+        The lattice starts at the south-west corner of ``bbox``, with ``spacing`` degrees between the points.
+        Every point is normalized with :meth:`normalize_coordinates`, and points which are normalized to the same
+        coordinates are only fetched once. To merge the points within the same cell of the forecast model's grid,
+        create the client with that ``grid_spacing``.
+
+        The unique points are fetched concurrently with :meth:`get_forecasts`, with at most ``max_workers`` requests at a time.
+
+        Parameters
+        ----------
+        bbox: tuple[:class:`float`, :class:`float`, :class:`float`, :class:`float`]
+            The area to cover, as (south, west, north, east) in degrees, which is
+            (minimum latitude, minimum longitude, maximum latitude, maximum longitude).
+        spacing: :class:`float`
+            The distance between the lattice points in degrees.
+        forecast_type: Literal["complete", "compact"]
+            Optional: Specify the type of forecast, either ``"complete"`` or ``"compact"``.
+            Default is ``"complete"``.
+        max_workers: :class:`int`
+            Optional: The maximum number of forecasts fetched at the same time. Default is ``8``.
+        max_points: :class:`int`
+            Optional: The maximum number of lattice points. A larger lattice raises a :class:`ValueError`
+            instead of sending a large number of requests by mistake. Default is ``1000``.
+
+        Returns
+        -------
+        :class:`.ForecastArea`
+            The results of all unique points, indexed by their position.
+        """
+        _ensure_valid_forecast_type(forecast_type)
+
+        if len(bbox) != 4:
             raise ValueError(
-                "Value of forecast_type must be 'complete', or 'compact'.\nNote that 'classic' is not supported, as it's obsolete."
+                "The 'bbox' parameter must be a tuple of (south, west, north, east)."
             )
 
-        request = self.session.get(
-            self._base_url + f"{forecast_type}?lat={lat}&lon={lon}"
-        )
+        south, west, north, east = bbox
+        if not (-90 <= south <= north <= 90 and -180 <= west <= east <= 180):
+            raise ValueError(
+                "The 'bbox' parameter must be a tuple of (south, west, north, east), with valid coordinates."
+            )
+
+        if spacing <= 0:
+            raise ValueError("The 'spacing' parameter must be positive.")
+
+        lats = _lattice(south, north, spacing)
+        lons = _lattice(west, east, spacing)
+
+        if len(lats) * len(lons) > max_points:
+            raise ValueError(
+                f"The lattice has {len(lats) * len(lons)} points, more than the 'max_points' parameter allows."
+            )
 
-        weather_data: APIForecast = request.json()
+        cells = [self.normalize_coordinates(lat, lon) for lat in lats for lon in lons]
+        unique = list(dict.fromkeys(cells))
+        if len(unique) < len(cells):
+            self._count("coordinate_collisions", len(cells) - len(unique))
 
-        return Forecast(weather_data)
+        results = {
+            result.point: result
+            for result in self.get_forecasts(unique, forecast_type, max_workers)
+        }
+
+        return ForecastArea(
+            (south, west, north, east), spacing, (len(lats), len(lons)), cells, results
+        )
 
     def get_air_temperature(
         self, lat: float, lon: float, altitude: Optional[int] = None
@@ -93,17 +506,7 @@ class Locationforecast(APIClient):
             The air temperature, given in the current scale used by the Yr Locationforecast API (this is usually degrees Celsius).
         """
 
-        url = self._base_url + f"compact?lat={lat}&lon={lon}"
-
-        if altitude:
-            if not isinstance(altitude, int):
-                raise TypeError("Type of altitude must be int.")
-            url += f"&altitude={altitude}"
-
-        request = self.session.get(url)
-        data: APIForecast = request.json()
-
-        forecast = Forecast(data)
+        forecast = self._get_forecast("compact", lat, lon, altitude)
 
         return forecast.now().details.air_temperature
 
@@ -129,17 +532,7 @@ class Locationforecast(APIClient):
             A dataclass with info received from the API.
         """
 
-        url = self._base_url + f"complete?lat={lat}&lon={lon}"
-
-        if altitude:
-            if not isinstance(altitude, int):
-                raise TypeError("Type of altitude must be int.")
-            url += f"&altitude={altitude}"
-
-        request = self.session.get(url)
-        data: APIForecast = request.json()
-
-        forecast = Forecast(data)
+        forecast = self._get_forecast("complete", lat, lon, altitude)
 
         return forecast.now().details
 
@@ -152,10 +545,46 @@ class Locationforecast(APIClient):
             A dataclass with units currently used.
         """
 
-        request = self.session.get(self._base_url + "complete?lat=0&lon=0")
+        if _units is None:
+            self._get_forecast("complete", 0, 0)
+
+        return _units  # type: ignore[return-value]
 
-        data: APIForecast = request.json()
+    def _get_forecast(
+        self,
+        forecast_type: str,
+        lat: float,
+        lon: float,
+        altitude: Optional[int] = None,
+        max_steps: Optional[int] = None,
+    ) -> Forecast:
+        """Get a forecast, from the object cache if possible."""
+        if max_steps is not None and max_steps < 1:
+            raise ValueError("The 'max_steps' parameter must be at least 1.")
+
+        lat, lon = self._normalized(lat, lon)
+        url = self._base_url + _forecast_path(forecast_type, lat, lon, altitude)
 
-        forecast = Forecast(data)
+        if max_steps is not None:
+            return self._get(url, decode=_partial_decoder(max_steps), build=Forecast)
+
+        build = _forecast_builder(forecast_type)
+
+        # A complete forecast has all the data of a compact forecast, and more
+        if (
+            forecast_type == "compact"
+            and self._cached(url, decode=_decode_forecast, build=build) is None
+        ):
+            complete_url = self._base_url + _forecast_path(
+                "complete", lat, lon, altitude
+            )
+            forecast = self._cached(
+                complete_url,
+                decode=_decode_forecast,
+                build=_forecast_builder("complete"),
+            )
+            if forecast is not None:
+                self._count("object_cache_hits")
+                return forecast
 
-        return forecast.units
+        return self._get(url, decode=_decode_forecast, build=build)
@@ -0,0 +1,168 @@
+"""A module with a client for all MET API products, sharing one session."""
+
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, Optional, Union
+
+import requests
+
+from .cache import CacheConfig, ObjectCache
+from .client import DEFAULT_POOL_SIZE, create_session
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from requests_cache import CachedSession
+
+    from .geosatellite import Geosatellite
+    from .locationforecast import Locationforecast
+    from .radar import Radar
+    from .sunrise import Sunrise
+    from .textforecast import Textforecast
+
+
+class MetClient:
+    """A client for all MET API products, which share one session.
+
+    Every product client created separately has its own connection pool and its own connection to the HTTP cache.
+    The product clients of a :class:`MetClient` instead share one pool of kept-alive connections to the API,
+    one HTTP cache, one :class:`.ObjectCache` and one :class:`.RateLimiter`::
+
+        with yr_weather.MetClient(headers, pool_size=20) as met:
+            forecast = met.locationforecast.get_forecast(59.91, 10.75)
+            events = met.sunrise.get_sun_events("2024-01-15", 59.91, 10.75)
+
+    The product clients are created, and their modules imported, on first use. More clients sharing the session
+    can be created by passing :attr:`session` to them, like ``Locationforecast(headers, session=met.session, precision=2)``.
+
+    Parameters
+    ----------
+    headers: dict[:class:`str`, :class:`str`]
+        The headers of all requests, which must at least include a User-Agent.
+    use_cache: :class:`bool` | :class:`.CacheConfig`
+        Optional: Whether responses are cached, and how. Default is True.
+    pool_size: :class:`int`
+        Optional: The maximum number of kept-alive connections to the API. Default is ``10``.
+    object_cache: Optional[:class:`.ObjectCache`]
+        Optional: The cache of objects built from responses. Default is a new :class:`.ObjectCache`.
+    rate_limiter: Optional[:class:`.RateLimiter`]
+        Optional: The rate limiter requests wait for. Default is the limiter shared by all clients.
+    retry: Optional[:class:`.RetryPolicy`]
+        Optional: How failed requests are retried. Default is a default :class:`.RetryPolicy`.
+    thread_safe: :class:`bool`
+        Optional: Whether the session is used by many threads at once, see :class:`.APIClient`. Default is False.
+    """
+
+    def __init__(
+        self,
+        headers: Dict[str, str],
+        use_cache: Union[bool, CacheConfig] = True,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        object_cache: Optional[ObjectCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        thread_safe: bool = False,
+    ) -> None:
+        if not isinstance(headers, dict):
+            raise TypeError("The 'headers' parameter must be of type 'dict'.")
+
+        header_keys = [key.lower() for key in headers]
+        if "user-agent" not in header_keys:
+            raise ValueError("A custom 'User-Agent' is required in the 'headers' dict.")
+
+        if pool_size < 1:
+            raise ValueError("The 'pool_size' parameter must be at least 1.")
+
+        self.headers = headers
+        self.object_cache = object_cache if object_cache is not None else ObjectCache()
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.thread_safe = thread_safe
+
+        self.session: Union["CachedSession", requests.Session] = create_session(
+            use_cache, pool_size, rate_limiter, thread_safe
+        )
+        self.session.headers = headers  # type: ignore
+
+    @cached_property
+    def locationforecast(self) -> "Locationforecast":
+        """The :class:`.Locationforecast` client."""
+        # pylint: disable-next=import-outside-toplevel
+        from .locationforecast import Locationforecast
+
+        return Locationforecast(
+            self.headers,
+            object_cache=self.object_cache,
+            rate_limiter=self.rate_limiter,
+            retry=self.retry,
+            session=self.session,
+            thread_safe=self.thread_safe,
+        )
+
+    @cached_property
+    def sunrise(self) -> "Sunrise":
+        """The :class:`.Sunrise` client."""
+        # pylint: disable-next=import-outside-toplevel
+        from .sunrise import Sunrise
+
+        return Sunrise(
+            self.headers,
+            object_cache=self.object_cache,
+            rate_limiter=self.rate_limiter,
+            retry=self.retry,
+            session=self.session,
+            thread_safe=self.thread_safe,
+        )
+
+    @cached_property
+    def radar(self) -> "Radar":
+        """The :class:`.Radar` client."""
+        # pylint: disable-next=import-outside-toplevel
+        from .radar import Radar
+
+        return Radar(
+            self.headers,
+            object_cache=self.object_cache,
+            rate_limiter=self.rate_limiter,
+            retry=self.retry,
+            session=self.session,
+            thread_safe=self.thread_safe,
+        )
+
+    @cached_property
+    def textforecast(self) -> "Textforecast":
+        """The :class:`.Textforecast` client."""
+        # pylint: disable-next=import-outside-toplevel
+        from .textforecast import Textforecast
+
+        return Textforecast(
+            self.headers,
+            object_cache=self.object_cache,
+            rate_limiter=self.rate_limiter,
+            retry=self.retry,
+            session=self.session,
+            thread_safe=self.thread_safe,
+        )
+
+    @cached_property
+    def geosatellite(self) -> "Geosatellite":
+        """The :class:`.Geosatellite` client."""
+        # pylint: disable-next=import-outside-toplevel
+        from .geosatellite import Geosatellite
+
+        return Geosatellite(
+            self.headers,
+            rate_limiter=self.rate_limiter,
+            retry=self.retry,
+            session=self.session,
+            thread_safe=self.thread_safe,
+        )
+
+    def close(self) -> None:
+        """Close the connection pool and the HTTP cache of the session."""
+        self.session.close()
+
+    def __enter__(self) -> "MetClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -3,7 +3,10 @@
 from typing import Optional, get_args
 from datetime import datetime
 import requests
-from .client import APIClient
+from .client import APIClient, decode_json
+from .cache import ObjectCache
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
 
 from .data.radar import (
     RadarOptions,
@@ -18,11 +21,116 @@ from .api_types.radar import (
 )
 
 
+def _radar_query(
+    area: str,
+    radar_type: str,
+    content: str = "image",
+    time: Optional[str] = None,
+) -> str:
+    """Validate the parameters of a radar request and build its query."""
+    area_args = list(get_args(RadarArea))
+    type_args = list(get_args(RadarType))
+
+    if area not in area_args:
+        raise ValueError(
+            f"The 'area' argument must be one of the possible RadarAreas: {area_args}"
+        )
+
+    if radar_type not in type_args:
+        raise ValueError(
+            f"The 'radar_type' argument must be one of the possible RadarTypes: {type_args}"
+        )
+
+    if content not in ["image", "animation"]:
+        raise ValueError("The 'content' argument must be 'image' or 'animation'.")
+
+    query = f"?area={area}&type={radar_type}&content={content}"
+
+    if time:
+        try:
+            datetime.strptime(time, "%Y-%m-%dT%H:%M:%SZ")
+            query += f"&time={time}"
+        except Exception as exc:
+            raise ValueError(
+                "The 'time' argument must be of type 'str' and ISO 8601 format."
+            ) from exc
+
+    return query
+
+
+def _parse_radar_options(options: dict) -> RadarOptions:
+    """Convert the radaroptions response to a :class:`.RadarOptions` dataclass."""
+    # Rename to allowed attribute name for the dataclass which will be instantiated
+    options["five_level_reflectivity"] = options["5level_reflectivity"]
+    del options["5level_reflectivity"]
+
+    # Convert all radar option dicts to dataclasses
+    for option, value in options.items():
+        options[option] = RadarContentAvailable(
+            areas=value["area"], content=value["content"]
+        )
+
+    return RadarOptions(**options)
+
+
+def _parse_radar_status(radar: dict) -> RadarStatus:
+    """Convert a radar status from the API to a :class:`.RadarStatus` dataclass.
+
+    This renames properties to match python style.
+    """
+    return RadarStatus(
+        area=radar["Area"],
+        due_date=radar["DueDate"],
+        fault_code=radar["FaultCode"],
+        last=radar["Last"],
+        products=radar["Products"],
+        sitename=radar["Sitename"],
+        stability=radar["Stability"],
+    )
+
+
+def _parse_radar_global_status(status: dict) -> RadarGlobalStatus:
+    """Convert the status response to a :class:`.RadarGlobalStatus` dataclass."""
+    radars = [_parse_radar_status(radar) for radar in status["Radars"]]
+
+    return RadarGlobalStatus(last_update=status["Last_update"], radars=radars)
+
+
+def _find_radar_status(
+    status: RadarGlobalStatus,
+    area: Optional[str] = None,
+    sitename: Optional[str] = None,
+) -> Optional[RadarStatus]:
+    """Find a single radar in the statuses of all radars by area or sitename."""
+    for radar in status.radars:
+        if (radar.area == area) if area else (radar.sitename == sitename):
+            return radar
+
+    return None
+
+
 class Radar(APIClient):
     """A client for interacting with the MET Radar API."""
 
-    def __init__(self, headers=None, use_cache=True) -> None:
-        super().__init__(headers, use_cache)
+    def __init__(
+        self,
+        headers=None,
+        use_cache=True,
+        object_cache: Optional[ObjectCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        session: Optional[requests.Session] = None,
+        thread_safe: bool = False,
+    ) -> None:
+        super().__init__(
+            headers,
+            use_cache,
+            object_cache=object_cache,
+            rate_limiter=rate_limiter,
+            retry=retry,
+            session=session,
+            thread_safe=thread_safe,
+        )
 
         self._base_url += "radar/2.0/"
 
@@ -57,34 +165,9 @@ class Radar(APIClient):
         :class:`requests.Response`
             A Response class, enabling for further saving or managing of the data received from the open stream.
         """
-        area_args = list(get_args(RadarArea))
-        type_args = list(get_args(RadarType))
-
-        if area not in area_args:
-            raise ValueError(
-                f"The 'area' argument must be one of the possible RadarAreas: {area_args}"
-            )
-
-        if radar_type not in type_args:
-            raise ValueError(
-                f"The 'radar_type' argument must be one of the possible RadarTypes: {type_args}"
-            )
-
-        if content not in ["image", "animation"]:
-            raise ValueError("The 'content' argument must be 'image' or 'animation'.")
-
-        url = self._base_url + f"?area={area}&type={radar_type}&content={content}"
+        url = self._base_url + _radar_query(area, radar_type, content, time)
 
-        if time:
-            try:
-                datetime.strptime(time, "%Y-%m-%dT%H:%M:%SZ")
-                url += f"&time={time}"
-            except Exception as exc:
-                raise ValueError(
-                    "The 'time' argument must be of type 'str' and ISO 8601 format."
-                ) from exc
-
-        return self.session.get(url)
+        return self._get(url)
 
     def get_available_radars(self) -> RadarOptions:
         """Get available types of radars.
@@ -99,21 +182,7 @@ class Radar(APIClient):
         """
         url = self._base_url + "radaroptions"
 
-        request = self.session.get(url)
-
-        options: dict = request.json()
-
-        # Rename to allowed attribute name for the dataclass which will be instantiated
-        options["five_level_reflectivity"] = options["5level_reflectivity"]
-        del options["5level_reflectivity"]
-
-        # Convert all radar option dicts to dataclasses
-        for option, value in options.items():
-            options[option] = RadarContentAvailable(
-                areas=value["area"], content=value["content"]
-            )
-
-        return RadarOptions(**options)
+        return self._get(url, decode=decode_json, build=_parse_radar_options)
 
     def get_all_statuses(self) -> RadarGlobalStatus:
         """Get the operational status of all radars.
@@ -125,28 +194,7 @@ class Radar(APIClient):
         """
         url = self._base_url + "status"
 
-        request = self.session.get(url)
-
-        status: dict = request.json()
-
-        radars = []
-
-        # This renames properties to match python style
-        # Also converts from dicts to AreaStatus dataclasses
-        for radar in status["Radars"]:
-            radars.append(
-                RadarStatus(
-                    area=radar["Area"],
-                    due_date=radar["DueDate"],
-                    fault_code=radar["FaultCode"],
-                    last=radar["Last"],
-                    products=radar["Products"],
-                    sitename=radar["Sitename"],
-                    stability=radar["Stability"],
-                )
-            )
-
-        return RadarGlobalStatus(last_update=status["Last_update"], radars=radars)
+        return self._get(url, decode=decode_json, build=_parse_radar_global_status)
 
     def get_status(
         self, area: Optional[str] = None, sitename: Optional[str] = None
@@ -172,26 +220,7 @@ class Radar(APIClient):
 
         url = self._base_url + "status"
 
-        request = self.session.get(url)
+        # The same cached object as get_global_status(), not the raw response which callers could change
+        status = self._get(url, decode=decode_json, build=_parse_radar_global_status)
 
-        status: dict = request.json()
-
-        if area:
-            found = list(filter(lambda r: r["Area"] == area, status["Radars"]))
-        else:
-            found = list(filter(lambda r: r["Sitename"] == sitename, status["Radars"]))
-
-        if len(found) == 0:
-            return None
-
-        radar = found[0]
-
-        return RadarStatus(
-            area=radar["Area"],
-            due_date=radar["DueDate"],
-            fault_code=radar["FaultCode"],
-            last=radar["Last"],
-            products=radar["Products"],
-            sitename=radar["Sitename"],
-            stability=radar["Stability"],
-        )
+        return _find_radar_status(status, area, sitename)
@@ -0,0 +1,374 @@
+"""A process-wide rate limiter shared by all API clients.
+
+MET's Terms of Service ask applications to send at most 20 requests per second, and to back off when they're told to.
+Every request sent through the network by a client first takes a token from a :class:`RateLimiter`:
+one bucket limits each host, and optionally one more limits each product (like ``"locationforecast"``).
+Responses with status ``429 Too Many Requests`` (or ``503 Service Unavailable`` with a ``Retry-After`` header)
+pause all requests to their host for as long as the ``Retry-After`` header says, or until the ``Expires`` header
+if there is no ``Retry-After``, and are then sent again. Other ``503`` responses are left to the client's
+:class:`~yr_weather.retry.RetryPolicy`, so every response is retried by only one of them.
+A wait which would last past the deadline of a call raises :class:`~yr_weather.retry.DeadlineExceeded` instead.
+
+All clients share the limiter returned by :func:`default_limiter`, unless they're given their own.
+Responses read from the cache don't take a token.
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+from .cache import _product, _timestamp
+from .retry import Deadline, DeadlineExceeded
+
+# Status codes which ask the client to send the request again later
+RETRY_STATUSES = (429, 503)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """The rate requests are allowed at.
+
+    Attributes
+    ----------
+    rate: :class:`float`
+        The sustained number of requests per second.
+    burst: Optional[:class:`int`]
+        The number of requests which can be sent at once after a quiet period.
+        Default is the rate, rounded up.
+    """
+
+    rate: float
+    burst: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError("The 'rate' parameter must be positive.")
+
+        if self.burst is not None and self.burst < 1:
+            raise ValueError("The 'burst' parameter must be at least 1.")
+
+
+class _TokenBucket:
+    """A thread-safe token bucket.
+
+    Tokens are reserved ahead of time: a caller takes a token even if the bucket is empty,
+    and is told how long to wait until the token would have been there. Callers therefore
+    don't hold the lock while waiting, and are served in the order they arrived.
+    Without a limit, tokens are unlimited, but the bucket can still be paused.
+    """
+
+    def __init__(self, limit: Optional[RateLimit]) -> None:
+        self.limit = limit
+        self.rate = limit.rate if limit is not None else 0.0
+        self.capacity = 0.0
+        if limit is not None:
+            self.capacity = float(
+                limit.burst if limit.burst is not None else math.ceil(limit.rate)
+            )
+
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def reserve(self) -> float:
+        """Take a token, returning the number of seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            if self.limit is None:
+                return max(0.0, self._paused_until - now)
+
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1.0
+
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(delay, self._paused_until - now)
+
+    def release(self) -> None:
+        """Give back a token which was reserved, but not used."""
+        with self._lock:
+            if self.limit is not None:
+                self._tokens = min(self.capacity, self._tokens + 1.0)
+
+    def pause(self, seconds: float) -> None:
+        """Don't hand out usable tokens for the next ``seconds`` seconds."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+def retry_delay(headers: Mapping[str, str]) -> Optional[float]:
+    """Get how many seconds a response asks the client to wait before sending requests again.
+
+    The ``Retry-After`` header is used, given either in seconds or as a date,
+    or else the ``Expires`` header if it's in the future.
+
+    Parameters
+    ----------
+    headers: Mapping[:class:`str`, :class:`str`]
+        The headers of the response.
+
+    Returns
+    -------
+    Optional[:class:`float`]
+        The number of seconds, or None if the response doesn't say.
+    """
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+
+    for header in (retry_after, headers.get("Expires")):
+        if header is None:
+            continue
+        try:
+            delay = _timestamp(parsedate_to_datetime(header)) - time.time()
+        except (TypeError, ValueError):
+            continue
+        if header is retry_after or delay > 0:
+            return max(0.0, delay)
+
+    return None
+
+
+def asks_to_wait(status_code: int, headers: Mapping[str, str]) -> bool:
+    """Check whether a response asks the client to wait before sending the request again.
+
+    That's the case for ``429`` responses, and for ``503`` responses saying how long to wait.
+
+    Parameters
+    ----------
+    status_code: :class:`int`
+        The status code of the response.
+    headers: Mapping[:class:`str`, :class:`str`]
+        The headers of the response.
+
+    Returns
+    -------
+    :class:`bool`
+        Whether the response is handled by the rate limiter.
+    """
+    if status_code == 429:
+        return True
+    return status_code in RETRY_STATUSES and retry_delay(headers) is not None
+
+
+class RateLimiter:
+    """Limits the rate of requests sent by clients, by host and by product.
+
+    Pass it as ``rate_limiter`` when creating a client, or make it the limiter of all clients
+    with :func:`set_default_limiter`::
+
+        limiter = RateLimiter(rate=10, products={"locationforecast": RateLimit(5)})
+        yr_weather.ratelimit.set_default_limiter(limiter)
+
+    Parameters
+    ----------
+    rate: Optional[:class:`float`]
+        Optional: The number of requests per second allowed to every host. Use None for no limit,
+        in which case responses asking the client to wait are still honored. Default is ``20``.
+    burst: Optional[:class:`int`]
+        Optional: The number of requests which can be sent to a host at once. Default is the rate, rounded up.
+    hosts: dict[:class:`str`, :class:`RateLimit`]
+        Optional: Limits for specific hosts (like ``"api.met.no"``), instead of ``rate`` and ``burst``.
+    products: dict[:class:`str`, :class:`RateLimit`]
+        Optional: Limits for specific products (like ``"locationforecast"``), in addition to the limit of their host.
+    max_retries: :class:`int`
+        Optional: How many times a request is sent again after a response asking the client to wait.
+        Default is ``3``.
+    backoff: :class:`float`
+        Optional: How many seconds to wait after a ``429`` response without ``Retry-After`` or ``Expires`` headers,
+        doubled after every further attempt. Default is ``1.0``.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = 20.0,
+        burst: Optional[int] = None,
+        hosts: Optional[Dict[str, RateLimit]] = None,
+        products: Optional[Dict[str, RateLimit]] = None,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+    ) -> None:
+        if max_retries < 0:
+            raise ValueError("The 'max_retries' parameter must not be negative.")
+
+        if backoff < 0:
+            raise ValueError("The 'backoff' parameter must not be negative.")
+
+        self.limit = RateLimit(rate, burst) if rate is not None else None
+        self.hosts = dict(hosts or {})
+        self.products = dict(products or {})
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+        self._lock = threading.Lock()
+        self._host_buckets: Dict[str, _TokenBucket] = {}
+        self._product_buckets: Dict[str, _TokenBucket] = {}
+        self._stats = {"requests": 0, "waits": 0, "wait_seconds": 0.0, "throttled": 0}
+
+    def _bucket(self, url: str, product: bool) -> _TokenBucket:
+        """Get the bucket of the host or product of a URL, creating it on first use."""
+        if product:
+            key, buckets = _product(url), self._product_buckets
+            limit = self.products.get(key)
+        else:
+            key, buckets = urlsplit(url).netloc, self._host_buckets
+            limit = self.hosts.get(key, self.limit)
+
+        bucket = buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = buckets.get(key)
+                if bucket is None:
+                    # Hosts without a limit still get a bucket, so they can be paused
+                    bucket = buckets[key] = _TokenBucket(limit)
+
+        return bucket
+
+    def reserve(self, url: str) -> float:
+        """Take a token for a request, returning the number of seconds to wait before sending it.
+
+        The caller must wait itself, which lets async clients wait without blocking the event loop.
+        """
+        delay = self._bucket(url, product=False).reserve()
+        if _product(url) in self.products:
+            delay = max(delay, self._bucket(url, product=True).reserve())
+
+        with self._lock:
+            self._stats["requests"] += 1
+            if delay > 0:
+                self._stats["waits"] += 1
+                self._stats["wait_seconds"] += delay
+
+        return delay
+
+    def _release(self, url: str, delay: float) -> None:
+        """Give back the tokens taken by :meth:`reserve` for a request which won't be sent."""
+        self._bucket(url, product=False).release()
+        if _product(url) in self.products:
+            self._bucket(url, product=True).release()
+
+        with self._lock:
+            self._stats["requests"] -= 1
+            if delay > 0:
+                self._stats["waits"] -= 1
+                self._stats["wait_seconds"] -= delay
+
+    def acquire(self, url: str, deadline: Optional[Deadline] = None) -> float:
+        """Wait until a request may be sent.
+
+        Parameters
+        ----------
+        url: :class:`str`
+            The URL of the request.
+        deadline: Optional[:class:`~yr_weather.retry.Deadline`]
+            Optional: The deadline of the call sending the request.
+
+        Returns
+        -------
+        :class:`float`
+            The number of seconds waited.
+
+        Raises
+        ------
+        :class:`~yr_weather.retry.DeadlineExceeded`
+            If the deadline would pass while waiting. The request doesn't take a token then.
+        """
+        delay = self.reserve(url)
+        if deadline is not None:
+            remaining = deadline.remaining()
+            if remaining is not None and delay >= remaining:
+                self._release(url, delay)
+                raise DeadlineExceeded(
+                    f"The deadline of {deadline.seconds} seconds would pass while waiting "
+                    f"{delay:.1f} seconds for the rate limiter."
+                )
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def throttle(
+        self, url: str, status_code: int, headers: Mapping[str, str], attempt: int = 0
+    ) -> Optional[float]:
+        """Pause requests to the host of a URL if its response asks the client to wait.
+
+        Parameters
+        ----------
+        url: :class:`str`
+            The URL of the request.
+        status_code: :class:`int`
+            The status code of the response.
+        headers: Mapping[:class:`str`, :class:`str`]
+            The headers of the response.
+        attempt: :class:`int`
+            How many times the request has already been sent again.
+
+        Returns
+        -------
+        Optional[:class:`float`]
+            The number of seconds requests are paused for, or None if the request shouldn't be sent again.
+        """
+        if not asks_to_wait(status_code, headers):
+            return None
+
+        delay = retry_delay(headers)
+        if delay is None:
+            delay = self.backoff * 2**attempt
+
+        self._bucket(url, product=False).pause(delay)
+        with self._lock:
+            self._stats["throttled"] += 1
+
+        return delay
+
+    def stats(self) -> Dict[str, Any]:
+        """Get a snapshot of the limiter's counters.
+
+        Returns
+        -------
+        :class:`dict`
+            The number of ``requests`` which took a token, how many of them had to wait (``waits``),
+            the total ``wait_seconds``, and the number of responses which paused a host (``throttled``).
+        """
+        with self._lock:
+            return dict(self._stats)
+
+
+_default_lock = threading.Lock()
+_default: Optional[RateLimiter] = None
+
+
+def default_limiter() -> RateLimiter:
+    """Get the rate limiter shared by all clients which weren't given their own.
+
+    It's created on first use with the default limits of :class:`RateLimiter`.
+    """
+    global _default  # pylint: disable=global-statement
+
+    with _default_lock:
+        if _default is None:
+            _default = RateLimiter()
+        return _default
+
+
+def set_default_limiter(limiter: RateLimiter) -> None:
+    """Replace the rate limiter shared by all clients which weren't given their own.
+
+    Clients which are already created use the new limiter from their next request.
+    """
+    global _default  # pylint: disable=global-statement
+
+    if not isinstance(limiter, RateLimiter):
+        raise TypeError("The 'limiter' parameter must be of type 'RateLimiter'.")
+
+    with _default_lock:
+        _default = limiter
@@ -0,0 +1,142 @@
+"""Retries of failed requests, and timeouts bounding how long a call to a client can take.
+
+Every request sent by a client is retried as described by its :class:`RetryPolicy`: after a connection error,
+a timeout or a transient error status (like ``503 Service Unavailable``), it's sent again after an exponentially
+growing, randomized delay. A call never takes longer than its deadline, counting all attempts and the waits between them.
+
+Responses asking the client to wait, with status ``429 Too Many Requests`` or a ``503`` with a ``Retry-After`` header,
+are handled by the client's rate limiter instead, see :mod:`yr_weather.ratelimit`.
+"""
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple, Type, Union
+
+import requests
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class DeadlineExceeded(requests.Timeout):
+    """Raised when the deadline of a call passes before a response is received."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How a client retries failed requests, and how long it waits for them.
+
+    Pass it as ``retry`` when creating a client::
+
+        policy = RetryPolicy(attempts=5, deadline=10)
+        client = yr_weather.Locationforecast(headers, retry=policy)
+
+    Attributes
+    ----------
+    attempts: :class:`int`
+        The maximum number of times a request is sent, including the first time. Use ``1`` to disable retries.
+        Default is ``3``.
+    backoff: :class:`float`
+        The delay before the first retry in seconds, doubled for every further retry. Default is ``0.5``.
+    max_backoff: :class:`float`
+        The longest delay between two attempts, in seconds. Default is ``8.0``.
+    jitter: :class:`bool`
+        Whether delays are randomized between 0 and their full length, so clients which failed at the same time
+        don't retry at the same time. Default is True.
+    statuses: tuple[:class:`int`, ...]
+        Status codes of responses which are retried, unless they ask the client to wait. Default is ``(502, 503, 504)``.
+    exceptions: tuple[Type[:class:`BaseException`], ...]
+        Exceptions which are retried. Default is connection errors, timeouts and broken responses.
+    timeout: :class:`float` | tuple[:class:`float`, :class:`float`]
+        How long every attempt waits for a connection and for data to be received, in seconds,
+        either as one number or as a (connect, read) tuple. Default is ``(3.05, 30.0)``.
+    deadline: Optional[:class:`float`]
+        The longest time a call can take, in seconds, counting all attempts and the delays between them.
+        Attempts are given at most the time which is left as their timeout. Use None for no deadline. Default is ``60.0``.
+    """
+
+    attempts: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 8.0
+    jitter: bool = True
+    statuses: Tuple[int, ...] = (502, 503, 504)
+    exceptions: Tuple[Type[BaseException], ...] = (
+        requests.ConnectionError,
+        requests.Timeout,
+        requests.exceptions.ChunkedEncodingError,
+    )
+    timeout: Timeout = (3.05, 30.0)
+    deadline: Optional[float] = 60.0
+
+    def __post_init__(self) -> None:
+        if self.attempts < 1:
+            raise ValueError("The 'attempts' parameter must be at least 1.")
+
+        if self.backoff < 0 or self.max_backoff < 0:
+            raise ValueError(
+                "The 'backoff' and 'max_backoff' parameters must not be negative."
+            )
+
+        if self.deadline is not None and self.deadline <= 0:
+            raise ValueError("The 'deadline' parameter must be positive.")
+
+    def delay(self, retry: int) -> float:
+        """Get the delay before a retry, in seconds.
+
+        Parameters
+        ----------
+        retry: :class:`int`
+            The number of the retry, starting at 0 for the second attempt.
+
+        Returns
+        -------
+        :class:`float`
+            The delay in seconds.
+        """
+        delay = min(self.max_backoff, self.backoff * 2**retry)
+        if self.jitter:
+            return random.uniform(0.0, delay)
+        return delay
+
+
+class Deadline:
+    """The point in time a call must be done by.
+
+    Parameters
+    ----------
+    seconds: Optional[:class:`float`]
+        The number of seconds from now, or None for no deadline.
+    """
+
+    def __init__(self, seconds: Optional[float]) -> None:
+        self.seconds = seconds
+        self._end = time.monotonic() + seconds if seconds is not None else None
+
+    def remaining(self) -> Optional[float]:
+        """The number of seconds left (possibly negative), or None if there is no deadline."""
+        if self._end is None:
+            return None
+        return self._end - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def timeout(self, timeout: Optional[Timeout]) -> Optional[Timeout]:
+        """Shorten a timeout to the time which is left.
+
+        Raises :class:`DeadlineExceeded` if no time is left.
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        if remaining <= 0:
+            raise DeadlineExceeded(f"The deadline of {self.seconds} seconds passed.")
+
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            return (min(timeout[0], remaining), min(timeout[1], remaining))
+        return min(timeout, remaining)
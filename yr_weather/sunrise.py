@@ -1,71 +1,127 @@
 """A module with classes for the Sunrise API."""
 
 from datetime import datetime
-from typing import Optional, Union
+from typing import Any, Callable, Optional, TypeVar, Union, Dict
 import requests
 from .client import APIClient
+from .decoding import loads
+from .cache import ObjectCache
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
 
 from .data.sunrise import SunEvents, MoonEvents
 from .api_types.sunrise import APISunData, APIMoonData
 
+EventsT = TypeVar("EventsT", SunEvents, MoonEvents)
 
-class Sunrise(APIClient):
-    """A client for interacting with the Yr Sunrise API."""
 
-    def __init__(self, headers, use_cache=True) -> None:
-        header_keys = [key.lower() for key in headers]
-        if "user-agent" not in header_keys:
-            raise ValueError("A custom 'User-Agent' is required in the 'headers' dict.")
+def _is_valid_offset(offset: str) -> bool:
+    """Ensures that a valid offset is given.
 
-        super().__init__(headers, use_cache)
+    Returns a bool, indicating whether the offset is valid.
+    """
+    if not offset.startswith(("+", "-")):
+        return False
 
-        self._base_url += "sunrise/3.0/"
+    time = offset.replace("+", "").replace("-", "")
 
-    def _get_events(self, event_type: str, **kwargs) -> Union[APISunData, APIMoonData]:
-        date = kwargs.get("date")
-        lat = kwargs.get("lat")
-        lon = kwargs.get("lon")
-        offset = kwargs.get("offset")
+    splitted = time.split(":")
 
-        # Ensure correct variable types.
-        if not isinstance(date, str):
-            raise TypeError("Type of 'date' must be str.")
+    if len(splitted) != 2:
+        return False
 
-        if not isinstance(lat, (int, float)) or not isinstance(lon, (int, float)):
-            raise TypeError("Type of 'lat' and 'lon' must be int or float.")
+    for i in splitted:
+        if len(i) != 2:
+            return False
+        try:
+            int(i)
+        except ValueError:
+            return False
 
-        if offset:
-            if not isinstance(offset, str):
-                raise TypeError("Type of 'offset' must be str.")
+    if int(splitted[0]) < 10 and not splitted[0].startswith("0"):
+        return False
 
-            # Ensure offset is valid.
-            if not self._ensure_valid_offset(offset):
-                raise ValueError(
-                    "The 'offset' parameter is not a valid timezone offset."
-                )
+    return True
 
-        # Check if the date provided is valid.
-        try:
-            splitted = [int(num) for num in date.split("-")]
-            datetime(splitted[0], splitted[1], splitted[2])
-        except Exception as exc:
-            raise ValueError("The 'date' parameter must be a valid date.") from exc
 
-        url = self._base_url + event_type
+def _events_params(
+    date: str, lat: float, lon: float, offset: Optional[str] = None
+) -> Dict[str, Optional[str]]:
+    """Validate the parameters of an events request and build its query parameters."""
+    # Ensure correct variable types.
+    if not isinstance(date, str):
+        raise TypeError("Type of 'date' must be str.")
+
+    if not isinstance(lat, (int, float)) or not isinstance(lon, (int, float)):
+        raise TypeError("Type of 'lat' and 'lon' must be int or float.")
+
+    if offset:
+        if not isinstance(offset, str):
+            raise TypeError("Type of 'offset' must be str.")
+
+        # Ensure offset is valid.
+        if not _is_valid_offset(offset):
+            raise ValueError("The 'offset' parameter is not a valid timezone offset.")
+
+    # Check if the date provided is valid.
+    try:
+        splitted = [int(num) for num in date.split("-")]
+        datetime(splitted[0], splitted[1], splitted[2])
+    except Exception as exc:
+        raise ValueError("The 'date' parameter must be a valid date.") from exc
+
+    return {"date": date, "lat": str(lat), "lon": str(lon), "offset": offset}
+
+
+def _decode_events(request: requests.Response) -> Union[APISunData, APIMoonData]:
+    """Decode an events response, raising an exception if it was unsuccessful."""
+    if not request.ok:
+        raise requests.HTTPError(
+            f"Unsuccessful response received: {request.status_code} {request.reason}.",
+            request=None,
+            response=request,
+        )
+
+    return loads(request.content)
+
+
+class Sunrise(APIClient):
+    """A client for interacting with the Yr Sunrise API."""
+
+    def __init__(
+        self,
+        headers,
+        use_cache=True,
+        object_cache: Optional[ObjectCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        session: Optional[requests.Session] = None,
+        thread_safe: bool = False,
+    ) -> None:
+        header_keys = [key.lower() for key in headers]
+        if "user-agent" not in header_keys:
+            raise ValueError("A custom 'User-Agent' is required in the 'headers' dict.")
 
-        request = self.session.get(
-            url,
-            params={"date": date, "lat": str(lat), "lon": str(lon), "offset": offset},
+        super().__init__(
+            headers,
+            use_cache,
+            object_cache=object_cache,
+            rate_limiter=rate_limiter,
+            retry=retry,
+            session=session,
+            thread_safe=thread_safe,
         )
 
-        if not request.ok:
-            raise requests.HTTPError(
-                f"Unsuccessful response received: {request.status_code} {request.reason}.",
-                request=None,
-                response=request,
-            )
+        self._base_url += "sunrise/3.0/"
+
+    def _get_events(
+        self, event_type: str, build: Callable[[Any], EventsT], **kwargs
+    ) -> EventsT:
+        params = _events_params(**kwargs)
+
+        url = self._base_url + event_type
 
-        return request.json()
+        return self._get(url, params=params, decode=_decode_events, build=build)
 
     def get_sun_events(
         self,
@@ -93,9 +149,9 @@ class Sunrise(APIClient):
         -------
         :class:`.SunEvents`
         """
-        data: APISunData = self._get_events("sun", date=date, lat=lat, lon=lon, offset=offset)  # type: ignore[assignment]
-
-        return SunEvents(data)
+        return self._get_events(
+            "sun", SunEvents, date=date, lat=lat, lon=lon, offset=offset
+        )
 
     def get_moon_events(
         self,
@@ -123,34 +179,13 @@ class Sunrise(APIClient):
         -------
         :class:`.MoonEvents`
         """
-        data: APIMoonData = self._get_events("moon", date=date, lat=lat, lon=lon, offset=offset)  # type: ignore[assignment]
-
-        return MoonEvents(data)
+        return self._get_events(
+            "moon", MoonEvents, date=date, lat=lat, lon=lon, offset=offset
+        )
 
     def _ensure_valid_offset(self, offset: str) -> bool:
         """Ensures that a valid offset is given.
 
         Returns a bool, indicating whether the offset is valid.
         """
-        if not offset.startswith(("+", "-")):
-            return False
-
-        time = offset.replace("+", "").replace("-", "")
-
-        splitted = time.split(":")
-
-        if len(splitted) != 2:
-            return False
-
-        for i in splitted:
-            if len(i) != 2:
-                return False
-            try:
-                int(i)
-            except ValueError:
-                return False
-
-        if int(splitted[0]) < 10 and not splitted[0].startswith("0"):
-            return False
-
-        return True
+        return _is_valid_offset(offset)
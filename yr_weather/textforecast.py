@@ -1,19 +1,111 @@
 """A module with classes for the Textforecast API."""
 
-from typing import Literal, List
+from functools import lru_cache
+from typing import Callable, Literal, List, Optional, Tuple
 from xml.parsers.expat import ExpatError
+import requests
 import xmltodict
 from .client import APIClient
+from .cache import ObjectCache
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
 
 from .data.textforecast import TextForecasts, TextForecastArea
 from .api_types.textforecast import APITextArea
 
+_FORECAST_TYPES = [
+    "landoverview",
+    "coast_en",
+    "coast_no",
+    "sea_en",
+    "sea_no",
+    "sea_wmo",
+]
+_AREA_TYPES = ["land", "sea", "coast"]
+
+
+def _ensure_valid_forecast(forecast: str) -> None:
+    if forecast not in _FORECAST_TYPES:
+        raise ValueError(
+            f"The 'forecast' argument must be one of the following: {', '.join(_FORECAST_TYPES)}."
+        )
+
+
+def _ensure_valid_area_type(area_type: str) -> None:
+    if area_type not in _AREA_TYPES:
+        raise ValueError(
+            f"The 'area_type' argument must be one of the following: {', '.join(_AREA_TYPES)}."
+        )
+
+
+def _parse_xml(text: str) -> dict:
+    """Parse an XML response from the Textforecast API."""
+    try:
+        return xmltodict.parse(text, attr_prefix="", cdata_key="text")
+    except ExpatError as exc:
+        raise RuntimeError(
+            "Parsing XML failed (this could be caused by a bad status code or wrong XML format)."
+        ) from exc
+
+
+def _decode_xml(response: requests.Response) -> dict:
+    """Decode an XML response from the Textforecast API."""
+    return _parse_xml(response.text)
+
+
+@lru_cache(maxsize=None)
+def _forecasts_builder(forecast: str) -> Callable[[dict], TextForecasts]:
+    """A builder of :class:`.TextForecasts` of a forecast type.
+
+    The same builder is returned for the same type, so its results can be cached.
+    """
+
+    def build(parsed: dict) -> TextForecasts:
+        return TextForecasts(parsed["textforecast"], forecast)
+
+    return build
+
+
+def _parse_areas(parsed: dict) -> Tuple[TextForecastArea, ...]:
+    """Convert the parsed response from the areas endpoint into a tuple of areas.
+
+    The areas are immutable, so they can be shared by all callers through the object cache.
+    """
+    raw_areas: List[APITextArea] = parsed["areas"]["area"]
+
+    areas: List[TextForecastArea] = []
+    for area in raw_areas:
+        areas.append(
+            TextForecastArea(
+                id=area["id"], name=area["areaDesc"], polygon=area["polygon"]
+            )
+        )
+
+    return tuple(areas)
+
 
 class Textforecast(APIClient):
     """A client for interacting with the Yr Textforecast API."""
 
-    def __init__(self, headers=None, use_cache=True) -> None:
-        super().__init__(headers, use_cache)
+    def __init__(
+        self,
+        headers=None,
+        use_cache=True,
+        object_cache: Optional[ObjectCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        session: Optional[requests.Session] = None,
+        thread_safe: bool = False,
+    ) -> None:
+        super().__init__(
+            headers,
+            use_cache,
+            object_cache=object_cache,
+            rate_limiter=rate_limiter,
+            retry=retry,
+            session=session,
+            thread_safe=thread_safe,
+        )
 
         self._base_url += "textforecast/2.0/"
 
@@ -35,31 +127,11 @@ class Textforecast(APIClient):
         :class:`.TextForecasts`
             A class with text forecasts for the selected area defined in the forecast parameter.
         """
-        forecast_types = [
-            "landoverview",
-            "coast_en",
-            "coast_no",
-            "sea_en",
-            "sea_no",
-            "sea_wmo",
-        ]
-        if forecast not in forecast_types:
-            raise ValueError(
-                f"The 'forecast' argument must be one of the following: {', '.join(forecast_types)}."
-            )
+        _ensure_valid_forecast(forecast)
 
         url = self._base_url + f"?forecast={forecast}"
 
-        request = self.session.get(url)
-
-        try:
-            parsed = xmltodict.parse(request.text, attr_prefix="", cdata_key="text")
-        except ExpatError as exc:
-            raise RuntimeError(
-                "Parsing XML failed (this could be caused by a bad status code or wrong XML format)."
-            ) from exc
-
-        return TextForecasts(parsed["textforecast"], forecast)
+        return self._get(url, decode=_decode_xml, build=_forecasts_builder(forecast))
 
     def get_areas(
         self, area_type: Literal["land", "sea", "coast"]
@@ -76,31 +148,9 @@ class Textforecast(APIClient):
         list[:class:`TextForecastArea`]
             A list of land, coast or sea areas, their polygons and names.
         """
-        area_types = ["land", "sea", "coast"]
-        if area_type not in area_types:
-            raise ValueError(
-                f"The 'area_type' argument must be one of the following: {', '.join(area_types)}."
-            )
+        _ensure_valid_area_type(area_type)
 
         url = self._base_url + f"areas?type={area_type}"
 
-        request = self.session.get(url)
-
-        try:
-            parsed = xmltodict.parse(request.text, attr_prefix="", cdata_key="text")
-        except ExpatError as exc:
-            raise RuntimeError(
-                "Parsing XML failed (this could be caused by a bad status code or wrong XML format)."
-            ) from exc
-
-        raw_areas: List[APITextArea] = parsed["areas"]["area"]
-
-        areas: List[TextForecastArea] = []
-        for area in raw_areas:
-            areas.append(
-                TextForecastArea(
-                    id=area["id"], name=area["areaDesc"], polygon=area["polygon"]
-                )
-            )
-
-        return areas
+        # A new list of the cached areas, so changing it doesn't change the cache
+        return list(self._get(url, decode=_decode_xml, build=_parse_areas))